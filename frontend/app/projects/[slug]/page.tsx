@@ -1,8 +1,8 @@
 import { notFound } from 'next/navigation';
 import Link from 'next/link';
 import Image from 'next/image';
-import { getProjectBySlug, getProjects } from '@/lib/projects';
-import { getLanguageColor, getFrameworkColor, formatDate, formatRelativeDate } from '@/lib/utils';
+import { getProjectBySlug, getProjects, getReadmeContent } from '@/lib/projects';
+import { assetUrl, getLanguageColor, getFrameworkColor, formatDate, formatRelativeDate } from '@/lib/utils';
 import MarkdownRenderer from '@/components/MarkdownRenderer';
 import ImageGallery from '@/components/ImageGallery';
 
@@ -26,6 +26,8 @@ export default async function ProjectPage({ params }: ProjectPageProps) {
     notFound();
   }
 
+  const readmeContent = await getReadmeContent(project);
+
   return (
     <div className="min-h-screen bg-gray-50">
       <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8 py-16">
@@ -113,15 +115,15 @@ export default async function ProjectPage({ params }: ProjectPageProps) {
         {/* Project Screenshots */}
         {project.assets.screenshots && project.assets.screenshots.length > 0 && (
           <div className="bg-white rounded-lg shadow-sm p-8 mb-8">
-            <ImageGallery images={project.assets.screenshots} title="Screenshots" />
+            <ImageGallery images={project.assets.screenshots.map(assetUrl)} title="Screenshots" />
           </div>
         )}
 
         {/* Project Description */}
-        {project.readme.content && (
+        {readmeContent && (
           <div className="bg-white rounded-lg shadow-sm p-8">
             <h2 className="text-2xl font-bold text-gray-900 mb-6">Project Details</h2>
-            <MarkdownRenderer content={project.readme.content} />
+            <MarkdownRenderer content={readmeContent} />
           </div>
         )}
       </div>
@@ -1,7 +1,7 @@
 import Link from 'next/link';
 import Image from 'next/image';
 import { Project } from '@/types/project';
-import { getLanguageColor, getFrameworkColor, formatRelativeDate, truncateText } from '@/lib/utils';
+import { assetUrl, getLanguageColor, getFrameworkColor, formatRelativeDate, truncateText } from '@/lib/utils';
 
 interface ProjectCardProps {
   project: Project;
@@ -15,7 +15,7 @@ export default function ProjectCard({ project }: ProjectCardProps) {
       {thumbnail && (
         <div className="relative h-48 w-full">
           <img
-            src={thumbnail}
+            src={assetUrl(thumbnail)}
             alt={project.name}
             
             className="object-cover"
@@ -2,13 +2,42 @@ import { Project, ProjectsData } from "@/types/project";
 import { promises as fs } from 'fs';
 import path from 'path';
 
+const DATA_DIR = path.join(process.cwd(), 'public', 'portfolio-data');
+
+// Sharded layout (output.layout: sharded): index.json holds the light fields,
+// projects/<id>.json the rest
+type ProjectIndexEntry = Pick<Project, 'id' | 'slug' | 'name' | 'path' | 'metadata' | 'display'> & {
+  shard: string;
+};
+
+async function readJson(file: string): Promise<any> {
+  const fileContents = await fs.readFile(path.join(DATA_DIR, file), 'utf8');
+  return JSON.parse(fileContents);
+}
+
+async function getProjectIndex(): Promise<ProjectIndexEntry[] | null> {
+  try {
+    return (await readJson('index.json')) as ProjectIndexEntry[];
+  } catch {
+    return null;
+  }
+}
+
+async function loadShard(entry: ProjectIndexEntry): Promise<Project> {
+  const { shard, ...light } = entry;
+  const heavy = await readJson(shard);
+  return { ...light, ...heavy } as Project;
+}
+
 export async function getProjects(): Promise<Project[]> {
   try {
-    // efficient: read directly from filesystem during SSG/SSR
-    const filePath = path.join(process.cwd(), 'public', 'portfolio-data', 'projects.json');
-    const fileContents = await fs.readFile(filePath, 'utf8');
+    const index = await getProjectIndex();
+    if (index) {
+      return await Promise.all(index.map(loadShard));
+    }
 
-    const data: any = JSON.parse(fileContents);
+    // efficient: read directly from filesystem during SSG/SSR
+    const data: any = await readJson('projects.json');
     // Handle both wrapped and raw array formats
     if (Array.isArray(data)) {
       return data as Project[];
@@ -21,10 +50,31 @@ export async function getProjects(): Promise<Project[]> {
 }
 
 export async function getProjectBySlug(slug: string): Promise<Project | undefined> {
+  const index = await getProjectIndex();
+  if (index) {
+    const entry = index.find((p) => p.slug === slug);
+    return entry ? await loadShard(entry) : undefined;
+  }
   const projects = await getProjects();
   return projects.find((p) => p.slug === slug);
 }
 
+// Full README Markdown: inline in the record, or loaded on demand from the
+// content store (output.readme_content: store)
+export async function getReadmeContent(project: Project): Promise<string> {
+  if (project.readme.content) {
+    return project.readme.content;
+  }
+  if (!project.readme.content_path) {
+    return '';
+  }
+  try {
+    return await fs.readFile(path.join(DATA_DIR, project.readme.content_path), 'utf8');
+  } catch {
+    return '';
+  }
+}
+
 export async function getFeaturedProjects(): Promise<Project[]> {
   const projects = await getProjects();
   return projects.filter(p => p.display.featured);
@@ -1,5 +1,14 @@
 import { Project } from "@/types/project";
 
+// Published asset paths are relative to the data directory, which is served
+// from /portfolio-data; absolute URLs are passed through
+export function assetUrl(assetPath: string): string {
+  if (/^(https?:)?\/\//.test(assetPath) || assetPath.startsWith('/')) {
+    return assetPath;
+  }
+  return `/portfolio-data/${assetPath}`;
+}
+
 export function formatDate(dateString: string): string {
   const date = new Date(dateString);
   return date.toLocaleDateString('en-US', {
@@ -6,6 +6,8 @@ export interface Project {
   
   metadata: {
     language: string;
+    // Primary language first, then secondary ones
+    languages?: string[];
     framework: string;
     type: string;
     tags: string[];
@@ -14,18 +16,26 @@ export interface Project {
   readme: {
     exists: boolean;
     path: string;
-    content: string;
+    // Absent when output.readme_content is "store"; see getReadmeContent()
+    content?: string;
+    content_hash?: string;
+    content_path?: string;
     preview: string;
     headings: string[];
     has_demo: boolean;
     demo_url?: string;
+    images?: string[];
     word_count: number;
+    truncated?: boolean;
   };
   
+  // With output.copy_assets these are data-relative paths (assets/<slug>/...);
+  // resolve them with assetUrl()
   assets: {
     screenshots: string[];
     logo?: string;
     thumbnail?: string;
+    images?: ProjectImage[];
   };
   
   git: {
@@ -35,6 +45,8 @@ export interface Project {
     total_commits: number;
     branch?: string;
     is_archived: boolean;
+    // Present when scanner.git_activity is on and git is installed
+    activity?: GitActivity;
   };
   
   stats: {
@@ -45,6 +57,13 @@ export interface Project {
     has_ci: boolean;
     has_docs: boolean;
     documentation_completeness?: number;
+    languages?: Record<string, number>;
+    skipped_files?: number;
+    loc_breakdown?: {
+      code: number;
+      comment: number;
+      blank: number;
+    };
   };
   
   display: {
@@ -104,3 +123,36 @@ export interface AboutData {
   summary: string;
   highlights?: string[];
 }
+
+// Commit activity aggregate (portfolio_ops/git_activity.py)
+export interface GitActivity {
+  head_sha: string;
+  // Monday (YYYY-MM-DD) of the week of the oldest commit
+  start: string | null;
+  // Commits per week from start
+  weekly: number[];
+  // Per week, bitmask of weekdays with commits (bit 0 = Monday)
+  days: number[];
+  commits: number;
+  active_days: number;
+  lines_added: number;
+  lines_deleted: number;
+  contributors: {
+    name: string;
+    email: string;
+    commits: number;
+    added: number;
+    deleted: number;
+  }[];
+}
+
+export interface ProjectImage {
+  source: string;
+  path: string;
+  hash: string;
+  bytes: number;
+  width?: number;
+  height?: number;
+  webp?: string;
+  thumbnail?: string;
+}
@@ -1,5 +1,5 @@
 import MarkdownRenderer from "@/lib/markdown";
-import { getProjectBySlug, getProjectSlugs } from "@/lib/projects";
+import { getProjectBySlug, getProjectSlugs, getReadmeContent } from "@/lib/projects";
 
 export async function generateStaticParams() {
   const slugs = await getProjectSlugs();
@@ -15,6 +15,7 @@ export default async function ProjectPage({ params }) {
   }
 
   const { name, readme, assets, metadata, git, display } = project;
+  const readmeContent = await getReadmeContent(project);
 
   return (
     <div className="max-w-3xl mx-auto p-6 space-y-6">
@@ -27,9 +28,9 @@ export default async function ProjectPage({ params }) {
 
       
 
-      {readme?.content ? (
+      {readmeContent ? (
         <article className="prose dark:prose-invert max-w-none">
-          <MarkdownRenderer content={readme.content} />
+          <MarkdownRenderer content={readmeContent} />
         </article>
       ) : (
         <p className="text-sm text-black/60 dark:text-white/60">No README content available.</p>
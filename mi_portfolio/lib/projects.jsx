@@ -1,31 +1,46 @@
 import fs from "fs";
 import path from "path";
 
-function readFromFsIfAvailable() {
-  const filePath = path.resolve(process.cwd(), "..","portfolio_cli", "portfolio-data", "projects.json");
-  if (fs.existsSync(filePath)) {
-    const raw = fs.readFileSync(filePath, "utf-8");
-    try {
-      return JSON.parse(raw);
-    } catch (_) {
-      return null;
-    }
+const DATA_DIR = path.resolve(process.cwd(), "..", "portfolio_cli", "portfolio-data");
+
+function readJsonFromFs(file) {
+  const filePath = path.join(DATA_DIR, file);
+  if (!fs.existsSync(filePath)) return null;
+  try {
+    return JSON.parse(fs.readFileSync(filePath, "utf-8"));
+  } catch (_) {
+    return null;
   }
-  return null;
 }
 
-async function readViaRoute() {
+async function readJsonViaRoute(file) {
   const base = process.env.NEXT_PUBLIC_SITE_URL || "http://localhost:3000";
-  const res = await fetch(`${base}/portfolio-data/projects.json`, { cache: "no-store" });
+  const res = await fetch(`${base}/portfolio-data/${file}`, { cache: "no-store" });
   if (!res.ok) return null;
-  return await res.json();
+  try {
+    return await res.json();
+  } catch (_) {
+    return null;
+  }
+}
+
+async function readJson(file) {
+  return readJsonFromFs(file) ?? (await readJsonViaRoute(file));
+}
+
+// Sharded layout (output.layout: sharded): index.json holds the light fields,
+// projects/<id>.json the rest
+async function loadShard(entry) {
+  const { shard, ...light } = entry;
+  const heavy = await readJson(shard);
+  return { ...light, ...(heavy || {}) };
 }
 
 async function readProjects() {
-  const fsData = readFromFsIfAvailable();
-  if (fsData) return fsData;
-  const routeData = await readViaRoute();
-  return routeData || [];
+  const index = await readJson("index.json");
+  if (Array.isArray(index)) return Promise.all(index.map(loadShard));
+  const data = await readJson("projects.json");
+  return data || [];
 }
 
 export async function getProjects() {
@@ -34,18 +49,36 @@ export async function getProjects() {
 }
 
 export async function getProjectBySlug(slug) {
+  const index = await readJson("index.json");
+  if (Array.isArray(index)) {
+    const entry = index.find((p) => p.slug === slug);
+    return entry ? await loadShard(entry) : null;
+  }
   const projects = await getProjects();
   return projects.find((p) => p.slug === slug) || null;
 }
 
 export async function getProjectSlugs() {
-  const projects = await getProjects();
+  const index = await readJson("index.json");
+  const projects = Array.isArray(index) ? index : await getProjects();
   return projects.map((p) => p.slug);
 }
 
+// Full README Markdown: inline in the record, or read on demand from the
+// content store (output.readme_content: store)
+export async function getReadmeContent(project) {
+  const readme = project?.readme || {};
+  if (readme.content) return readme.content;
+  if (!readme.content_path) return "";
+  const filePath = path.join(DATA_DIR, readme.content_path);
+  try {
+    return await fs.promises.readFile(filePath, "utf-8");
+  } catch (_) {
+    return "";
+  }
+}
+
 export async function getMeta() {
   const parsed = await readProjects();
   return Array.isArray(parsed) ? {} : parsed?.meta || {};
 }
-
-
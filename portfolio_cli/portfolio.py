@@ -2,22 +2,34 @@
 """
 Portfolio-OPs: Automated Portfolio Generator
 Main CLI entry point
+
+Startup is kept lean for quick commands (``list``, ``show``): the scanner
+and data manager are imported and built on first use, so each command only
+pays for the modules it needs.
 """
 
 import argparse
 import sys
 import json
+import shutil
+import tempfile
 from pathlib import Path
-from datetime import datetime
-from portfolio_ops.scanner import PortfolioScanner
-from portfolio_ops.data_manager import DataManager
+from functools import cached_property
 from portfolio_ops.config import Config
 
 class PortfolioCLI:
     def __init__(self):
         self.config = Config()
-        self.scanner = PortfolioScanner(self.config)
-        self.data_manager = DataManager(self.config)
+        
+    @cached_property
+    def scanner(self):
+        from portfolio_ops.scanner import PortfolioScanner
+        return PortfolioScanner(self.config)
+        
+    @cached_property
+    def data_manager(self):
+        from portfolio_ops.data_manager import DataManager
+        return DataManager(self.config)
         
     def init(self, args):
         """Initialize portfolio-ops in current directory"""
@@ -42,6 +54,8 @@ class PortfolioCLI:
         
     def generate(self, args):
         """Full scan of all projects"""
+        from portfolio_ops.summary import ScanSummary
+        
         print("🔍 Scanning for projects...")
         
         root_path = Path(args.path).expanduser() if args.path else Path(self.config.root_path).expanduser()
@@ -50,54 +64,159 @@ class PortfolioCLI:
             print(f"❌ Error: Directory does not exist: {root_path}")
             sys.exit(1)
             
-        # Perform scan
-        projects = self.scanner.scan(
+        shard = None
+        if args.shard:
+            from portfolio_ops.sharding import parse_shard, shard_dir
+            try:
+                shard = parse_shard(args.shard)
+            except ValueError as e:
+                print(f"❌ Error: {e}")
+                sys.exit(1)
+            # Each shard gets its own data directory; 'merge' combines them
+            self.config.output_dir = str(shard_dir(Path(self.config.output_dir), *shard))
+            
+        self._setup_profiling(args)
+        self.scanner.manifests.update(self.data_manager.load_manifests())
+        
+        # Scan and export in one streaming pass
+        summary = ScanSummary()
+        projects = summary.track(self.scanner.iter_scan(
             root_path,
             max_depth=args.depth or self.config.max_depth,
-            verbose=args.verbose
-        )
-        
-        print(f"\n✓ Found {len(projects)} projects")
+            verbose=args.verbose,
+            workers=args.jobs,
+            shard=shard,
+            history=self.data_manager.load_cache()
+        ))
+        
+        if args.dry_run:
+            for _ in projects:
+                pass
+        else:
+            self.data_manager.export_stream(projects, self.scanner.fingerprints)
+            self.data_manager.save_manifests(self.scanner.manifests.snapshot(self.scanner.fingerprints))
+            
+        print(f"\n✓ Found {summary.total} projects")
+        self._report_profiling(args)
         
-        # Export data
         if not args.dry_run:
-            self.data_manager.export_projects(projects)
-            self.data_manager.save_cache(projects)
-            print(f"✓ Exported to {self.config.output_dir}/projects.json")
+            print(f"✓ Exported to {self.data_manager.export_target}")
+            self._warn_slug_collisions()
             
         # Print summary
-        self._print_summary(projects)
+        self._print_summary(summary)
         
     def update(self, args):
         """Incremental update - only scan changed projects"""
+        from portfolio_ops.summary import ScanSummary
+        
         print("🔄 Updating portfolio (incremental scan)...")
         
         root_path = Path(args.path).expanduser() if args.path else Path(self.config.root_path).expanduser()
         
         # Load cache
         cache = self.data_manager.load_cache()
+        self.scanner.manifests.update(self.data_manager.load_manifests())
+        self._setup_profiling(args)
         
-        # Perform incremental scan
-        projects = self.scanner.incremental_scan(
+        # Incremental scan and export in one streaming pass
+        summary = ScanSummary()
+        projects = summary.track(self.scanner.iter_incremental_scan(
             root_path,
             cache,
-            verbose=args.verbose
-        )
+            verbose=args.verbose,
+            workers=args.jobs
+        ))
+        self.data_manager.export_stream(projects, self.scanner.fingerprints)
+        self.data_manager.save_manifests(self.scanner.manifests.snapshot(self.scanner.fingerprints))
+        
+        print(f"\n✓ Processed {summary.total} projects")
+        self._report_profiling(args)
+        
+        print(f"✓ Updated {self.data_manager.export_target}")
+        self._warn_slug_collisions()
+        
+    def merge(self, args):
+        """Merge 'generate --shard' outputs into the data directory"""
+        import copy
+        from portfolio_ops.data_manager import DataManager
+        from portfolio_ops.manifest_cache import ManifestCache
+        from portfolio_ops.sharding import find_shard_dirs, merge_projects
+        
+        try:
+            sources = [Path(d).expanduser() for d in args.dirs] or find_shard_dirs(Path(self.config.output_dir))
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        if not sources:
+            print("No shard outputs found. Run 'generate --shard i/N' first.")
+            return
+            
+        shards = []
+        manifests = {}
+        for source in sources:
+            if not source.is_dir():
+                print(f"❌ Error: Directory does not exist: {source}")
+                sys.exit(1)
+            config = copy.copy(self.config)
+            config.output_dir = str(source)
+            shard_data = DataManager(config)
+            projects = shard_data.load_projects()
+            print(f"  {source}: {len(projects)} projects")
+            shards.append((projects, shard_data.load_cache()))
+            manifests.update(shard_data.load_manifests())
+            self.data_manager.adopt_files(source)
+            
+        projects, fingerprints, conflicts = merge_projects(shards)
+        self.data_manager.export_stream(projects, fingerprints, publish=False)
+        self.data_manager.save_manifests(ManifestCache(manifests).snapshot(p["path"] for p in projects))
         
-        print(f"\n✓ Processed {len(projects)} projects")
+        print(f"\n✓ Merged {len(projects)} projects from {len(sources)} shards ({conflicts} duplicates resolved)")
+        print(f"✓ Exported to {self.data_manager.export_target}")
+        self._warn_slug_collisions()
         
-        # Export data
-        self.data_manager.export_projects(projects)
-        self.data_manager.save_cache(projects)
+    def wrapped(self, args):
+        """Portfolio-wide year in review from the commit-date index"""
+        from datetime import date
+        from portfolio_ops.wrapped import CommitIndex, compute_wrapped, format_wrapped
         
-        print(f"✓ Updated {self.config.output_dir}/projects.json")
+        projects_data = self.data_manager.load_projects()
+        if not projects_data:
+            print("No projects found. Run 'generate' first.")
+            return
+            
+        # Only projects whose HEAD moved since the last run are read from git
+        index = CommitIndex(self.data_manager.load_commit_index())
+        refreshed, failed = index.refresh(projects_data, workers=args.jobs or self.config.workers)
+        self.data_manager.save_commit_index(index.entries)
+        if refreshed:
+            print(f"✓ Indexed commit history of {refreshed} projects")
+        if failed:
+            names = {p.get("id"): p.get("name") for p in projects_data}
+            print(f"⚠️  Could not read the commit history of {len(failed)} projects "
+                  f"(previous numbers kept): {', '.join(names.get(pid) or pid for pid in failed)}")
+            
+        stats = compute_wrapped(index, projects_data, args.year or date.today().year)
+        print(f"\n{format_wrapped(stats)}")
         
+        if args.output:
+            Path(args.output).write_text(json.dumps(stats, indent=2), encoding="utf-8")
+            print(f"\n✓ Results written to {args.output}")
+            
     def list_projects(self, args):
-        """List all detected projects"""
-        projects_data = self.data_manager.load_projects()
+        """List detected projects, optionally filtered and sorted"""
+        filters = {
+            'language': args.language,
+            'category': args.category,
+            'featured': True if args.featured else None,
+        }
+        projects_data = self.data_manager.query(sort=args.sort, limit=args.limit, **filters)
         
         if not projects_data:
-            print("No projects found. Run 'generate' first.")
+            if any(v is not None for v in filters.values()):
+                print("No projects match these filters.")
+            else:
+                print("No projects found. Run 'generate' first.")
             return
             
         print(f"\n📁 Found {len(projects_data)} projects:\n")
@@ -114,14 +233,8 @@ class PortfolioCLI:
             
     def show(self, args):
         """Show detailed info about a specific project"""
-        projects_data = self.data_manager.load_projects()
-        
-        # Find project by name or slug
-        project = None
-        for p in projects_data:
-            if p['name'].lower() == args.name.lower() or p['slug'] == args.name:
-                project = p
-                break
+        # Find project by name, slug, id or path
+        project = self.data_manager.find_project(args.name)
                 
         if not project:
             print(f"❌ Project not found: {args.name}")
@@ -150,32 +263,131 @@ class PortfolioCLI:
             
         print(f"\nPath: {project['path']}")
         
+        if args.readme and project.get('readme', {}).get('exists'):
+            # Full text is loaded on demand (it may live in the content store)
+            print(f"\n{'-'*60}\n")
+            print(self.data_manager.load_readme(project))
+        
     def feature(self, args):
         """Mark a project as featured"""
-        projects_data = self.data_manager.load_projects()
+        project = self.data_manager.find_project(args.name)
         
-        for project in projects_data:
-            if project['name'].lower() == args.name.lower():
-                project['display']['featured'] = True
-                self.data_manager.save_projects(projects_data)
-                print(f"⭐ Featured: {project['name']}")
-                return
+        if project:
+            project['display']['featured'] = True
+            self.data_manager.save_project(project)
+            print(f"⭐ Featured: {project['name']}")
+            return
                 
         print(f"❌ Project not found: {args.name}")
         
     def categorize(self, args):
         """Set project category"""
-        projects_data = self.data_manager.load_projects()
+        project = self.data_manager.find_project(args.name)
         
-        for project in projects_data:
-            if project['name'].lower() == args.name.lower():
-                project['display']['category'] = args.category
-                self.data_manager.save_projects(projects_data)
-                print(f"✓ Categorized '{project['name']}' as '{args.category}'")
-                return
+        if project:
+            project['display']['category'] = args.category
+            self.data_manager.save_project(project)
+            print(f"✓ Categorized '{project['name']}' as '{args.category}'")
+            return
                 
         print(f"❌ Project not found: {args.name}")
         
+    def apply(self, args):
+        """Apply a batch of display edits in one load/save cycle"""
+        from portfolio_ops.curation import EditError, apply_edits, describe, load_edits
+        
+        edit_file = Path(args.file)
+        if not edit_file.exists():
+            print(f"❌ Error: Edit file does not exist: {edit_file}")
+            sys.exit(1)
+            
+        try:
+            edits = load_edits(edit_file)
+        except (EditError, ValueError) as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+            
+        projects_data = self.data_manager.load_projects()
+        if not projects_data:
+            print("No projects found. Run 'generate' first.")
+            return
+            
+        changed, unmatched = apply_edits(projects_data, edits)
+        
+        if changed and not args.dry_run:
+            self.data_manager.save_projects(projects_data, changed, edited=True)
+            
+        verb = "Would update" if args.dry_run else "Updated"
+        print(f"✓ {verb} {len(changed)} projects from {len(edits)} edits")
+        for edit in unmatched:
+            print(f"⚠️  No project matched {describe(edit)}")
+            
+    def watch(self, args):
+        """Keep portfolio data up to date as projects change"""
+        from portfolio_ops.watcher import PortfolioWatcher
+        
+        root_path = Path(args.path).expanduser() if args.path else Path(self.config.root_path).expanduser()
+        
+        if not root_path.exists():
+            print(f"❌ Error: Path does not exist: {root_path}")
+            sys.exit(1)
+            
+        watcher = PortfolioWatcher(
+            self.scanner,
+            self.data_manager,
+            root_path,
+            self.config.max_depth,
+            debounce=args.debounce if args.debounce is not None else self.config.watch_debounce,
+            max_delay=self.config.watch_max_delay,
+            poll=args.poll,
+            poll_interval=args.interval if args.interval is not None else self.config.watch_poll_interval,
+            verbose=args.verbose
+        )
+        watcher.run()
+        
+    def bench(self, args):
+        """Benchmark scanning and export on a synthetic workspace"""
+        from portfolio_ops.bench import format_report, generate_workspace, run_benchmark
+        
+        if args.workspace and Path(args.workspace).expanduser().exists():
+            root_path = Path(args.workspace).expanduser()
+            workspace = {"path": str(root_path), "generated": False}
+            temp_dir = None
+        else:
+            temp_dir = None if args.workspace else tempfile.mkdtemp(prefix="portfolio-bench-ws-")
+            root_path = Path(args.workspace).expanduser() if args.workspace else Path(temp_dir)
+            print(f"🏗  Generating {args.projects} synthetic projects in {root_path}...")
+            workspace = generate_workspace(
+                root_path,
+                projects=args.projects,
+                depth=args.depth,
+                junk_files=args.junk_files,
+                commits=args.commits,
+                readme_kb=args.readme_kb,
+                seed=args.seed
+            )
+            workspace.update({"path": str(root_path), "generated": True})
+            
+        try:
+            print(f"⏱  Running benchmark ({args.repeat} runs each)...")
+            report = run_benchmark(
+                self.config,
+                root_path,
+                repeat=args.repeat,
+                workers=args.jobs,
+                touch=workspace["generated"]
+            )
+        finally:
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                
+        report["workspace"] = workspace
+        print(f"\n{format_report(report)}")
+        
+        if args.output:
+            Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+            print(f"\n✓ Results written to {args.output}")
+            
     def clean(self, args):
         """Clean cache and temporary files"""
         cache_file = Path(self.config.output_dir) / "cache.json"
@@ -184,34 +396,42 @@ class PortfolioCLI:
             print("✓ Cleared cache")
         print("✓ Clean complete")
         
-    def _print_summary(self, projects):
-        """Print scan summary"""
+    def _setup_profiling(self, args):
+        """Enable per-stage instrumentation for --profile / --trace"""
+        if args.profile or args.trace:
+            self.scanner.enable_profiling()
+            
+    def _report_profiling(self, args):
+        """Print the slowest projects/stages and write the trace file"""
+        profile = self.scanner.profile
+        if profile is None:
+            return
+        if args.profile:
+            print(f"\n{profile.report()}")
+        if args.trace:
+            profile.write_trace(args.trace)
+            print(f"✓ Trace written to {args.trace} (open in chrome://tracing or Perfetto)")
+            
+    def _warn_slug_collisions(self):
+        """Report projects that ended up with the same slug"""
+        for slug, ids in self.data_manager.slug_collisions().items():
+            print(f"⚠️  Slug collision: '{slug}' is shared by {len(ids)} projects ({', '.join(ids)})")
+            
+    def _print_summary(self, summary):
+        """Print scan summary (totals gathered while the scan streamed)"""
         print("\n" + "="*50)
         print("SUMMARY")
         print("="*50)
         
-        # Count by language
-        languages = {}
-        types = {}
-        featured_count = 0
-        
-        for p in projects:
-            lang = p['metadata']['language']
-            proj_type = p['metadata']['type']
-            languages[lang] = languages.get(lang, 0) + 1
-            types[proj_type] = types.get(proj_type, 0) + 1
-            if p['display'].get('featured'):
-                featured_count += 1
-                
-        print(f"\nTotal Projects: {len(projects)}")
-        print(f"Featured: {featured_count}")
+        print(f"\nTotal Projects: {summary.total}")
+        print(f"Featured: {summary.featured}")
         
         print("\nBy Language:")
-        for lang, count in sorted(languages.items(), key=lambda x: -x[1]):
+        for lang, count in sorted(summary.languages.items(), key=lambda x: -x[1]):
             print(f"  {lang}: {count}")
             
         print("\nBy Type:")
-        for ptype, count in sorted(types.items(), key=lambda x: -x[1]):
+        for ptype, count in sorted(summary.types.items(), key=lambda x: -x[1]):
             print(f"  {ptype}: {count}")
 
 def main():
@@ -222,10 +442,14 @@ def main():
 Examples:
   python3 portfolio.py init                    # First-time setup
   python3 portfolio.py generate                # Full scan
+  python3 portfolio.py generate --jobs 8       # Full scan with 8 workers
   python3 portfolio.py update                  # Quick update
   python3 portfolio.py list                    # List all projects
   python3 portfolio.py show my-project         # Show project details
   python3 portfolio.py feature awesome-app     # Mark as featured
+  python3 portfolio.py apply curation.yaml     # Apply many display edits at once
+  python3 portfolio.py watch                   # Refresh projects as they change
+  python3 portfolio.py bench -o bench.json     # Benchmark on a synthetic workspace
         """
     )
     
@@ -240,18 +464,41 @@ Examples:
     generate_parser.add_argument('--depth', type=int, help='Max scan depth')
     generate_parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     generate_parser.add_argument('--dry-run', action='store_true', help='Preview without saving')
+    generate_parser.add_argument('--jobs', '-j', type=int, help='Number of parallel detection workers')
+    generate_parser.add_argument('--profile', action='store_true', help='Report the slowest projects and stages')
+    generate_parser.add_argument('--trace', metavar='FILE', help='Write per-stage spans as a Chrome trace file')
+    generate_parser.add_argument('--shard', metavar='i/N', help='Scan only shard i of N (written to <data_dir>/shards/i-of-N)')
+    
+    # Merge command
+    merge_parser = subparsers.add_parser('merge', help='Merge generate --shard outputs')
+    merge_parser.add_argument('dirs', nargs='*', help='Shard data directories (default: the newest complete <data_dir>/shards/i-of-N set)')
     
     # Update command
     update_parser = subparsers.add_parser('update', help='Incremental update')
     update_parser.add_argument('--path', help='Root path to scan')
     update_parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    update_parser.add_argument('--jobs', '-j', type=int, help='Number of parallel detection workers')
+    update_parser.add_argument('--profile', action='store_true', help='Report the slowest projects and stages')
+    update_parser.add_argument('--trace', metavar='FILE', help='Write per-stage spans as a Chrome trace file')
+    
+    # Wrapped command
+    wrapped_parser = subparsers.add_parser('wrapped', help='Year in review across all projects')
+    wrapped_parser.add_argument('--year', type=int, help='Year to summarize (default: current year)')
+    wrapped_parser.add_argument('--jobs', '-j', type=int, help='Parallel git readers when indexing')
+    wrapped_parser.add_argument('--output', '-o', help='Write JSON results to this file')
     
     # List command
-    subparsers.add_parser('list', help='List all projects')
+    list_parser = subparsers.add_parser('list', help='List all projects')
+    list_parser.add_argument('--language', help='Only projects using this language (primary or secondary)')
+    list_parser.add_argument('--category', help='Only projects in this category')
+    list_parser.add_argument('--featured', action='store_true', help='Only featured projects')
+    list_parser.add_argument('--sort', choices=['name', 'date', 'commits', 'priority'], help='Sort order (default: export order)')
+    list_parser.add_argument('--limit', type=int, help='Show at most this many projects')
     
     # Show command
     show_parser = subparsers.add_parser('show', help='Show project details')
-    show_parser.add_argument('name', help='Project name or slug')
+    show_parser.add_argument('name', help='Project name, slug, id or path')
+    show_parser.add_argument('--readme', action='store_true', help='Print the full README')
     
     # Feature command
     feature_parser = subparsers.add_parser('feature', help='Mark project as featured')
@@ -262,6 +509,32 @@ Examples:
     cat_parser.add_argument('name', help='Project name')
     cat_parser.add_argument('category', help='Category name')
     
+    # Apply command
+    apply_parser = subparsers.add_parser('apply', help='Apply a batch of display edits (YAML/JSON/CSV)')
+    apply_parser.add_argument('file', help='Edit list file')
+    apply_parser.add_argument('--dry-run', action='store_true', help='Report changes without saving')
+    
+    # Watch command
+    watch_parser = subparsers.add_parser('watch', help='Watch projects and refresh them as they change')
+    watch_parser.add_argument('--path', help='Root path to watch')
+    watch_parser.add_argument('--debounce', type=float, help='Seconds of quiet before refreshing')
+    watch_parser.add_argument('--poll', action='store_true', help='Poll instead of using inotify')
+    watch_parser.add_argument('--interval', type=float, help='Polling interval in seconds')
+    watch_parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    
+    # Bench command
+    bench_parser = subparsers.add_parser('bench', help='Benchmark scanning on a synthetic workspace')
+    bench_parser.add_argument('--workspace', help='Existing workspace to scan, or where to generate one (default: temp dir)')
+    bench_parser.add_argument('--projects', type=int, default=50, help='Number of synthetic projects')
+    bench_parser.add_argument('--depth', type=int, default=2, help='Nesting depth of synthetic projects')
+    bench_parser.add_argument('--commits', type=int, default=20, help='Git commits per project')
+    bench_parser.add_argument('--junk-files', type=int, default=200, help='Files in each node_modules')
+    bench_parser.add_argument('--readme-kb', type=int, default=16, help='README size in KiB')
+    bench_parser.add_argument('--seed', type=int, default=0, help='Random seed for the workspace')
+    bench_parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement')
+    bench_parser.add_argument('--jobs', '-j', type=int, help='Number of parallel detection workers')
+    bench_parser.add_argument('--output', '-o', help='Write JSON results to this file')
+    
     # Clean command
     subparsers.add_parser('clean', help='Clean cache')
     
@@ -278,10 +551,15 @@ Examples:
         'init': cli.init,
         'generate': cli.generate,
         'update': cli.update,
+        'merge': cli.merge,
+        'wrapped': cli.wrapped,
         'list': cli.list_projects,
         'show': cli.show,
         'feature': cli.feature,
         'categorize': cli.categorize,
+        'apply': cli.apply,
+        'watch': cli.watch,
+        'bench': cli.bench,
         'clean': cli.clean,
     }
     
@@ -1,23 +1,54 @@
 """
 Asset discovery utilities.
 
-Currently returns discovered asset paths in-place. Copying into the output
-assets directory can be added later once slug/path conventions are finalized.
+Screenshots are looked up under the configured screenshot directories
+(``output.screenshot_dirs``) with a lazy, bounded walk: ignored directories
+are pruned, the walk stops MAX_DEPTH levels down and after MAX_CANDIDATES
+images, and each file is stat'ed at most once. Candidates are then ranked
+by cheap signals (file name, dimensions from the image header, size), so
+the best screenshot comes first. Paths returned are the source files; the
+asset pipeline publishes them into the data directory.
 """
 
 from __future__ import annotations
 
+import os
+import struct
 from pathlib import Path
-from typing import Dict, List
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .profiling import note_stat
 
 
 IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg"}
+SCREENSHOT_DIRS = ["screenshots", "docs/images", "assets", ".github/images"]
+LOGO_NAMES = ["logo.png", "logo.jpg", "logo.jpeg", "icon.png", "icon.svg", "logo.svg"]
+
+MAX_SCREENSHOTS = 20
+MAX_CANDIDATES = 200
+MAX_DEPTH = 3
+
+# Name hints, best first; images below MIN_DIMENSION are icons/sprites
+SCREENSHOT_HINTS = ("screenshot", "screen", "preview", "demo", "showcase")
+MIN_DIMENSION = 200
+
+_HEADER_BYTES = 64 * 1024
 
 
 class AssetFinder:
-    def find_assets(self, directory: Path, output_dir: str) -> Dict:
+    def __init__(self, screenshot_dirs: Optional[Iterable[str]] = None,
+                 ignore_dirs: Iterable[str] = (), max_depth: int = MAX_DEPTH,
+                 limit: int = MAX_SCREENSHOTS, max_candidates: int = MAX_CANDIDATES) -> None:
+        self.screenshot_dirs = [d.strip("/") for d in (screenshot_dirs or SCREENSHOT_DIRS)]
+        self.ignore_dirs = set(ignore_dirs)
+        self.max_depth = max_depth
+        self.limit = limit
+        self.max_candidates = max_candidates
+
+    def find_assets(self, directory: Path, output_dir: str,
+                    files: Optional[AbstractSet[str]] = None) -> Dict:
         screenshots = self.find_screenshots(directory)
-        logo = self.find_logo(directory)
+        logo = self.find_logo(directory, files)
         thumbnail = self._choose_thumbnail(screenshots, logo)
         return {
             "screenshots": screenshots,
@@ -26,30 +57,146 @@ class AssetFinder:
         }
 
     def find_screenshots(self, directory: Path) -> List[str]:
-        candidates = [
-            directory / "screenshots",
-            directory / "docs" / "images",
-            directory / "assets",
-            directory / ".github" / "images",
-        ]
-        found: List[str] = []
-        for base in candidates:
-            if base.exists() and base.is_dir():
-                for p in base.rglob("*"):
-                    if p.is_file() and p.suffix.lower() in IMAGE_EXTS:
-                        found.append(str(p))
-        return found[:20]
-
-    def find_logo(self, directory: Path) -> str | None:
-        for name in ["logo.png", "logo.jpg", "logo.jpeg", "icon.png", "icon.svg", "logo.svg"]:
+        """Best ``limit`` images under the screenshot dirs, best first."""
+        seen = set()
+        candidates = []
+        for rel in self.screenshot_dirs:
+            for path, size in self.iter_images(directory / rel):
+                if path in seen:
+                    continue
+                seen.add(path)
+                candidates.append((self._score(path, size), path))
+                if len(candidates) >= self.max_candidates:
+                    break
+            if len(candidates) >= self.max_candidates:
+                break
+        # Stable sort: equal scores keep discovery order
+        candidates.sort(key=lambda c: -c[0])
+        return [path for _, path in candidates[:self.limit]]
+
+    def iter_images(self, base: Path) -> Iterator[Tuple[str, int]]:
+        """Yield (path, size) of images below ``base``, lazily and depth-bounded.
+
+        Directories are visited in sorted order; ignored directories are
+        never entered.
+        """
+        stack = [(str(base), 0)]
+        while stack:
+            path, depth = stack.pop()
+            try:
+                with os.scandir(path) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if depth < self.max_depth and entry.name not in self.ignore_dirs:
+                            subdirs.append((entry.path, depth + 1))
+                        continue
+                    if os.path.splitext(entry.name)[1].lower() not in IMAGE_EXTS or not entry.is_file():
+                        continue
+                    note_stat()
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+                yield entry.path, size
+            stack.extend(reversed(subdirs))
+
+    def find_logo(self, directory: Path, files: Optional[AbstractSet[str]] = None) -> str | None:
+        for name in LOGO_NAMES:
+            if files is not None:
+                if name in files:
+                    return str(directory / name)
+                continue
             p = directory / name
             if p.exists():
                 return str(p)
         return None
 
+    # ----- Internal helpers -----
     def _choose_thumbnail(self, screenshots: List[str], logo: str | None) -> str | None:
         if logo:
             return logo
         return screenshots[0] if screenshots else None
 
+    def _score(self, path: str, size: int) -> float:
+        name = os.path.basename(path).lower()
+        score = 0.0
+        for rank, hint in enumerate(SCREENSHOT_HINTS):
+            if hint in name:
+                score += 100 - rank * 10
+                break
+        if any(word in name for word in ("icon", "favicon", "sprite", "badge")):
+            score -= 50
+
+        dims = read_image_size(path)
+        if dims:
+            width, height = dims
+            if min(width, height) < MIN_DIMENSION:
+                score -= 40
+            elif 1.0 <= width / height <= 2.5:
+                # Landscape, page- or window-shaped: the typical screenshot
+                score += 30
+            else:
+                score += 10
+        # Larger files are more likely real screenshots; capped so a name
+        # hint or good dimensions always win
+        return score + min(size / (100 * 1024), 5)
+
+
+def read_image_size(path: str) -> Optional[Tuple[int, int]]:
+    """(width, height) from a PNG, GIF, JPEG or WebP header; None if unknown.
+
+    Only the first bytes of the file are read; the image is not decoded.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(32)
+            if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR":
+                return struct.unpack(">II", head[16:24])
+            if head[:6] in (b"GIF87a", b"GIF89a"):
+                return struct.unpack("<HH", head[6:10])
+            if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+                return _webp_size(head)
+            if head[:2] == b"\xff\xd8":
+                return _jpeg_size(head + f.read(_HEADER_BYTES))
+    except (OSError, struct.error):
+        return None
+    return None
+
+
+def _webp_size(head: bytes) -> Optional[Tuple[int, int]]:
+    chunk = head[12:16]
+    if chunk == b"VP8 " and head[23:26] == b"\x9d\x01\x2a":
+        # Lossy: frame header follows the 3-byte start code
+        return None if len(head) < 30 else (
+            struct.unpack("<H", head[26:28])[0] & 0x3FFF,
+            struct.unpack("<H", head[28:30])[0] & 0x3FFF,
+        )
+    if chunk == b"VP8L" and head[20:21] == b"\x2f":
+        bits = int.from_bytes(head[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        return int.from_bytes(head[24:27], "little") + 1, int.from_bytes(head[27:30], "little") + 1
+    return None
+
 
+def _jpeg_size(data: bytes) -> Optional[Tuple[int, int]]:
+    # Walk the marker segments up to the first start-of-frame
+    pos = 2
+    while pos + 9 < len(data):
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        length = struct.unpack(">H", data[pos + 2:pos + 4])[0]
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack(">HH", data[pos + 5:pos + 9])
+            return width, height
+        pos += 2 + length
+    return None
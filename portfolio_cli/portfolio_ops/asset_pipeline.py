@@ -0,0 +1,337 @@
+"""
+Publishes project images into the data directory.
+
+With ``output.copy_assets`` enabled, every screenshot and logo found by
+AssetFinder is content-hashed and copied to ``assets/<slug>/<hash>.<ext>``.
+The record's ``screenshots`` / ``logo`` / ``thumbnail`` then point at those
+data-relative paths, and ``images`` lists each published file with its
+source, so a published record can go through the pipeline again.
+
+- Identical files are stored once: a second copy (same hash, another
+  project) is a hard link to the first.
+- Sources are re-hashed only when their (size, mtime_ns) change
+  (``assets/.manifest.json``). An output that already exists under its
+  hash is never rewritten.
+- With Pillow installed (optional), raster images also get a WebP variant
+  (at most MAX_DIMENSION px) and a ``.thumb.webp`` thumbnail. Files over
+  ``output.max_asset_size_mb`` ship only as their downscaled WebP, or are
+  dropped without Pillow.
+- Projects are processed on a thread pool (``output.asset_workers``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import stat
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from .asset_finder import read_image_size
+from .pipeline import make_executor, ordered_map
+from .serialization import atomic_write, link_or_copy
+
+try:
+    from PIL import Image  # type: ignore
+except Exception:  # pragma: no cover
+    Image = None  # type: ignore
+
+
+ASSETS_DIR = "assets"
+MANIFEST_NAME = ".manifest.json"
+
+# GIFs keep their animation and SVGs are vector: both are only copied
+RASTER_EXTS = {".png", ".jpg", ".jpeg", ".webp"}
+MAX_DIMENSION = 1920
+THUMBNAIL_SIZE = (480, 320)
+WEBP_QUALITY = 80
+
+_HASH_LEN = 16
+_PUBLISHED = re.compile(r"^[0-9a-f]{16}(\.thumb)?\.\w+$")
+
+
+class AssetPipeline:
+    def __init__(self, output_dir: Path, max_size_mb: float = 5, workers: int = 4) -> None:
+        self.output_dir = output_dir
+        self.root = output_dir / ASSETS_DIR
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.workers = max(1, workers)
+        self.stats = {"copied": 0, "linked": 0, "unchanged": 0, "variants": 0, "skipped": 0}
+
+        # {"sources": {path: {size, mtime_ns, hash, width, height}}, "files": {hash: first published path}}
+        self._manifest: Optional[Dict[str, Dict[str, Any]]] = None
+        self._seen: set = set()
+        self._lock = threading.Lock()
+
+    def process(self, projects: Iterable[Dict[str, Any]], referenced: set) -> Iterator[Dict[str, Any]]:
+        """Publish the assets of each project; yields the rewritten records in input order.
+
+        Every published path still in use is added to ``referenced``.
+        """
+        self._load_manifest()
+        with make_executor(self.workers, "thread") as executor:
+            yield from self.referenced(ordered_map(executor, self.publish, projects, self.workers * 2),
+                                       referenced)
+
+        # Forget sources no project points at any more
+        sources = self._manifest["sources"]
+        for key in set(sources) - self._seen:
+            del sources[key]
+        self._save_manifest()
+
+    def publish(self, project: Dict[str, Any]) -> Dict[str, Any]:
+        """Return ``project`` with its assets copied and pointing at the published files."""
+        assets = project.get("assets")
+        if not assets:
+            return project
+        slug = project.get("slug") or project.get("id") or "project"
+
+        # Paths already published by an earlier run map back to their source
+        known: Dict[str, Dict[str, Any]] = {}
+        for image in assets.get("images", []):
+            for key in ("path", "webp", "thumbnail"):
+                if image.get(key):
+                    known[image[key]] = image
+
+        images = []
+        by_source: Dict[str, Optional[Dict[str, Any]]] = {}
+
+        def publish_one(value: Optional[str]) -> Optional[Dict[str, Any]]:
+            if not value:
+                return None
+            source = known[value]["source"] if value in known else value
+            if source not in by_source:
+                by_source[source] = self._publish_file(Path(source), slug)
+                if by_source[source]:
+                    images.append(by_source[source])
+            return by_source[source]
+
+        screenshots = [image for image in map(publish_one, assets.get("screenshots", [])) if image]
+        logo = publish_one(assets.get("logo"))
+        thumbnail = publish_one(assets.get("thumbnail"))
+
+        published = dict(assets)
+        published.update({
+            "screenshots": [image["path"] for image in screenshots],
+            "logo": logo["path"] if logo else None,
+            "thumbnail": (thumbnail["thumbnail"] or thumbnail["path"]) if thumbnail else None,
+            "images": images,
+        })
+        return {**project, "assets": published}
+
+    def referenced(self, projects: Iterable[Dict[str, Any]], referenced: set) -> Iterator[Dict[str, Any]]:
+        """Yield already published ``projects``, adding the paths they use to ``referenced``."""
+        for proj in projects:
+            for image in (proj.get("assets") or {}).get("images", []):
+                referenced.update(p for p in (image["path"], image["webp"], image["thumbnail"]) if p)
+            yield proj
+
+    def adopt(self, source_dir: Path) -> int:
+        """Link in the files another data directory published and merge its manifest.
+
+        Published names are content hashes, so files of the same name are
+        the same image; returns the number of files added.
+        """
+        if self._manifest is None:
+            self._load_manifest()
+        added = 0
+        source_root = source_dir / ASSETS_DIR
+        if not source_root.is_dir():
+            return added
+        for slug_dir in source_root.iterdir():
+            if not slug_dir.is_dir():
+                continue
+            for path in slug_dir.iterdir():
+                if _PUBLISHED.match(path.name):
+                    added += link_or_copy(path, self.root / slug_dir.name / path.name)
+
+        try:
+            data = json.loads((source_root / MANIFEST_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = None
+        if isinstance(data, dict):
+            for key in ("sources", "files"):
+                for name, value in (data.get(key) or {}).items():
+                    self._manifest[key].setdefault(name, value)
+            self._save_manifest()
+        return added
+
+    def prune(self, keep: Iterable[str]) -> int:
+        """Delete published files not in ``keep`` (data-relative paths); returns the count."""
+        keep = set(keep)
+        removed = 0
+        if not self.root.is_dir():
+            return removed
+        for slug_dir in self.root.iterdir():
+            if not slug_dir.is_dir():
+                continue
+            before = removed
+            for path in slug_dir.iterdir():
+                if _PUBLISHED.match(path.name) and f"{ASSETS_DIR}/{slug_dir.name}/{path.name}" not in keep:
+                    path.unlink()
+                    removed += 1
+            if removed > before and not any(slug_dir.iterdir()):
+                slug_dir.rmdir()
+
+        if self._manifest is not None:
+            files = self._manifest["files"]
+            for digest, rel in list(files.items()):
+                if rel not in keep:
+                    del files[digest]
+            self._save_manifest()
+        return removed
+
+    # ----- Internal helpers -----
+    def _publish_file(self, source: Path, slug: str) -> Optional[Dict[str, Any]]:
+        try:
+            st = source.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+
+        meta = self._source_meta(source, st)
+        ext = source.suffix.lower()
+        base = f"{ASSETS_DIR}/{slug}/{meta['hash'][:_HASH_LEN]}"
+        raster = Image is not None and ext in RASTER_EXTS
+        oversized = st.st_size > self.max_bytes
+        if oversized and not raster:
+            self._count("skipped")
+            return None
+
+        image = {
+            "source": str(source),
+            "path": base + ext,
+            "hash": meta["hash"],
+            "bytes": st.st_size,
+            "width": meta.get("width"),
+            "height": meta.get("height"),
+            "webp": None,
+            "thumbnail": None,
+        }
+        if not oversized:
+            self._place(source, image["path"], meta["hash"])
+        if raster:
+            self._make_variants(source, base, ext, oversized, meta, image)
+            if oversized:
+                # Too large to ship as is: the downscaled WebP stands in for it
+                image["path"] = image["webp"]
+                if not image["path"]:
+                    return None
+        return image
+
+    def _source_meta(self, source: Path, st: os.stat_result) -> Dict[str, Any]:
+        """Manifest entry for ``source``, re-hashing it only if its size or mtime changed."""
+        key = str(source)
+        with self._lock:
+            self._seen.add(key)
+        meta = self._manifest["sources"].get(key) if self._manifest is not None else None
+        if not (meta and meta.get("size") == st.st_size and meta.get("mtime_ns") == st.st_mtime_ns):
+            h = hashlib.sha256()
+            with open(source, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    h.update(chunk)
+            meta = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": h.hexdigest()}
+        if "width" not in meta:
+            meta["width"], meta["height"] = read_image_size(str(source)) or (None, None)
+        if self._manifest is not None:
+            with self._lock:
+                self._manifest["sources"][key] = meta
+        return meta
+
+    def _place(self, source: Path, rel: str, digest: str) -> None:
+        dest = self.output_dir / rel
+        if dest.exists():
+            self._count("unchanged")
+            return
+        dest.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._lock:
+            first = self._manifest["files"].get(digest) if self._manifest is not None else None
+        if first and first != rel:
+            try:
+                os.link(self.output_dir / first, dest)
+                self._count("linked")
+                return
+            except FileExistsError:
+                self._count("unchanged")
+                return
+            except OSError:
+                pass
+
+        tmp = dest.with_name(f".{dest.name}.{threading.get_ident()}.tmp")
+        try:
+            shutil.copyfile(source, tmp)
+            os.replace(tmp, dest)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        self._count("copied")
+        if self._manifest is not None:
+            with self._lock:
+                self._manifest["files"].setdefault(digest, rel)
+
+    def _make_variants(self, source: Path, base: str, ext: str, oversized: bool,
+                       meta: Dict[str, Any], image: Dict[str, Any]) -> None:
+        targets = {"thumbnail": (base + ".thumb.webp", THUMBNAIL_SIZE)}
+        if ext == ".webp" and not oversized:
+            image["webp"] = image["path"]
+        else:
+            targets["webp"] = (base + ".webp", (MAX_DIMENSION, MAX_DIMENSION))
+
+        missing = {key: target for key, target in targets.items()
+                   if not (self.output_dir / target[0]).exists()}
+        if missing or meta.get("width") is None:
+            try:
+                with Image.open(source) as img:
+                    meta["width"], meta["height"] = img.size
+                    if missing:
+                        img = img.convert("RGBA" if img.mode in ("RGBA", "LA", "P") else "RGB")
+                    for rel, size in missing.values():
+                        self._save_webp(img, rel, size)
+            except Exception:
+                # Unreadable or unsupported image: ship the original only
+                return
+            image["width"], image["height"] = meta["width"], meta["height"]
+
+        for key, (rel, _) in targets.items():
+            image[key] = rel
+
+    def _save_webp(self, img: Any, rel: str, size: tuple) -> None:
+        dest = self.output_dir / rel
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        variant = img.copy()
+        variant.thumbnail(size)
+        tmp = dest.with_name(f".{dest.name}.{threading.get_ident()}.tmp")
+        try:
+            variant.save(tmp, "WEBP", quality=WEBP_QUALITY)
+            os.replace(tmp, dest)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        self._count("variants")
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def _load_manifest(self) -> None:
+        self._manifest = {"sources": {}, "files": {}}
+        self._seen = set()
+        try:
+            data = json.loads((self.root / MANIFEST_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self._manifest["sources"].update(data.get("sources") or {})
+            self._manifest["files"].update(data.get("files") or {})
+
+    def _save_manifest(self) -> None:
+        if self._manifest is None:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.root / MANIFEST_NAME, json.dumps(self._manifest).encode("utf-8"))
@@ -0,0 +1,304 @@
+"""
+Scan benchmarks on synthetic workspaces.
+
+generate_workspace() writes a deterministic tree of projects covering every
+language LanguageDetector knows, nested into group directories, with
+node_modules-sized junk, git repositories with a configurable number of
+commits (built with ``git fast-import``) and large READMEs.
+
+run_benchmark() times a full scan, warm and touched incremental scans,
+each detection stage per project, the DataManager export/load paths and
+the startup of ``portfolio.py list`` in a fresh interpreter (checked
+against STARTUP_TARGET_MS), and returns a JSON-serializable report so runs can be compared across
+versions (``portfolio.py bench --output results.json``).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .fingerprint import STAGES
+
+
+BENCH_VERSION = 1
+
+# Budget for `portfolio.py list` from process start to exit (shell prompt integrations)
+STARTUP_TARGET_MS = 100
+
+# Marker files per language, matching what LanguageDetector looks for
+LANGUAGE_TEMPLATES: Dict[str, Dict[str, str]] = {
+    "JavaScript": {"package.json": '{\n  "name": "%(name)s",\n  "dependencies": {"react": "^18.0.0"}\n}\n'},
+    "Python": {"requirements.txt": "flask==3.0.0\nrequests\n"},
+    "Dart": {"pubspec.yaml": "name: %(name)s\n"},
+    "Rust": {"Cargo.toml": '[package]\nname = "%(name)s"\nversion = "0.1.0"\n'},
+    "Go": {"go.mod": "module example.com/%(name)s\n\ngo 1.21\n"},
+    "Java": {"pom.xml": "<project><artifactId>%(name)s</artifactId></project>\n"},
+    "Ruby": {"Gemfile": "source 'https://rubygems.org'\ngem 'rails'\n"},
+    "PHP": {"composer.json": '{"name": "bench/%(name)s"}\n'},
+    "C#": {"%(name)s.csproj": '<Project Sdk="Microsoft.NET.Sdk"></Project>\n'},
+}
+
+SOURCE_EXTENSIONS = {
+    "JavaScript": ".js", "Python": ".py", "Dart": ".dart", "Rust": ".rs", "Go": ".go",
+    "Java": ".java", "Ruby": ".rb", "PHP": ".php", "C#": ".cs",
+}
+
+# 1x1 transparent PNG
+_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489"
+    "0000000d4944415478da63f8ffff3f0005fe02fea7d6a4b40000000049454e44ae426082"
+)
+
+
+def generate_workspace(root: Path, projects: int = 50, depth: int = 2, junk_files: int = 200,
+                       commits: int = 20, readme_kb: int = 16, source_files: int = 10,
+                       seed: int = 0) -> Dict[str, Any]:
+    """Write a synthetic workspace under ``root`` and return its parameters."""
+    rng = random.Random(seed)
+    languages = list(LANGUAGE_TEMPLATES)
+    has_git = shutil.which("git") is not None
+    root.mkdir(parents=True, exist_ok=True)
+
+    for i in range(projects):
+        language = languages[i % len(languages)]
+        name = f"project-{i:04d}"
+        # Spread projects over group directories down to ``depth``
+        parent = root
+        for level in range(1, depth):
+            parent = parent / f"group-{level}-{rng.randrange(max(1, projects // 10))}"
+        directory = parent / name
+        directory.mkdir(parents=True, exist_ok=True)
+
+        for file_name, template in LANGUAGE_TEMPLATES[language].items():
+            (directory / (file_name % {"name": name})).write_text(template % {"name": name}, encoding="utf-8")
+        (directory / "README.md").write_text(_readme(name, readme_kb, rng), encoding="utf-8")
+
+        src = directory / "src"
+        src.mkdir(exist_ok=True)
+        ext = SOURCE_EXTENSIONS[language]
+        for j in range(source_files):
+            lines = "\n".join(f"value_{k} = {rng.randrange(1000)}" for k in range(rng.randrange(20, 200)))
+            (src / f"module_{j}{ext}").write_text(lines + "\n", encoding="utf-8")
+
+        screenshots = directory / "screenshots"
+        screenshots.mkdir(exist_ok=True)
+        for j in range(3):
+            (screenshots / f"screen-{j}.png").write_bytes(_PNG)
+
+        if junk_files:
+            _write_junk(directory / "node_modules", junk_files, rng)
+        if commits and has_git:
+            _make_git_repo(directory, name, commits)
+
+    return {
+        "projects": projects,
+        "depth": depth,
+        "junk_files": junk_files,
+        "commits": commits if has_git else 0,
+        "readme_kb": readme_kb,
+        "source_files": source_files,
+        "seed": seed,
+    }
+
+
+def run_benchmark(config, root: Path, repeat: int = 3, workers: Optional[int] = None,
+                  touch: bool = True) -> Dict[str, Any]:
+    """Time scanner and data manager operations against the workspace at ``root``.
+
+    ``touch`` allows appending to a README to time a one-change incremental
+    scan; leave it off for workspaces that are not synthetic.
+    """
+    from .data_manager import DataManager
+    from .scanner import PortfolioScanner
+
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="portfolio-bench-") as out_dir:
+        config = copy.copy(config)
+        config.output_dir = out_dir
+
+        def fresh_scanner() -> PortfolioScanner:
+            # New scanner per run so the git history cache does not carry over
+            return PortfolioScanner(config)
+
+        projects: List[Dict] = []
+        fingerprints: Dict[str, Dict[str, str]] = {}
+
+        def full_scan() -> None:
+            scanner = fresh_scanner()
+            projects[:] = scanner.scan(root, config.max_depth, workers=workers)
+            fingerprints.clear()
+            fingerprints.update(scanner.fingerprints)
+
+        results["scan"] = _time(full_scan, repeat)
+
+        data_manager = DataManager(config)
+        data_manager.save_cache(projects, fingerprints)
+        cache = data_manager.load_cache()
+
+        results["incremental_scan"] = _time(
+            lambda: fresh_scanner().incremental_scan(root, cache, workers=workers), repeat)
+
+        def touched_scan() -> None:
+            # One README edit: only that project's readme stage should rerun
+            readme = Path(projects[0]["path"]) / "README.md"
+            with open(readme, "a", encoding="utf-8") as f:
+                f.write("\n")
+            fresh_scanner().incremental_scan(root, cache, workers=workers)
+
+        if projects and touch:
+            results["incremental_scan_touched"] = _time(touched_scan, repeat)
+
+        stages = _time_stages(fresh_scanner(), root, config.max_depth, repeat)
+
+        key = projects[len(projects) // 2]["slug"] if projects else ""
+        export = {
+            "export_projects": lambda: data_manager.export_projects(projects),
+            "load_projects": data_manager.load_projects,
+            "load_index": data_manager.load_index,
+            "find_project": lambda: data_manager.find_project(key),
+            "save_cache": lambda: data_manager.save_cache(projects, fingerprints),
+            "load_cache": data_manager.load_cache,
+        }
+        data = {name: _time(func, repeat) for name, func in export.items()}
+        startup = {"list": _time_startup(config, out_dir, repeat)}
+
+    return {
+        "version": BENCH_VERSION,
+        "timestamp": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": {
+            "workers": workers or config.workers,
+            "executor": config.executor,
+            "git_backend": config.git_backend,
+            "layout": config.layout,
+            "format": config.output_format,
+            "serializer": config.serializer,
+        },
+        "project_count": len(projects),
+        "results": results,
+        "stages": stages,
+        "data_manager": data,
+        "startup": startup,
+        "startup_target_ms": STARTUP_TARGET_MS,
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Human-readable summary of a run_benchmark() report."""
+    lines = [f"{'operation':<28}{'min (ms)':>12}{'median (ms)':>14}"]
+    for section in ("results", "stages", "data_manager", "startup"):
+        for name, timing in report.get(section, {}).items():
+            label = f"cli {name}" if section == "startup" else name
+            lines.append(f"{label:<28}{timing['min'] * 1000:>12.2f}{timing['median'] * 1000:>14.2f}")
+    if "startup" in report:
+        median = report["startup"]["list"]["median"] * 1000
+        verdict = "met" if median <= report["startup_target_ms"] else "MISSED"
+        lines.append(f"\nstartup target {report['startup_target_ms']} ms: {verdict} ({median:.1f} ms median)")
+    return "\n".join(lines)
+
+
+# ----- Internal helpers -----
+def _time(func: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    runs = []
+    for _ in range(max(1, repeat)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            runs.append(time.perf_counter() - start)
+    return {"runs": runs, "min": min(runs), "median": statistics.median(runs)}
+
+
+def _time_startup(config, data_dir: str, repeat: int) -> Dict[str, Any]:
+    """Time ``portfolio.py list`` in a fresh interpreter against the export in ``data_dir``."""
+    cli = Path(__file__).resolve().parent.parent / "portfolio.py"
+    with tempfile.TemporaryDirectory(prefix="portfolio-bench-cli-") as cwd:
+        output = {"data_dir": data_dir, "layout": config.layout, "backend": config.backend,
+                  "format": config.output_format, "serializer": config.serializer}
+        # JSON is valid YAML
+        (Path(cwd) / "portfolio-config.yaml").write_text(json.dumps({"output": output}), encoding="utf-8")
+
+        def run() -> None:
+            subprocess.run([sys.executable, str(cli), "list"], cwd=cwd, check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        # The first run fills the parsed-config cache, as any earlier command would
+        run()
+        return _time(run, repeat)
+
+
+def _time_stages(scanner, root: Path, max_depth: int, repeat: int) -> Dict[str, Any]:
+    """Time each _detect_project stage summed over every project."""
+    candidates = scanner.discovery.find(root, max_depth)
+    runners: Dict[str, Callable[[Any], Any]] = {
+        "fingerprint": lambda c: scanner.fingerprinter.compute(c.path, c.files),
+        "detect": lambda c: scanner.language_detector.detect(c.path, c.files),
+        "readme": lambda c: scanner.readme_parser.parse(c.path, c.files),
+        "assets": lambda c: scanner.asset_finder.find_assets(c.path, scanner.config.output_dir, c.files),
+        "stats": lambda c: scanner._calculate_stats(c.path),
+        # Fresh analyzer each run: measure the history walk, not the sha cache
+        "git": lambda c: type(scanner.git_analyzer)(scanner.config.git_backend).analyze(c.path),
+    }
+
+    stages: Dict[str, Any] = {"discovery": _time(lambda: scanner.discovery.find(root, max_depth), repeat)}
+    for name in ("fingerprint",) + tuple(STAGES):
+        runner = runners[name]
+        stages[name] = _time(lambda: [runner(c) for c in candidates], repeat)
+    return stages
+
+
+def _readme(name: str, size_kb: int, rng: random.Random) -> str:
+    words = ["portfolio", "scanner", "project", "build", "deploy", "feature", "config", "module", "test", "data"]
+    parts = [f"# {name}\n\n", f"[![Live Demo](https://img.shields.io/badge/demo-live-green)](https://{name}.example.com)\n\n"]
+    size = sum(len(p) for p in parts)
+    section = 0
+    while size < size_kb * 1024:
+        section += 1
+        block = f"## Section {section}\n\n" + " ".join(rng.choice(words) for _ in range(120)) + "\n\n"
+        if section % 3 == 0:
+            block += "```bash\n# not a heading\nnpm run build\n```\n\n"
+        parts.append(block)
+        size += len(block)
+    return "".join(parts)
+
+
+def _write_junk(directory: Path, count: int, rng: random.Random) -> None:
+    per_package = 20
+    for i in range(count):
+        package = directory / f"pkg-{i // per_package}"
+        if i % per_package == 0:
+            package.mkdir(parents=True, exist_ok=True)
+        (package / f"file-{i}.js").write_text(f"module.exports = {rng.randrange(10**6)};\n", encoding="utf-8")
+
+
+def _make_git_repo(directory: Path, name: str, commits: int) -> None:
+    # fast-import builds K commits in one process instead of K `git commit`s
+    subprocess.run(["git", "init", "-q", "-b", "main", str(directory)], check=True)
+    start = 1_600_000_000
+    stream = []
+    for i in range(commits):
+        content = f"{name} change {i}\n".encode("utf-8")
+        message = f"Commit {i}\n".encode("utf-8")
+        stream.append(b"commit refs/heads/main\n")
+        stream.append(f"committer Bench <bench@example.com> {start + i * 86400} +0000\n".encode("utf-8"))
+        stream.append(b"data %d\n%s\n" % (len(message), message))
+        stream.append(b"M 644 inline CHANGELOG.txt\n")
+        stream.append(b"data %d\n%s\n" % (len(content), content))
+    subprocess.run(["git", "-C", str(directory), "fast-import", "--quiet"],
+                   input=b"".join(stream), check=True)
@@ -6,6 +6,12 @@ Responsibilities:
 - Load overrides from a local YAML file (portfolio-config.yaml)
 - Expose simple attributes used by other modules
 - Write a default YAML on first init
+
+Parsing YAML dominates the startup of quick commands such as ``list``, so
+the parsed defaults and user file are cached as JSON under
+``$XDG_CACHE_HOME/portfolio-ops`` (``~/.cache`` by default), keyed by the
+embedded defaults and the user file's path, size and mtime. PyYAML is only
+imported when that cache misses.
 """
 
 from __future__ import annotations
@@ -13,12 +19,12 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import json
 import os
+import zlib
 
-try:
-    import yaml  # type: ignore
-except Exception:  # pragma: no cover
-    yaml = None  # Will fail later with a helpful message if used without install
+# Bumped when the cache layout changes
+CONFIG_CACHE_VERSION = 1
 
 
 _DEFAULT_YAML = """scanner:
@@ -39,10 +45,56 @@ _DEFAULT_YAML = """scanner:
     rust: ["Cargo.toml"]
     go: ["go.mod"]
 
+  # Extra language detectors, checked before the built-ins (same name replaces
+  # one); see portfolio_ops/detectors.py for the fields. Example:
+  #   - name: elixir
+  #     language: Elixir
+  #     markers: ["mix.exs"]
+  #     tags: ["elixir"]
+  detectors: []
+
+  # Parallel detection: workers > 1 runs projects concurrently
+  workers: 1
+  executor: thread       # thread | process
+  queue_size: 0          # max in-flight projects (0 = workers * 4)
+
+  # sync: workers/executor above; async: event loop overlapping the stages of
+  # up to `concurrency` projects (helps on NFS/SSHFS where each stat is slow)
+  engine: sync
+  concurrency: 32
+
+  # Include inode numbers in incremental-scan fingerprints
+  fingerprint_inode: false
+
+  # Commit history backend: auto | cli | gitpython | refs
+  git_backend: auto
+  # Weekly commits, active days, contributors and lines changed in git.activity (needs git)
+  git_activity: true
+
+  # Lines-of-code counting: larger files are skipped; breakdown adds code/comment/blank
+  max_file_size_kb: 1024
+  # READMEs are analyzed and stored up to this size
+  readme_max_kb: 512
+  loc_breakdown: false
+
+  # Watch mode: wait for a quiet period (capped at max_delay) before refreshing;
+  # the polling fallback re-checks every poll_interval seconds
+  watch_debounce: 1.0
+  watch_max_delay: 10.0
+  watch_poll_interval: 5.0
+
 output:
   data_dir: "./portfolio-data"
+  layout: single         # single (projects.json) | sharded (index.json + projects/<id>.json)
+  backend: json          # json (files only) | sqlite (portfolio.db, indexed queries; files still exported)
+  format: pretty         # pretty (indented, for humans) | compact (for machine consumers)
+  serializer: auto       # auto | orjson | msgspec | json
+  readme_content: inline # inline (full README in each record) | store (content/<sha256>.md, loaded on demand)
+  # Copy screenshots/logos into <data_dir>/assets/<slug>/ (content-hashed,
+  # deduplicated; WebP variants and thumbnails when Pillow is installed)
   copy_assets: true
   max_asset_size_mb: 5
+  asset_workers: 4
 
   screenshot_dirs:
     - screenshots
@@ -70,8 +122,7 @@ class Config:
 
     def __init__(self, config_path: Optional[Path] = None) -> None:
         self._config_path = Path(config_path) if config_path else Path("portfolio-config.yaml")
-        self._defaults = self._load_defaults()
-        self._data = self._load_yaml(self._config_path) if self._config_path.exists() else {}
+        self._defaults, self._data = self._load_cached()
 
         # Public attributes consumed across the codebase
         scanner_cfg = self._get_section("scanner")
@@ -82,11 +133,32 @@ class Config:
         self.max_depth: int = int(scanner_cfg.get("max_depth", self._defaults["scanner"]["max_depth"]))
         self.ignore_dirs: List[str] = list(scanner_cfg.get("ignore_dirs", self._defaults["scanner"]["ignore_dirs"]))
         self.file_patterns: Dict[str, List[str]] = dict(scanner_cfg.get("file_patterns", self._defaults["scanner"]["file_patterns"]))
+        self.detectors: List[Dict[str, Any]] = list(scanner_cfg.get("detectors") or self._defaults["scanner"]["detectors"] or [])
+        self.workers: int = max(1, int(scanner_cfg.get("workers", self._defaults["scanner"]["workers"])))
+        self.executor: str = str(scanner_cfg.get("executor", self._defaults["scanner"]["executor"]))
+        self.queue_size: int = int(scanner_cfg.get("queue_size", self._defaults["scanner"]["queue_size"]))
+        self.engine: str = str(scanner_cfg.get("engine", self._defaults["scanner"]["engine"]))
+        self.concurrency: int = max(1, int(scanner_cfg.get("concurrency", self._defaults["scanner"]["concurrency"])))
+        self.git_backend: str = str(scanner_cfg.get("git_backend", self._defaults["scanner"]["git_backend"]))
+        self.git_activity: bool = bool(scanner_cfg.get("git_activity", self._defaults["scanner"]["git_activity"]))
+        self.max_file_size_kb: int = int(scanner_cfg.get("max_file_size_kb", self._defaults["scanner"]["max_file_size_kb"]))
+        self.readme_max_kb: int = int(scanner_cfg.get("readme_max_kb", self._defaults["scanner"]["readme_max_kb"]))
+        self.loc_breakdown: bool = bool(scanner_cfg.get("loc_breakdown", self._defaults["scanner"]["loc_breakdown"]))
+        self.fingerprint_inode: bool = bool(scanner_cfg.get("fingerprint_inode", self._defaults["scanner"]["fingerprint_inode"]))
+        self.watch_debounce: float = float(scanner_cfg.get("watch_debounce", self._defaults["scanner"]["watch_debounce"]))
+        self.watch_max_delay: float = float(scanner_cfg.get("watch_max_delay", self._defaults["scanner"]["watch_max_delay"]))
+        self.watch_poll_interval: float = float(scanner_cfg.get("watch_poll_interval", self._defaults["scanner"]["watch_poll_interval"]))
 
         # Output
         self.output_dir: str = str(output_cfg.get("data_dir", self._defaults["output"]["data_dir"]))
+        self.layout: str = str(output_cfg.get("layout", self._defaults["output"]["layout"]))
+        self.backend: str = str(output_cfg.get("backend", self._defaults["output"]["backend"]))
+        self.output_format: str = str(output_cfg.get("format", self._defaults["output"]["format"]))
+        self.serializer: str = str(output_cfg.get("serializer", self._defaults["output"]["serializer"]))
+        self.readme_content: str = str(output_cfg.get("readme_content", self._defaults["output"]["readme_content"]))
         self.copy_assets: bool = bool(output_cfg.get("copy_assets", self._defaults["output"]["copy_assets"]))
         self.max_asset_size_mb: int = int(output_cfg.get("max_asset_size_mb", self._defaults["output"]["max_asset_size_mb"]))
+        self.asset_workers: int = max(1, int(output_cfg.get("asset_workers", self._defaults["output"]["asset_workers"])))
         self.screenshot_dirs: List[str] = list(output_cfg.get("screenshot_dirs", self._defaults["output"]["screenshot_dirs"]))
 
         # Display
@@ -103,11 +175,37 @@ class Config:
         path.write_text(_DEFAULT_YAML, encoding="utf-8")
 
     # ----- Internal helpers -----
-    def _load_defaults(self) -> Dict[str, Any]:
-        if yaml is None:
-            # Still allow defaults without YAML installed (only needed to parse user file)
+    def _load_cached(self) -> tuple:
+        """(defaults, user data), from the JSON cache when it is still valid."""
+        path = os.path.abspath(self._config_path)
+        try:
+            st = os.stat(path)
+            source: Optional[List[int]] = [st.st_size, st.st_mtime_ns]
+        except OSError:
+            source = None
+        key = [CONFIG_CACHE_VERSION, zlib.crc32(_DEFAULT_YAML.encode("utf-8")), path, source]
+        cache_file = _cache_dir() / f"config-{zlib.crc32(path.encode('utf-8')):08x}.json"
+
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            if cached.get("key") == key:
+                return cached["defaults"], cached["data"]
+        except (OSError, ValueError, AttributeError, KeyError):
             pass
 
+        defaults = self._load_defaults()
+        data = self._load_yaml(self._config_path) if source is not None else {}
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"key": key, "defaults": defaults, "data": data}), encoding="utf-8")
+            os.replace(tmp, cache_file)
+        except (OSError, TypeError, ValueError):
+            # Read-only home or values JSON cannot hold (e.g. YAML dates): just don't cache
+            pass
+        return defaults, data
+
+    def _load_defaults(self) -> Dict[str, Any]:
         # Parse the embedded default YAML so we keep a single source of truth
         parsed = self._safe_yaml_load(_DEFAULT_YAML)
         return parsed  # type: ignore[return-value]
@@ -120,6 +218,10 @@ class Config:
         return self._safe_yaml_load(text)
 
     def _safe_yaml_load(self, text: str) -> Dict[str, Any]:
+        try:
+            import yaml  # type: ignore
+        except Exception:  # pragma: no cover
+            yaml = None
         if yaml is None:
             raise RuntimeError(
                 "PyYAML is required to load configuration. Please install dependencies from requirements.txt."
@@ -130,3 +232,5 @@ class Config:
         return data
 
 
+def _cache_dir() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "portfolio-ops"
@@ -0,0 +1,68 @@
+"""
+Content-addressed store for README Markdown.
+
+With ``output.readme_content: store`` project records keep only the README
+summary (preview, headings, demo URL, word count) plus ``content_hash`` and
+``content_path``; the text itself is written once per distinct content to
+``content/<sha256>.md`` in the data directory and loaded on demand.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+from .serialization import atomic_write, link_or_copy
+
+
+README_MODES = ("inline", "store")
+
+
+class ContentStore:
+    def __init__(self, output_dir: Path, dirname: str = "content") -> None:
+        self.output_dir = output_dir
+        self.dirname = dirname
+        self.root = output_dir / dirname
+
+    def put(self, text: str) -> Tuple[str, str]:
+        """Store ``text``; returns (hash, path relative to the data directory)."""
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        rel = self.relpath(digest)
+        path = self.output_dir / rel
+        # Same hash, same bytes: an existing file never needs rewriting
+        if not path.exists():
+            atomic_write(path, data)
+        return digest, rel
+
+    def get(self, digest: str) -> Optional[str]:
+        try:
+            return (self.output_dir / self.relpath(digest)).read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def relpath(self, digest: str) -> str:
+        return f"{self.dirname}/{digest}.md"
+
+    def prune(self, keep: Iterable[str]) -> int:
+        """Delete stored content whose hash is not in ``keep``; returns the count."""
+        keep = set(keep)
+        removed = 0
+        if not self.root.is_dir():
+            return removed
+        for path in self.root.glob("*.md"):
+            if path.stem not in keep:
+                path.unlink()
+                removed += 1
+        return removed
+
+    def adopt(self, source_dir: Path) -> int:
+        """Link in the stored content of another data directory; returns the count added."""
+        added = 0
+        source_root = source_dir / self.dirname
+        if not source_root.is_dir():
+            return added
+        for path in source_root.glob("*.md"):
+            added += link_or_copy(path, self.root / path.name)
+        return added
@@ -0,0 +1,160 @@
+"""
+Batch curation: apply many display edits in a single load/save cycle.
+
+An edit list is a YAML, JSON or CSV file. Each edit selects projects with
+one of SELECTORS and sets any of the display FIELDS, e.g.
+
+    - slug: formqr
+      featured: true
+      priority: 10
+    - glob: "test-*"
+      visibility: hidden
+
+YAML/JSON files may also wrap the list as ``{edits: [...]}``. CSV files use
+the same names as column headers; empty cells are left unchanged.
+"""
+
+from __future__ import annotations
+
+import csv
+import fnmatch
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+from .lookup import normalize_name
+
+
+SELECTORS = ("id", "slug", "name", "path", "glob")
+FIELDS = ("featured", "category", "priority", "visibility", "custom_description")
+VISIBILITIES = ("public", "hidden", "draft")
+
+_TRUE = {"true", "yes", "y", "1", "on"}
+_FALSE = {"false", "no", "n", "0", "off"}
+
+
+class EditError(ValueError):
+    """Raised when an edit list is malformed; nothing is applied."""
+
+
+def load_edits(path: Path) -> List[Dict[str, Any]]:
+    """Read and validate an edit list from a YAML, JSON or CSV file."""
+    suffix = path.suffix.lower()
+    text = path.read_text(encoding="utf-8")
+    if suffix == ".csv":
+        rows = list(csv.DictReader(text.splitlines()))
+        data: Any = [{k.strip(): v for k, v in row.items() if k and v not in (None, "")} for row in rows]
+    elif suffix == ".json":
+        data = json.loads(text)
+    elif suffix in (".yaml", ".yml"):
+        import yaml  # type: ignore
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise EditError(f"Invalid YAML in {path.name}: {e}")
+    else:
+        raise EditError(f"Unsupported edit file type: {path.suffix} (use .yaml, .json or .csv)")
+
+    if isinstance(data, dict):
+        data = data.get("edits", [])
+    if not isinstance(data, list):
+        raise EditError("Edit file must contain a list of edits")
+    return [_validate(edit, i) for i, edit in enumerate(data, 1)]
+
+
+def apply_edits(projects: List[Dict[str, Any]],
+                edits: List[Dict[str, Any]]) -> Tuple[Set[str], List[Dict[str, Any]]]:
+    """Apply ``edits`` in order to ``projects`` in place.
+
+    Returns the ids of projects whose display actually changed, and the
+    edits whose selector matched no project.
+    """
+    changed: Set[str] = set()
+    unmatched: List[Dict[str, Any]] = []
+
+    # Exact selectors resolve through dictionaries; only globs scan the list
+    by_key: Dict[str, Dict[str, List[Dict[str, Any]]]] = {s: {} for s in SELECTORS if s != "glob"}
+    for project in projects:
+        for selector, table in by_key.items():
+            key = _key(selector, project.get(selector) or "")
+            table.setdefault(key, []).append(project)
+
+    for edit in edits:
+        selector, value = edit["selector"], edit["value"]
+        if selector == "glob":
+            matches = [p for p in projects if _glob_matches(p, value)]
+        else:
+            matches = by_key[selector].get(_key(selector, value), [])
+        if not matches:
+            unmatched.append(edit)
+            continue
+        for project in matches:
+            display = project.setdefault("display", {})
+            for field, new_value in edit["set"].items():
+                if display.get(field) != new_value:
+                    display[field] = new_value
+                    changed.add(project["id"])
+    return changed, unmatched
+
+
+def describe(edit: Dict[str, Any]) -> str:
+    return f"{edit['selector']} '{edit['value']}'"
+
+
+# ----- Internal helpers -----
+def _validate(edit: Any, position: int) -> Dict[str, Any]:
+    if not isinstance(edit, dict):
+        raise EditError(f"Edit #{position}: expected a mapping, got {type(edit).__name__}")
+
+    selectors = [s for s in SELECTORS if s in edit]
+    if len(selectors) != 1:
+        raise EditError(f"Edit #{position}: exactly one of {', '.join(SELECTORS)} is required")
+    unknown = set(edit) - set(SELECTORS) - set(FIELDS)
+    if unknown:
+        raise EditError(f"Edit #{position}: unknown field(s) {', '.join(sorted(unknown))}")
+
+    changes: Dict[str, Any] = {}
+    for field in FIELDS:
+        if field not in edit:
+            continue
+        value = edit[field]
+        if field == "featured":
+            value = _to_bool(value, position)
+        elif field == "priority":
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                raise EditError(f"Edit #{position}: priority must be an integer, got {value!r}")
+        elif field == "visibility":
+            value = str(value).strip().lower()
+            if value not in VISIBILITIES:
+                raise EditError(f"Edit #{position}: visibility must be one of {', '.join(VISIBILITIES)}")
+        elif value is not None:
+            value = str(value)
+        changes[field] = value
+    if not changes:
+        raise EditError(f"Edit #{position}: no fields to set (one of {', '.join(FIELDS)})")
+
+    selector = selectors[0]
+    return {"selector": selector, "value": str(edit[selector]), "set": changes}
+
+
+def _to_bool(value: Any, position: int) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise EditError(f"Edit #{position}: featured must be true/false, got {value!r}")
+
+
+def _key(selector: str, value: str) -> str:
+    return normalize_name(value) if selector == "name" else value
+
+
+def _glob_matches(project: Dict[str, Any], pattern: str) -> bool:
+    pattern = pattern.casefold()
+    return (fnmatch.fnmatchcase((project.get("slug") or "").casefold(), pattern)
+            or fnmatch.fnmatchcase(normalize_name(project.get("name") or ""), pattern))
@@ -1,38 +1,171 @@
 """
 Data management for Portfolio-OPs
 
-Handles reading/writing projects.json and cache.json in the configured output
-directory. The projects file is stored as a simple JSON array of project
-objects to match how the current CLI reads it.
+Handles reading/writing project data and cache.json in the configured output
+directory. Two layouts are supported (``output.layout``):
+
+- ``single`` (default): projects.json, a JSON array of full project objects
+- ``sharded``: index.json with the light fields of every project
+  (INDEX_FIELDS) plus projects/<id>.json holding the heavy fields, so
+  single-project edits and list views never touch the whole dataset
+
+Either way lookup.json (see lookup.py) maps names, slugs, ids and paths to
+the byte range of each record so single-project lookups read one record.
+
+With ``output.readme_content: store`` README text is moved out of the
+records into a deduplicated content store (see content_store.py). With
+``output.copy_assets`` images are published under assets/<slug>/ and the
+records point at the copies (see asset_pipeline.py).
+
+Exports are streamed: records are serialized and written one at a time as
+the scanner produces them, into temporary files renamed into place at the
+end, so memory does not grow with the number of projects.
+
+With ``output.backend: sqlite`` the records, hand-set display fields and
+the scan cache live in portfolio.db (see store.py); lookups and ``list``
+filters become indexed queries, and projects.json is exported from the
+same stream so the frontends are unaffected.
 """
 
 from __future__ import annotations
 
 import json
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Any, Optional, Tuple
+
+from .content_store import README_MODES, ContentStore
+from .curation import FIELDS as DISPLAY_FIELDS
+from .lookup import KEY_TYPES, LookupIndex, normalize_name
+from .serialization import FORMATS, AtomicWriter, atomic_write, dumps, loads, resolve_serializer
+
+if TYPE_CHECKING:
+    from .asset_pipeline import AssetPipeline
+    from .store import ProjectStore
+
+
+LAYOUTS = ("single", "sharded")
+BACKENDS = ("json", "sqlite")
+# list --sort choices, matching the frontends' sortProjects()
+SORTS = ("name", "date", "commits", "priority")
+
+# Fields kept in index.json; everything else lives in the project's shard
+INDEX_FIELDS = ("id", "slug", "name", "path", "metadata", "display")
 
 
 class DataManager:
     def __init__(self, config) -> None:
         self.config = config
+        # Directories are created by the first write, so read-only commands stay cheap
         self.output_dir = Path(self.config.output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        (self.output_dir / "assets").mkdir(parents=True, exist_ok=True)
+
+        self.layout = self.config.layout
+        if self.layout not in LAYOUTS:
+            raise ValueError(f"Unknown output layout: {self.layout!r} (expected one of {', '.join(LAYOUTS)})")
+
+        if self.config.output_format not in FORMATS:
+            raise ValueError(f"Unknown output format: {self.config.output_format!r} (expected one of {', '.join(FORMATS)})")
+        self.pretty = self.config.output_format == "pretty"
+        if self.config.readme_content not in README_MODES:
+            raise ValueError(f"Unknown readme_content mode: {self.config.readme_content!r} (expected one of {', '.join(README_MODES)})")
+        self.readme_mode = self.config.readme_content
+        self.content_store = ContentStore(self.output_dir)
+        self.serializer = resolve_serializer(self.config.serializer)
+
+        if self.config.backend not in BACKENDS:
+            raise ValueError(f"Unknown storage backend: {self.config.backend!r} (expected one of {', '.join(BACKENDS)})")
 
         self.projects_file = self.output_dir / "projects.json"
+        self.index_file = self.output_dir / "index.json"
+        self.shards_dir = self.output_dir / "projects"
         self.cache_file = self.output_dir / "cache.json"
+        self.lookup_file = self.output_dir / "lookup.json"
+        self.manifests_file = self.output_dir / "manifests.json"
+        self.commit_index_file = self.output_dir / "commit_index.json"
+        self._lookup: Optional[LookupIndex] = None
+
+    @cached_property
+    def asset_pipeline(self) -> Optional[AssetPipeline]:
+        """The asset pipeline when ``output.copy_assets`` is on; built on first export."""
+        if not self.config.copy_assets:
+            return None
+        from .asset_pipeline import AssetPipeline
+
+        return AssetPipeline(self.output_dir, self.config.max_asset_size_mb, self.config.asset_workers)
+
+    @cached_property
+    def store(self) -> Optional[ProjectStore]:
+        """The SQLite store with ``output.backend: sqlite``; opened on first use."""
+        if self.config.backend != "sqlite":
+            return None
+        from .store import ProjectStore
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        return ProjectStore(self.output_dir / "portfolio.db", self.serializer)
+
+    @property
+    def export_target(self) -> Path:
+        """The file consumers should read: projects.json or index.json."""
+        return self.index_file if self.layout == "sharded" else self.projects_file
 
     # ----- Projects -----
-    def export_projects(self, projects: List[Dict[str, Any]]) -> None:
-        """Write the full projects list to projects.json."""
-        self._write_json(self.projects_file, projects)
+    def export_projects(self, projects: Iterable[Dict[str, Any]]) -> None:
+        """Write every project in the configured layout.
+
+        ``projects`` may be a generator; each record is written as soon as
+        it is produced and not kept afterwards.
+        """
+        content_hashes: set = set()
+        asset_paths: set = set()
+        projects = self._prepare(projects, content_hashes, asset_paths)
+        if self.store is not None:
+            projects = self.store.write_projects(projects)
+        self._write_projects(projects)
+        self._prune(content_hashes, asset_paths)
+
+    def export_stream(self, projects: Iterable[Dict[str, Any]],
+                      fingerprints: Optional[Dict[str, Dict[str, str]]] = None,
+                      publish: bool = True) -> None:
+        """Export projects and write cache.json in a single streaming pass.
+
+        ``fingerprints`` is read per project as it goes by, so it may be
+        filled in while ``projects`` is being consumed (scanner.fingerprints).
+        ``publish=False`` takes the records' published assets as they are
+        (records merged from shards, see adopt_files).
+        """
+        content_hashes: set = set()
+        asset_paths: set = set()
+        if self.store is not None:
+            # Cache entries go to the store's cache table instead of cache.json
+            projects = self._prepare(projects, content_hashes, asset_paths, publish)
+            self._write_projects(self.store.write_projects(
+                projects, lambda proj: self._cache_entry(proj, fingerprints or {})))
+            self._prune(content_hashes, asset_paths)
+            return
+        with AtomicWriter(self.cache_file) as cache:
+            # README text and asset paths are settled before a record reaches either file
+            projects = self._prepare(projects, content_hashes, asset_paths, publish)
+            self._write_projects(self._tee_cache(projects, fingerprints, cache))
+        self._prune(content_hashes, asset_paths)
+
+    def adopt_files(self, source_dir: Path) -> None:
+        """Link in the README content and published assets of another data
+        directory (a ``generate --shard`` output) before exporting its records."""
+        self.content_store.adopt(source_dir)
+        if self.asset_pipeline is not None:
+            self.asset_pipeline.adopt(source_dir)
 
     def load_projects(self) -> List[Dict[str, Any]]:
+        """Return every project as a full record, whatever the layout."""
+        if self.store is not None:
+            return list(self.store.records())
+        if self.layout == "sharded":
+            return [self.load_project(entry) for entry in self.load_index()]
+
         if not self.projects_file.exists():
             return []
         try:
-            data = json.loads(self.projects_file.read_text(encoding="utf-8"))
+            data = loads(self.projects_file.read_bytes())
             if isinstance(data, dict) and "projects" in data:
                 # Allow future schema with meta wrapper
                 return list(data.get("projects", []))
@@ -42,15 +175,197 @@ class DataManager:
         except Exception:
             return []
 
-    def save_projects(self, projects: List[Dict[str, Any]]) -> None:
-        self._write_json(self.projects_file, projects)
+    def save_projects(self, projects: List[Dict[str, Any]], changed: Optional[set] = None,
+                      edited: bool = False) -> None:
+        """Persist an edited project list.
+
+        ``changed`` limits shard rewrites to those project ids in the
+        sharded layout; the single layout always rewrites projects.json.
+        ``edited`` marks the changes as hand edits: with the sqlite backend
+        the display fields that differ from the stored records are kept as
+        overrides for later scans.
+        """
+        if self.store is not None:
+            for proj in projects:
+                if changed is None or proj.get("id") in changed:
+                    if edited:
+                        self._record_edits(proj)
+                    if changed is not None:
+                        self.store.save_project(proj)
+        if self.layout == "single" or changed is None:
+            self.export_projects(projects)
+            return
+
+        self.shards_dir.mkdir(parents=True, exist_ok=True)
+        index = []
+        for proj in projects:
+            if proj.get("id") in changed:
+                index.append(self._write_shard(proj))
+            else:
+                entry = {k: proj.get(k) for k in INDEX_FIELDS}
+                entry["shard"] = self._shard_name(proj)
+                index.append(entry)
+        self._write_index_file(index)
+
+    def load_index(self) -> List[Dict[str, Any]]:
+        """Return the light (INDEX_FIELDS) view of every project.
+
+        In the sharded layout this reads only index.json. In the single
+        layout it falls back to projects.json.
+        """
+        if self.store is not None:
+            index = []
+            for proj in self.store.records():
+                entry = {k: proj.get(k) for k in INDEX_FIELDS}
+                if self.layout == "sharded":
+                    entry["shard"] = self._shard_name(proj)
+                index.append(entry)
+            return index
+        if self.layout == "single":
+            return [{k: p.get(k) for k in INDEX_FIELDS} for p in self.load_projects()]
+        if not self.index_file.exists():
+            return []
+        try:
+            data = loads(self.index_file.read_bytes())
+            return data if isinstance(data, list) else []
+        except Exception:
+            return []
+
+    def load_project(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the full record for an index entry."""
+        if self.layout == "single" or not entry.get("shard"):
+            for proj in self.load_projects():
+                if proj.get("id") == entry.get("id"):
+                    return proj
+            return dict(entry)
+
+        project = {k: v for k, v in entry.items() if k != "shard"}
+        try:
+            heavy = loads((self.output_dir / entry["shard"]).read_bytes())
+            project.update(heavy)
+        except Exception:
+            pass
+        return project
+
+    def find_project(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the full record matching ``key`` (id, slug, name or path).
+
+        Uses lookup.json to read just that record; the lookup is rebuilt
+        first if the data file was changed by another writer. The sqlite
+        backend answers from its indexes instead.
+        """
+        if self.store is not None:
+            return self.store.get(key)
+        lookup = self._get_lookup()
+        pid = lookup.resolve(key)
+        if pid is None:
+            return None
+
+        record = lookup.records.get(pid, {})
+        source = self.export_target
+        if "offset" not in record:
+            for entry in self.load_index():
+                if entry.get("id") == pid:
+                    return self.load_project(entry)
+            return None
+
+        with open(source, "rb") as f:
+            f.seek(record["offset"])
+            entry = loads(f.read(record["length"]))
+        if self.layout == "sharded":
+            return self.load_project(entry)
+        return entry
+
+    def load_readme(self, project: Dict[str, Any]) -> str:
+        """Return the full README Markdown of a project, inline or from the content store."""
+        readme = project.get("readme") or {}
+        if readme.get("content"):
+            return readme["content"]
+        if readme.get("content_hash"):
+            return self.content_store.get(readme["content_hash"]) or ""
+        return ""
+
+    def slug_collisions(self) -> Dict[str, List[str]]:
+        """Return {slug: [ids]} for slugs shared by more than one project."""
+        return dict(self._get_lookup().collisions)
+
+    def query(self, language: Optional[str] = None, category: Optional[str] = None,
+              featured: Optional[bool] = None, sort: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Light records (INDEX_FIELDS) matching every given filter.
+
+        ``language`` also matches secondary languages; ``sort`` is one of
+        SORTS (default: export order). The sqlite backend runs this as
+        an indexed query; the JSON layouts filter the loaded records.
+        """
+        if sort and sort not in SORTS:
+            raise ValueError(f"Unknown sort: {sort!r} (expected one of {', '.join(SORTS)})")
+        if self.store is not None:
+            return self.store.query(language=language, category=category, featured=featured,
+                                    sort=sort, limit=limit)
+
+        # Date and commit sorts need fields outside the index view
+        projects = self.load_projects() if sort in ("date", "commits") else self.load_index()
+        if language:
+            wanted = language.casefold()
+            projects = [p for p in projects
+                        if wanted in {lang.casefold() for lang in
+                                      p['metadata'].get('languages') or [p['metadata']['language']]}]
+        if category:
+            projects = [p for p in projects if (p['display'].get('category') or "").casefold() == category.casefold()]
+        if featured is not None:
+            projects = [p for p in projects if bool(p['display'].get('featured')) == featured]
+        if sort == "name":
+            projects.sort(key=lambda p: normalize_name(p.get('name') or ""))
+        elif sort == "date":
+            projects.sort(key=lambda p: (p.get('timestamps') or {}).get('modified') or "", reverse=True)
+        elif sort == "commits":
+            projects.sort(key=lambda p: (p.get('git') or {}).get('total_commits') or 0, reverse=True)
+        elif sort == "priority":
+            projects.sort(key=lambda p: p['display'].get('priority') or 0, reverse=True)
+        return [{k: p.get(k) for k in INDEX_FIELDS} for p in projects[:limit or None]]
+
+    def save_project(self, project: Dict[str, Any]) -> None:
+        """Persist a single edited project.
+
+        The sharded layout rewrites only that project's shard and the
+        compact index; the single layout has to rewrite projects.json.
+        With the sqlite backend the edited display fields also become
+        overrides that later scans keep.
+        """
+        if self.store is not None:
+            self._record_edits(project)
+            self.store.save_project(project)
+        if self.layout == "single":
+            projects = self.load_projects()
+            for i, proj in enumerate(projects):
+                if proj.get("id") == project.get("id"):
+                    projects[i] = project
+                    break
+            else:
+                projects.append(project)
+            self._write_projects_file(projects)
+            return
+
+        self.shards_dir.mkdir(parents=True, exist_ok=True)
+        entry = self._write_shard(project)
+        index = self.load_index()
+        for i, existing in enumerate(index):
+            if existing.get("id") == entry["id"]:
+                index[i] = entry
+                break
+        else:
+            index.append(entry)
+        self._write_index_file(index)
 
     # ----- Cache -----
     def load_cache(self) -> Dict[str, Any]:
+        if self.store is not None:
+            return self.store.load_cache()
         if not self.cache_file.exists():
             return {}
         try:
-            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+            data = loads(self.cache_file.read_bytes())
             # Backward/forward compatibility: accept either dict or object with projects map
             if isinstance(data, dict) and "projects" in data:
                 return data.get("projects", {})
@@ -60,29 +375,249 @@ class DataManager:
         except Exception:
             return {}
 
-    def save_cache(self, projects: List[Dict[str, Any]]) -> None:
-        cache_map: Dict[str, Any] = {}
+    def save_cache(self, projects: Iterable[Dict[str, Any]],
+                   fingerprints: Optional[Dict[str, Dict[str, str]]] = None) -> None:
+        """Persist the scan cache.
+
+        ``fingerprints`` maps project path to per-stage input digests (see
+        portfolio_ops.fingerprint); incremental scans reuse a stage only when
+        its digest is unchanged.
+        """
+        if self.store is not None:
+            fingerprints = fingerprints if fingerprints is not None else {}
+            self.store.save_cache((proj["path"], self._cache_entry(proj, fingerprints))
+                                  for proj in projects if proj.get("path"))
+            return
+        with AtomicWriter(self.cache_file) as cache:
+            for _ in self._tee_cache(projects, fingerprints, cache):
+                pass
+
+    def load_manifests(self) -> Dict[str, Any]:
+        """Parsed-manifest cache entries from the last scan (see manifest_cache.py)."""
+        try:
+            data = loads(self.manifests_file.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def save_manifests(self, entries: Dict[str, Any]) -> None:
+        self._write_json(self.manifests_file, entries, pretty=False)
+
+    def load_commit_index(self) -> Dict[str, Any]:
+        """Per-project commit-date index entries (see wrapped.py)."""
+        try:
+            data = loads(self.commit_index_file.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def save_commit_index(self, entries: Dict[str, Any]) -> None:
+        self._write_json(self.commit_index_file, entries, pretty=False)
+
+    # ----- Internal helpers -----
+    def _shard_name(self, project: Dict[str, Any]) -> str:
+        return f"projects/{project['id']}.json"
+
+    def _write_projects(self, projects: Iterable[Dict[str, Any]]) -> None:
+        if self.layout == "single":
+            self._write_projects_file(projects)
+            # A stale index would shadow projects.json for readers that prefer it
+            if self.index_file.exists():
+                self.index_file.unlink()
+        else:
+            self.shards_dir.mkdir(parents=True, exist_ok=True)
+            index = []
+            for proj in projects:
+                entry = self._write_shard(proj)
+                index.append(entry)
+            self._write_index_file(index)
+
+            # Drop shards of projects that disappeared since the last export
+            keep = {entry["shard"] for entry in index}
+            for shard in self.shards_dir.glob("*.json"):
+                if f"projects/{shard.name}" not in keep:
+                    shard.unlink()
+            # A stale projects.json would keep serving old data to readers
+            # that do not know the sharded layout
+            if self.projects_file.exists():
+                self.projects_file.unlink()
+
+    def _write_projects_file(self, projects: Iterable[Dict[str, Any]]) -> None:
+        # Keep only the lookup keys of each record, not the record itself
+        keys: List[Dict[str, Any]] = []
+        locations = self._write_json_array(self.projects_file, self._collect_keys(projects, keys))
+        self._save_lookup(LookupIndex.build(keys, self.projects_file, locations))
+
+    def _prepare(self, projects: Iterable[Dict[str, Any]], content_hashes: set,
+                 asset_paths: set, publish: bool = True) -> Iterator[Dict[str, Any]]:
+        if self.store is not None:
+            projects = self.store.apply_overrides(projects)
+        projects = self._apply_readme_mode(projects, content_hashes)
+        if self.asset_pipeline is not None:
+            if publish:
+                projects = self.asset_pipeline.process(projects, asset_paths)
+            else:
+                projects = self.asset_pipeline.referenced(projects, asset_paths)
+        return projects
+
+    def _prune(self, content_hashes: set, asset_paths: set) -> None:
+        """Drop stored README content and published assets no project references."""
+        self.content_store.prune(content_hashes)
+        if self.asset_pipeline is not None:
+            self.asset_pipeline.prune(asset_paths)
+
+    def _apply_readme_mode(self, projects: Iterable[Dict[str, Any]], content_hashes: set) -> Iterator[Dict[str, Any]]:
+        """Move README text into the content store (or back inline) per ``output.readme_content``.
+
+        Hashes of stored content still referenced are added to ``content_hashes``.
+        """
+        for proj in projects:
+            readme = proj.get("readme")
+            if readme and readme.get("exists"):
+                if self.readme_mode == "store" and "content" in readme:
+                    readme = {k: v for k, v in readme.items() if k != "content"}
+                    readme["content_hash"], readme["content_path"] = self.content_store.put(proj["readme"]["content"] or "")
+                    proj = {**proj, "readme": readme}
+                elif self.readme_mode == "inline" and "content" not in readme:
+                    content = self.load_readme(proj)
+                    readme = {k: v for k, v in readme.items() if k not in ("content_hash", "content_path")}
+                    readme["content"] = content
+                    proj = {**proj, "readme": readme}
+                if readme.get("content_hash"):
+                    content_hashes.add(readme["content_hash"])
+            yield proj
+
+    def _collect_keys(self, items: Iterable[Dict[str, Any]], keys: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for item in items:
+            keys.append({k: item.get(k) for k in KEY_TYPES})
+            yield item
+
+    def _tee_cache(self, projects: Iterable[Dict[str, Any]],
+                   fingerprints: Optional[Dict[str, Dict[str, str]]],
+                   cache: AtomicWriter) -> Iterator[Dict[str, Any]]:
+        """Write a cache.json entry for each project passing through (compact)."""
+        fingerprints = fingerprints if fingerprints is not None else {}
+        cache.write(b'{"last_scan":null,"projects":{')
+        first = True
         for proj in projects:
             path = proj.get("path")
-            modified = proj.get("timestamps", {}).get("modified")
-            last_scanned = proj.get("timestamps", {}).get("last_scanned")
-            if not path:
-                continue
-            cache_map[path] = {
-                "last_modified": modified,
-                "last_scanned": last_scanned,
-                "project_data": proj,
-            }
-
-        payload = {
-            "last_scan": None,
-            "projects": cache_map,
+            if path:
+                entry = self._cache_entry(proj, fingerprints)
+                cache.write((b"" if first else b",") + dumps(path, False, self.serializer)
+                            + b":" + dumps(entry, False, self.serializer))
+                first = False
+            yield proj
+        cache.write(b"}}")
+
+    def _cache_entry(self, proj: Dict[str, Any], fingerprints: Dict[str, Dict[str, str]]) -> Dict[str, Any]:
+        return {
+            "last_modified": proj.get("timestamps", {}).get("modified"),
+            "last_scanned": proj.get("timestamps", {}).get("last_scanned"),
+            "fingerprints": fingerprints.get(proj.get("path")),
+            "project_data": proj,
         }
-        self._write_json(self.cache_file, payload)
 
-    # ----- Internal helpers -----
-    def _write_json(self, path: Path, obj: Any) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(obj, indent=2, ensure_ascii=False), encoding="utf-8")
+    def _record_edits(self, project: Dict[str, Any]) -> None:
+        """Store display fields that differ from the stored record as overrides."""
+        stored = self.store.get(project.get("id") or "") or {}
+        before = stored.get("display") or {}
+        after = project.get("display") or {}
+        fields = [field for field in DISPLAY_FIELDS if after.get(field) != before.get(field)]
+        if fields:
+            self.store.record_overrides(project, fields)
+
+    def _write_index_file(self, index: List[Dict[str, Any]]) -> None:
+        locations = self._write_json_array(self.index_file, index)
+        shards = [entry.get("shard") for entry in index]
+        self._save_lookup(LookupIndex.build(index, self.index_file, locations, shards))
+
+    def _save_lookup(self, lookup: LookupIndex) -> None:
+        self._lookup = lookup
+        self._write_json(self.lookup_file, lookup.to_dict(), pretty=False)
+
+    def _get_lookup(self) -> LookupIndex:
+        source = self.export_target
+        if self._lookup is None:
+            self._lookup = LookupIndex.load(self.lookup_file)
+        if self._lookup is None or not self._lookup.is_current(source):
+            items, locations = self._scan_json_array(source)
+            if locations is None:
+                # Not a plain array (e.g. {meta, projects}); index without offsets
+                lookup = LookupIndex({"source": source.name})
+                for item in items:
+                    lookup.add(item, {})
+            else:
+                shards = [item.get("shard") for item in items]
+                lookup = LookupIndex.build(items, source, locations, shards)
+            self._save_lookup(lookup)
+        return self._lookup
+
+    def _write_json_array(self, path: Path, items: Iterable[Any]) -> List[Tuple[int, int]]:
+        """Stream ``items`` to ``path`` as a JSON array in the configured format.
+
+        Pretty output matches json.dumps(items, indent=2). Returns the
+        (byte offset, byte length) of every element so a record can later
+        be read with a single seek.
+        """
+        if self.pretty:
+            separator, indent, closer = b",\n", b"  ", b"\n]"
+        else:
+            separator, indent, closer = b",", b"", b"]"
+
+        locations: List[Tuple[int, int]] = []
+        with AtomicWriter(path) as f:
+            f.write(b"[")
+            for item in items:
+                data = dumps(item, self.pretty, self.serializer)
+                if self.pretty:
+                    data = data.replace(b"\n", b"\n  ")
+                lead = (b"\n" if self.pretty else b"") if not locations else separator
+                f.write(lead + indent)
+                locations.append((f.bytes_written, len(data)))
+                f.write(data)
+            f.write(closer if locations else b"]")
+        return locations
+
+    def _scan_json_array(self, path: Path) -> Tuple[List[Any], Optional[List[Tuple[int, int]]]]:
+        """Parse a JSON file, returning its items and their byte ranges if it is an array."""
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            return [], []
+        try:
+            data = loads(text)
+        except ValueError:
+            return [], []
+        if not isinstance(data, list):
+            items = data.get("projects", []) if isinstance(data, dict) else []
+            return list(items), None
+
+        decoder = json.JSONDecoder()
+        locations: List[Tuple[int, int]] = []
+        pos = text.index("[") + 1
+        byte_pos = len(text[:pos].encode("utf-8"))
+        for _ in data:
+            start = pos
+            while text[start] in " \t\r\n,":
+                start += 1
+            _, end = decoder.raw_decode(text, start)
+            byte_start = byte_pos + len(text[pos:start].encode("utf-8"))
+            length = len(text[start:end].encode("utf-8"))
+            locations.append((byte_start, length))
+            pos, byte_pos = end, byte_start + length
+        return data, locations
+
+    def _write_shard(self, project: Dict[str, Any]) -> Dict[str, Any]:
+        """Write the heavy fields of a project to its shard; return its index entry."""
+        shard = self._shard_name(project)
+        heavy = {k: v for k, v in project.items() if k not in INDEX_FIELDS}
+        self._write_json(self.output_dir / shard, heavy)
+        entry = {k: project.get(k) for k in INDEX_FIELDS}
+        entry["shard"] = shard
+        return entry
+
+    def _write_json(self, path: Path, obj: Any, pretty: Optional[bool] = None) -> None:
+        pretty = self.pretty if pretty is None else pretty
+        atomic_write(path, dumps(obj, pretty, self.serializer))
 
 
@@ -1,145 +1,291 @@
 """
 Language and framework detection utilities.
+
+Detectors are declared as data (see BUILTIN_DETECTORS):
+
+- ``name``: unique id; a user detector with the same name replaces a built-in
+- ``language``, ``framework``, ``type``, ``tags``: the default result
+- ``markers``: file names or globs (``*.csproj``) at the project root
+- ``manifest``: optional manifest whose dependencies feed ``rules``
+  (one of manifest_cache.MANIFEST_PARSERS)
+- ``rules``: ordered ``{deps, framework?, type?, tags?}`` entries; the first
+  matching rule with a framework sets the framework, the first with a type
+  sets the type, and both add their tags
+
+Every detector is evaluated against the directory listing in one pass:
+marker names and dependencies are looked up in prebuilt indexes, so the
+cost does not grow with the number of rules. All matching detectors are
+reported; the first in priority order gives the primary language and the
+others become secondary languages.
+
+Extra detectors come from ``scanner.detectors`` in the config (evaluated
+before the built-ins) and from installed packages exposing a
+``portfolio_ops.detectors`` entry point (a detector dict, a list of them,
+or a callable returning either).
 """
 
 from __future__ import annotations
 
-import json
+import fnmatch
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional
+
+from .manifest_cache import MANIFEST_PARSERS, ManifestCache
+
+
+ENTRY_POINT_GROUP = "portfolio_ops.detectors"
+
+BUILTIN_DETECTORS: List[Dict[str, Any]] = [
+    {
+        "name": "node",
+        "language": "JavaScript",
+        "framework": "Node.js",
+        "type": "Web App",
+        "tags": ["javascript", "node"],
+        "markers": ["package.json"],
+        "manifest": "package.json",
+        "rules": [
+            {"deps": ["next"], "framework": "Next.js", "tags": ["react"]},
+            {"deps": ["react", "gatsby"], "framework": "React", "tags": ["react"]},
+            {"deps": ["vue", "nuxt"], "framework": "Vue", "tags": ["vue"]},
+            {"deps": ["svelte", "sveltekit"], "framework": "Svelte", "tags": ["svelte"]},
+            # Heuristic for API/server projects
+            {"deps": ["express", "koa", "fastify", "hapi"], "type": "Backend/API", "tags": ["api", "backend"]},
+        ],
+    },
+    {
+        "name": "python",
+        "language": "Python",
+        "framework": "Python",
+        "type": "CLI Tool",
+        "tags": ["python"],
+        "markers": ["requirements.txt", "setup.py", "pyproject.toml"],
+        "manifest": "requirements.txt",
+        "rules": [
+            {"deps": ["flask"], "framework": "Flask", "type": "Backend/API", "tags": ["api", "backend"]},
+            {"deps": ["fastapi"], "framework": "FastAPI", "type": "Backend/API", "tags": ["api", "backend"]},
+            {"deps": ["django", "djangorestframework"], "framework": "Django", "type": "Backend/API",
+             "tags": ["api", "backend"]},
+        ],
+    },
+    {
+        "name": "flutter",
+        "language": "Dart",
+        "framework": "Flutter",
+        "type": "Mobile App",
+        "tags": ["flutter", "dart", "mobile"],
+        "markers": ["pubspec.yaml"],
+    },
+    {
+        "name": "rust",
+        "language": "Rust",
+        "framework": "Rust",
+        "type": "CLI Tool",
+        "tags": ["rust"],
+        "markers": ["Cargo.toml"],
+    },
+    {
+        "name": "go",
+        "language": "Go",
+        "framework": "Go",
+        "type": "CLI Tool",
+        "tags": ["go"],
+        "markers": ["go.mod"],
+    },
+    {
+        "name": "java",
+        "language": "Java",
+        "framework": "Java",
+        "type": "Backend/API",
+        "tags": ["java"],
+        "markers": ["pom.xml", "build.gradle"],
+    },
+    {
+        "name": "ruby",
+        "language": "Ruby",
+        "framework": "Ruby",
+        "type": "Web App",
+        "tags": ["ruby"],
+        "markers": ["Gemfile"],
+    },
+    {
+        "name": "php",
+        "language": "PHP",
+        "framework": "PHP",
+        "type": "Web App",
+        "tags": ["php"],
+        "markers": ["composer.json"],
+    },
+    {
+        "name": "dotnet",
+        "language": "C#",
+        "framework": ".NET",
+        "type": "Desktop/App",
+        "tags": ["csharp", ".net"],
+        "markers": ["*.csproj"],
+    },
+]
+
+
+class DetectorRegistry:
+    """Detectors in priority order, indexed by marker name and dependency."""
+
+    def __init__(self, detectors: Iterable[Dict[str, Any]]) -> None:
+        self.detectors: List[Dict[str, Any]] = []
+        seen = set()
+        for detector in detectors:
+            detector = _validate(detector)
+            if detector["name"] in seen:
+                continue
+            seen.add(detector["name"])
+            self.detectors.append(detector)
+
+        # marker name -> detector positions; globs are few and checked per file
+        self._by_marker: Dict[str, List[int]] = {}
+        self._globs: List[tuple] = []
+        # per detector: dependency -> positions of the rules naming it
+        self._rule_index: List[Dict[str, List[int]]] = []
+        for pos, detector in enumerate(self.detectors):
+            for marker in detector["markers"]:
+                if any(ch in marker for ch in "*?["):
+                    self._globs.append((marker, pos))
+                else:
+                    self._by_marker.setdefault(marker, []).append(pos)
+            index: Dict[str, List[int]] = {}
+            for rule_pos, rule in enumerate(detector["rules"]):
+                for dep in rule["deps"]:
+                    index.setdefault(dep.lower(), []).append(rule_pos)
+            self._rule_index.append(index)
+
+    @classmethod
+    def build(cls, extra: Optional[Iterable[Dict[str, Any]]] = None,
+              entry_points: bool = True) -> "DetectorRegistry":
+        """Config detectors, then entry-point detectors, then the built-ins."""
+        detectors = list(extra or [])
+        if entry_points:
+            detectors += _load_entry_points()
+        return cls(detectors + BUILTIN_DETECTORS)
+
+    @property
+    def marker_patterns(self) -> Dict[str, List[str]]:
+        """``{language: markers}`` of every detector, in ``scanner.file_patterns`` form."""
+        patterns: Dict[str, List[str]] = {}
+        for detector in self.detectors:
+            patterns.setdefault(detector["language"].lower(), []).extend(detector["markers"])
+        return patterns
+
+    def match(self, files: AbstractSet[str]) -> List[int]:
+        """Positions of the detectors whose markers occur in ``files``, in priority order."""
+        hits = set()
+        for name in files:
+            positions = self._by_marker.get(name)
+            if positions:
+                hits.update(positions)
+            for pattern, pos in self._globs:
+                if pos not in hits and fnmatch.fnmatch(name, pattern):
+                    hits.add(pos)
+        return sorted(hits)
+
+    def resolve(self, pos: int, deps: Iterable[str]) -> Dict[str, Any]:
+        """Apply the dependency rules of detector ``pos``; returns the detection dictionary."""
+        detector = self.detectors[pos]
+        index = self._rule_index[pos]
+        matched = sorted({i for dep in deps for i in index.get(dep, ())})
+        rules = detector["rules"]
+        framework_rule = next((rules[i] for i in matched if rules[i].get("framework")), None)
+        type_rule = next((rules[i] for i in matched if rules[i].get("type")), None)
+
+        tags = list(detector["tags"])
+        for rule in (framework_rule, type_rule):
+            if rule is not None:
+                tags += rule.get("tags", [])
+        return {
+            "language": detector["language"],
+            "framework": framework_rule["framework"] if framework_rule else detector["framework"],
+            "type": type_rule["type"] if type_rule else detector["type"],
+            # Rule-based tags are sorted; a fixed tag list keeps its declared order
+            "tags": list(sorted(set(tags))) if rules else tags,
+        }
 
 
 class LanguageDetector:
-    def detect(self, directory: Path) -> Optional[Dict]:
+    def __init__(self, manifests: Optional[ManifestCache] = None,
+                 detectors: Optional[Iterable[Dict[str, Any]]] = None) -> None:
+        # Parsed manifests, shared with the scanner's project-name lookup
+        self.manifests = manifests if manifests is not None else ManifestCache()
+        self.registry = DetectorRegistry.build(detectors)
+
+    def detect(self, directory: Path, files: Optional[AbstractSet[str]] = None) -> Optional[Dict]:
         """Return a detection dictionary or None if not recognized.
 
-        Expected keys: language, framework, type, tags
+        Expected keys: language, framework, type, tags, languages (primary
+        first, then every other matching language)
+
+        ``files`` is the set of file names directly inside ``directory`` as
+        produced by discovery; without it the directory is listed once.
         """
-        # JavaScript / Node
-        pkg = directory / "package.json"
-        if pkg.exists():
+        if files is None:
             try:
-                data = json.loads(pkg.read_text(encoding="utf-8"))
-            except Exception:
-                data = {}
-            deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
-            deps_lower = {k.lower(): v for k, v in deps.items()}
-
-            framework = "Node.js"
-            proj_type = "Web App"
-            tags: List[str] = ["javascript", "node"]
-
-            if any(k in deps_lower for k in ["react", "next", "gatsby"]):
-                framework = "React" if "next" not in deps_lower else "Next.js"
-                tags += ["react"]
-            elif any(k in deps_lower for k in ["vue", "nuxt"]):
-                framework = "Vue"
-                tags += ["vue"]
-            elif any(k in deps_lower for k in ["svelte", "sveltekit"]):
-                framework = "Svelte"
-                tags += ["svelte"]
+                files = frozenset(p.name for p in directory.iterdir() if not p.is_dir())
+            except OSError:
+                return None
+
+        results = []
+        for pos in self.registry.match(files):
+            deps: List[str] = []
+            manifest = self.registry.detectors[pos].get("manifest")
+            if manifest and manifest in files:
+                deps = (self.manifests.get(directory / manifest) or {}).get("dependencies", [])
+            results.append(self.registry.resolve(pos, deps))
+        if not results:
+            return None
+
+        primary = results[0]
+        primary["languages"] = list(dict.fromkeys(result["language"] for result in results))
+        if len(results) > 1:
+            primary["tags"] = list(sorted({tag for result in results for tag in result["tags"]}))
+        return primary
+
+
+# ----- Internal helpers -----
+def _validate(detector: Dict[str, Any]) -> Dict[str, Any]:
+    if not isinstance(detector, dict):
+        raise ValueError(f"Detector must be a mapping, got {type(detector).__name__}")
+    missing = [key for key in ("name", "language", "markers") if not detector.get(key)]
+    if missing:
+        raise ValueError(f"Detector {detector.get('name')!r} is missing: {', '.join(missing)}")
+    manifest = detector.get("manifest")
+    if manifest and manifest not in MANIFEST_PARSERS:
+        raise ValueError(f"Unknown manifest: {manifest!r} (expected one of {', '.join(MANIFEST_PARSERS)})")
+
+    rules = []
+    for rule in detector.get("rules") or []:
+        rules.append({**rule, "deps": [str(dep).lower() for dep in rule.get("deps") or []]})
+    return {
+        **detector,
+        "framework": detector.get("framework") or detector["language"],
+        "type": detector.get("type") or "Other",
+        "tags": list(detector.get("tags") or [detector["language"].lower()]),
+        "markers": list(detector["markers"]),
+        "rules": rules,
+    }
 
-            # Heuristic for API/server projects
-            if any(k in deps_lower for k in ["express", "koa", "fastify", "hapi"]):
-                proj_type = "Backend/API"
-                tags += ["api", "backend"]
-
-            return {
-                "language": "JavaScript",
-                "framework": framework,
-                "type": proj_type,
-                "tags": list(sorted(set(tags))),
-            }
-
-        # Python
-        if any((directory / f).exists() for f in ["requirements.txt", "setup.py", "pyproject.toml"]):
-            framework = "Python"
-            proj_type = "CLI Tool"
-            tags: List[str] = ["python"]
-
-            req = directory / "requirements.txt"
-            req_text = req.read_text(encoding="utf-8", errors="ignore") if req.exists() else ""
-            lower = req_text.lower()
-            if "flask" in lower or "fastapi" in lower or "django" in lower:
-                proj_type = "Backend/API"
-                tags += ["api", "backend"]
-                if "flask" in lower:
-                    framework = "Flask"
-                elif "fastapi" in lower:
-                    framework = "FastAPI"
-                elif "django" in lower:
-                    framework = "Django"
-
-            return {
-                "language": "Python",
-                "framework": framework,
-                "type": proj_type,
-                "tags": list(sorted(set(tags))),
-            }
-
-        # Flutter / Dart
-        if (directory / "pubspec.yaml").exists():
-            return {
-                "language": "Dart",
-                "framework": "Flutter",
-                "type": "Mobile App",
-                "tags": ["flutter", "dart", "mobile"],
-            }
-
-        # Rust
-        if (directory / "Cargo.toml").exists():
-            return {
-                "language": "Rust",
-                "framework": "Rust",
-                "type": "CLI Tool",
-                "tags": ["rust"],
-            }
-
-        # Go
-        if (directory / "go.mod").exists():
-            return {
-                "language": "Go",
-                "framework": "Go",
-                "type": "CLI Tool",
-                "tags": ["go"],
-            }
-
-        # Java
-        if any((directory / f).exists() for f in ["pom.xml", "build.gradle"]):
-            return {
-                "language": "Java",
-                "framework": "Java",
-                "type": "Backend/API",
-                "tags": ["java"],
-            }
-
-        # Ruby
-        if (directory / "Gemfile").exists():
-            return {
-                "language": "Ruby",
-                "framework": "Ruby",
-                "type": "Web App",
-                "tags": ["ruby"],
-            }
-
-        # PHP
-        if (directory / "composer.json").exists():
-            return {
-                "language": "PHP",
-                "framework": "PHP",
-                "type": "Web App",
-                "tags": ["php"],
-            }
-
-        # C#
-        if list(directory.glob("*.csproj")):
-            return {
-                "language": "C#",
-                "framework": ".NET",
-                "type": "Desktop/App",
-                "tags": ["csharp", ".net"],
-            }
-
-        return None
 
+def _load_entry_points() -> List[Dict[str, Any]]:
+    try:
+        from importlib.metadata import entry_points
+        eps = entry_points(group=ENTRY_POINT_GROUP)
+    except Exception:  # pragma: no cover
+        return []
 
+    detectors: List[Dict[str, Any]] = []
+    for ep in eps:
+        try:
+            value = ep.load()
+            if callable(value):
+                value = value()
+        except Exception as e:
+            print(f"⚠️  Could not load detector plugin {ep.name!r}: {e}")
+            continue
+        detectors.extend([value] if isinstance(value, dict) else list(value))
+    return detectors
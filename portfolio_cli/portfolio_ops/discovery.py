@@ -0,0 +1,164 @@
+"""
+Project directory discovery built on os.scandir.
+
+Each directory is listed exactly once. The listing of a project directory is
+kept on the returned candidate so detectors can check marker files without
+issuing further stat calls.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+from pathlib import Path
+from typing import AbstractSet, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+
+# Files that identify a project root regardless of configuration
+MARKER_FILES = frozenset({
+    "package.json",      # JavaScript/Node
+    "requirements.txt",  # Python
+    "setup.py",          # Python
+    "pyproject.toml",    # Python
+    "pubspec.yaml",      # Dart/Flutter
+    "Cargo.toml",        # Rust
+    "go.mod",            # Go
+    "pom.xml",           # Java/Maven
+    "build.gradle",      # Java/Gradle
+    "Gemfile",           # Ruby
+    "composer.json",     # PHP
+})
+
+MARKER_GLOBS = ("*.csproj",)  # C#
+
+
+def _is_glob(pattern: str) -> bool:
+    return any(ch in pattern for ch in "*?[")
+
+
+class ProjectCandidate(NamedTuple):
+    """A discovered project directory and the names found directly inside it."""
+
+    path: Path
+    files: FrozenSet[str]
+    dirs: FrozenSet[str]
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+
+def list_directory(path: Path) -> Tuple[FrozenSet[str], List[str]]:
+    """Return (file names, directory names) for ``path`` from a single scandir call.
+
+    Directory names keep the order the OS returned them in.
+    """
+    files = set()
+    dirs: List[str] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir():
+                    dirs.append(entry.name)
+                else:
+                    files.add(entry.name)
+            except OSError:
+                continue
+    return frozenset(files), dirs
+
+
+class ProjectDiscovery:
+    """Walks a root directory and collects project candidates.
+
+    Marker files come from the built-in list plus every pattern configured
+    under ``scanner.file_patterns``. Plain names are matched with a set
+    lookup; patterns containing wildcards fall back to fnmatch.
+    """
+
+    def __init__(self, ignore_dirs: Iterable[str],
+                 file_patterns: Optional[Dict[str, List[str]]] = None) -> None:
+        self.ignore_dirs = set(ignore_dirs)
+
+        self.file_patterns = {lang: list(patterns or []) for lang, patterns in (file_patterns or {}).items()}
+
+        names = set(MARKER_FILES)
+        globs = set(MARKER_GLOBS)
+        for patterns in self.file_patterns.values():
+            for pattern in patterns:
+                if _is_glob(pattern):
+                    globs.add(pattern)
+                else:
+                    names.add(pattern)
+        self.marker_names = frozenset(names)
+        self.marker_globs = tuple(sorted(globs))
+
+    def is_project(self, files: AbstractSet[str]) -> bool:
+        if not self.marker_names.isdisjoint(files):
+            return True
+        for pattern in self.marker_globs:
+            if fnmatch.filter(files, pattern):
+                return True
+        return False
+
+    def pattern_language(self, files: AbstractSet[str]) -> Optional[str]:
+        """Return the first ``file_patterns`` language whose patterns match ``files``."""
+        for language, patterns in self.file_patterns.items():
+            for pattern in patterns:
+                if _is_glob(pattern):
+                    if fnmatch.filter(files, pattern):
+                        return language
+                elif pattern in files:
+                    return language
+        return None
+
+    def candidate(self, path: Path) -> Optional[ProjectCandidate]:
+        """Return a candidate for ``path`` if it is a project directory."""
+        try:
+            files, dirs = list_directory(path)
+        except OSError:
+            return None
+        if not self.is_project(files):
+            return None
+        return ProjectCandidate(path, files, frozenset(dirs))
+
+    def find(self, root_path: Path, max_depth: int, verbose: bool = False) -> List[ProjectCandidate]:
+        """Recursively collect project directories below ``root_path``.
+
+        A project directory is not descended into, matching the previous
+        Path.iterdir based traversal.
+        """
+        found: List[ProjectCandidate] = []
+
+        def listing(path: Path) -> Optional[Tuple[FrozenSet[str], List[str]]]:
+            try:
+                return list_directory(path)
+            except PermissionError:
+                if verbose:
+                    print(f"  Permission denied: {path}")
+            except OSError:
+                pass
+            return None
+
+        def traverse(current: Path, subdirs: List[str], depth: int) -> None:
+            if depth > max_depth:
+                return
+            for name in subdirs:
+                if name in self.ignore_dirs:
+                    continue
+                item = current / name
+                result = listing(item)
+                if result is None:
+                    continue
+                files, dirs = result
+
+                if self.is_project(files):
+                    found.append(ProjectCandidate(item, files, frozenset(dirs)))
+                    if verbose:
+                        print(f"  Found project: {name}")
+                else:
+                    traverse(item, dirs, depth + 1)
+
+        root = listing(root_path)
+        if root is not None:
+            traverse(root_path, root[1], 0)
+        return found
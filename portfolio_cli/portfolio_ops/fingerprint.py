@@ -0,0 +1,117 @@
+"""
+Per-stage input fingerprints for incremental scanning.
+
+A project's files are walked once with os.scandir (stat only, no file
+reads) and every entry is fed into the digest of each detection stage that
+depends on it. Two scans whose digest for a stage match saw identical
+(path, size, mtime_ns[, inode]) inputs, so that stage can be served from
+cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import AbstractSet, Dict, Iterable, List, Optional
+
+from .asset_finder import LOGO_NAMES, SCREENSHOT_DIRS
+from .discovery import MARKER_FILES
+from .profiling import note_stat
+from .readme_parser import README_NAMES
+
+
+STAGES = ("detect", "readme", "assets", "stats", "git")
+
+# Files whose stat changes whenever commits, branches or remotes change
+GIT_FILES = ["HEAD", "logs/HEAD", "packed-refs", "config"]
+
+
+class Fingerprinter:
+    def __init__(self, ignore_dirs: Iterable[str], marker_names: Optional[AbstractSet[str]] = None,
+                 screenshot_dirs: Optional[List[str]] = None, include_inode: bool = False,
+                 exclude_paths: Iterable[str] = ()) -> None:
+        self.ignore_dirs = set(ignore_dirs)
+        # Absolute directories left out like ignored ones (the data directory inside a project)
+        self.exclude_paths = {os.path.abspath(p) for p in exclude_paths}
+        self.marker_names = frozenset(marker_names or MARKER_FILES)
+        self.screenshot_dirs = [d.strip("/") + "/" for d in (screenshot_dirs or SCREENSHOT_DIRS)]
+        self.logo_names = frozenset(LOGO_NAMES)
+        self.include_inode = include_inode
+
+    def compute(self, directory: Path, files: AbstractSet[str]) -> Dict[str, str]:
+        """Return ``{stage: digest}`` for every stage in STAGES."""
+        hashers = {stage: hashlib.sha1() for stage in STAGES}
+
+        # detect: which files exist at the root, plus the stats of manifest files
+        hashers["detect"].update("\0".join(sorted(files)).encode("utf-8", "surrogateescape"))
+
+        for rel, record in self._walk(directory):
+            hashers["stats"].update(record)
+            if "/" not in rel:
+                if rel in self.marker_names or rel.endswith(".csproj"):
+                    hashers["detect"].update(record)
+                if rel in README_NAMES:
+                    hashers["readme"].update(record)
+                if rel in self.logo_names:
+                    hashers["assets"].update(record)
+            if any(rel.startswith(prefix) for prefix in self.screenshot_dirs):
+                hashers["assets"].update(record)
+
+        git_dir = directory / ".git"
+        for name in GIT_FILES:
+            hashers["git"].update(self._record(name, self._stat(git_dir / name)))
+
+        return {stage: h.hexdigest() for stage, h in hashers.items()}
+
+    # ----- Internal helpers -----
+    def _walk(self, directory: Path):
+        """Yield (relative path, encoded record) for files below ``directory``.
+
+        Ignored directories are pruned before descending and entries are
+        visited in sorted order so the digest does not depend on the OS.
+        """
+        stack = [("", str(directory))]
+        while stack:
+            prefix, path = stack.pop()
+            try:
+                with os.scandir(path) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
+                rel = prefix + entry.name
+                try:
+                    # Symlinked directories are not followed, as in StatsCounter
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.ignore_dirs and not self._excluded(entry.path):
+                            subdirs.append((rel + "/", entry.path))
+                            yield rel + "/", self._record(rel + "/", None)
+                        continue
+                    note_stat()
+                    st = entry.stat()
+                except OSError:
+                    continue
+                yield rel, self._record(rel, st)
+
+            stack.extend(reversed(subdirs))
+
+    def _excluded(self, path: str) -> bool:
+        return bool(self.exclude_paths) and os.path.abspath(path) in self.exclude_paths
+
+    def _stat(self, path: Path) -> Optional[os.stat_result]:
+        try:
+            return path.stat()
+        except OSError:
+            return None
+
+    def _record(self, rel: str, st: Optional[os.stat_result]) -> bytes:
+        if st is None:
+            fields = [rel, "-"]
+        else:
+            fields = [rel, str(st.st_size), str(st.st_mtime_ns)]
+            if self.include_inode:
+                fields.append(str(st.st_ino))
+        return ("\0".join(fields) + "\n").encode("utf-8", "surrogateescape")
@@ -0,0 +1,174 @@
+"""
+Commit activity aggregates for the year-in-review ("wrapped") views.
+
+One ``git log --numstat`` pass per repository is streamed line by line, so
+memory stays constant whatever the history length, and reduced to a compact
+aggregate stored in the project's git block (``git.activity``):
+
+- ``start``: Monday (ISO date) of the week of the oldest commit
+- ``weekly``: commits per week from ``start``
+- ``days``: per week, a bitmask of the weekdays with commits (bit 0 = Monday)
+- ``commits``, ``active_days``, ``lines_added``, ``lines_deleted``
+- ``contributors``: ``{name, email, commits, added, deleted}``, most commits first
+- ``head_sha``: the commit the aggregate was computed up to
+
+Dates are the author dates in the author's own time zone. When HEAD moves
+forward, only ``<previous head>..HEAD`` is read and added to the stored
+aggregate; a rewritten history (the old head is no longer an ancestor) is
+re-read in full.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Bumped whenever the aggregate layout changes, so stored ones are rebuilt
+ACTIVITY_VERSION = 1
+
+_RECORD = "\x1e"
+_FIELD = "\x1f"
+_FORMAT = "%x1e%ad%x1f%aN%x1f%aE"
+
+
+class ActivityAnalyzer:
+    """Builds and extends ``git.activity`` aggregates with the git command line."""
+
+    @staticmethod
+    def available() -> bool:
+        return shutil.which("git") is not None
+
+    def analyze(self, directory: Path, sha: str,
+                previous: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Aggregate of the history up to ``sha``; None if git cannot read it.
+
+        ``previous`` is the stored aggregate; it is returned as is when it
+        is already at ``sha`` and extended when ``sha`` descends from it.
+        """
+        if previous and previous.get("version") != ACTIVITY_VERSION:
+            previous = None
+        if previous and previous.get("head_sha") == sha:
+            return previous
+
+        base = previous if previous and is_ancestor(directory, previous.get("head_sha"), sha) else None
+        totals = _Totals(base)
+        try:
+            self._stream(directory, f"{base['head_sha']}..{sha}" if base else sha, totals)
+        except (OSError, subprocess.SubprocessError, ValueError):
+            return None
+        return totals.aggregate(sha)
+
+    # ----- Internal helpers -----
+    def _stream(self, directory: Path, revisions: str, totals: "_Totals") -> None:
+        cmd = [
+            "git", "-C", str(directory), "-c", "log.showSignature=false",
+            "log", "--no-color", "--numstat", "--date=format:%Y-%m-%d", f"--format={_FORMAT}",
+            revisions, "--",
+        ]
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              text=True, encoding="utf-8", errors="replace") as proc:
+            author: Optional[List[Any]] = None
+            for line in proc.stdout:
+                if line.startswith(_RECORD):
+                    day, name, email = line[1:].rstrip("\n").split(_FIELD)
+                    author = totals.add_commit(day, name, email)
+                elif author is not None and line != "\n":
+                    # "<added>\t<deleted>\t<path>"; binary files show "-"
+                    added, deleted, _ = line.split("\t", 2)
+                    if added != "-":
+                        totals.add_lines(author, int(added), int(deleted))
+            if proc.wait() != 0:
+                raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+class _Totals:
+    """Running totals keyed by absolute week number (0 = the week of 0001-01-01, a Monday)."""
+
+    def __init__(self, base: Optional[Dict[str, Any]] = None) -> None:
+        self.weeks: Dict[int, List[int]] = {}  # week -> [commits, weekday mask]
+        self.authors: Dict[str, List[Any]] = {}  # email -> [name, email, commits, added, deleted]
+        self.added = 0
+        self.deleted = 0
+        # Authors already seen in this pass; git log runs newest first, so the
+        # first sighting carries the name and email to show
+        self._named: set = set()
+        if base and base.get("start"):
+            first = _week(date.fromisoformat(base["start"]).toordinal())
+            for offset, (count, mask) in enumerate(zip(base["weekly"], base["days"])):
+                if count:
+                    self.weeks[first + offset] = [count, mask]
+        for person in (base or {}).get("contributors", []):
+            self.authors[person["email"].lower()] = [person["name"], person["email"], person["commits"],
+                                                     person["added"], person["deleted"]]
+        if base:
+            self.added = base.get("lines_added", 0)
+            self.deleted = base.get("lines_deleted", 0)
+
+    def add_commit(self, day: str, name: str, email: str) -> List[Any]:
+        ordinal = date.fromisoformat(day).toordinal()
+        week = self.weeks.setdefault(_week(ordinal), [0, 0])
+        week[0] += 1
+        week[1] |= 1 << ((ordinal - 1) % 7)
+
+        key = email.lower()
+        author = self.authors.setdefault(key, [name, email, 0, 0, 0])
+        if key not in self._named:
+            self._named.add(key)
+            author[0], author[1] = name, email
+        author[2] += 1
+        return author
+
+    def add_lines(self, author: List[Any], added: int, deleted: int) -> None:
+        author[3] += added
+        author[4] += deleted
+        self.added += added
+        self.deleted += deleted
+
+    def aggregate(self, sha: str) -> Dict[str, Any]:
+        weekly: List[int] = []
+        days: List[int] = []
+        start = None
+        if self.weeks:
+            first, last = min(self.weeks), max(self.weeks)
+            start = date.fromordinal(first * 7 + 1).isoformat()
+            for week in range(first, last + 1):
+                count, mask = self.weeks.get(week, (0, 0))
+                weekly.append(count)
+                days.append(mask)
+        contributors = sorted(self.authors.values(), key=lambda a: (-a[2], a[0].lower()))
+        return {
+            "version": ACTIVITY_VERSION,
+            "head_sha": sha,
+            "start": start,
+            "weekly": weekly,
+            "days": days,
+            "commits": sum(weekly),
+            "active_days": sum(bin(mask).count("1") for mask in days),
+            "lines_added": self.added,
+            "lines_deleted": self.deleted,
+            "contributors": [
+                {"name": name, "email": email, "commits": commits, "added": added, "deleted": deleted}
+                for name, email, commits, added, deleted in contributors
+            ],
+        }
+
+
+def is_ancestor(directory: Path, ancestor: Optional[str], sha: str) -> bool:
+    """Whether commit ``ancestor`` is reachable from ``sha`` (False if either is unknown)."""
+    if not ancestor:
+        return False
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(directory), "merge-base", "--is-ancestor", ancestor, sha],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return False
+    return result.returncode == 0
+
+
+def _week(ordinal: int) -> int:
+    return (ordinal - 1) // 7
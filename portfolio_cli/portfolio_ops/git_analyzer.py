@@ -1,70 +1,321 @@
 """
-Git metadata extraction using GitPython when available.
+Git metadata extraction.
+
+Branch, remote and HEAD are read straight from the .git directory. Commit
+history (count, first and last commit dates) comes from a pluggable
+backend:
+
+- ``cli``: ``git rev-list --count`` / ``git log`` subprocesses (default when
+  the git binary is available)
+- ``gitpython``: streams ``Repo.iter_commits`` without building a list
+- ``refs``: no external dependency; reads the HEAD commit object when it is
+  stored loose, and leaves the count unknown
+
+History is cached per HEAD sha, so an unchanged repository costs one ref
+read. With ``activity`` enabled the git block also carries the commit
+activity aggregate of git_activity.py, extended from the last analyzed sha.
 """
 
 from __future__ import annotations
 
-from datetime import datetime
+import importlib.util
+import re
+import shutil
+import subprocess
+import threading
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, Optional, Tuple
 
-try:
-    from git import Repo  # type: ignore
-except Exception:  # pragma: no cover
-    Repo = None  # type: ignore
+from .git_activity import ActivityAnalyzer
 
 
-class GitAnalyzer:
-    def analyze(self, directory: Path) -> Dict[str, Any]:
-        if not (directory / ".git").exists() or Repo is None:
-            return {
-                "is_repo": False,
-                "remote_url": None,
-                "last_commit": None,
-                "first_commit": None,
-                "total_commits": 0,
-                "branch": None,
-                "is_archived": False,
-            }
+_SHA_RE = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+
+# Upper bound on memoised histories, so long-running watch mode stays flat
+HISTORY_CACHE_SIZE = 4096
+
+
+def _empty() -> Dict[str, Any]:
+    return {
+        "is_repo": False,
+        "remote_url": None,
+        "last_commit": None,
+        "first_commit": None,
+        "total_commits": 0,
+        "branch": None,
+        "is_archived": False,
+        "head_sha": None,
+    }
 
+
+# ----- Reading refs without git -----
+def find_git_dir(directory: Path) -> Optional[Path]:
+    """Return the git directory for a work tree (handles ``.git`` files)."""
+    dot_git = directory / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        try:
+            text = dot_git.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        if text.startswith("gitdir:"):
+            git_dir = Path(text[len("gitdir:"):].strip())
+            if not git_dir.is_absolute():
+                git_dir = (directory / git_dir).resolve()
+            return git_dir if git_dir.is_dir() else None
+    return None
+
+
+def _common_dir(git_dir: Path) -> Path:
+    # Linked worktrees keep refs and config in the main repository
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
         try:
-            repo = Repo(str(directory))
-            remote_url = None
-            if repo.remotes:
-                try:
-                    remote_url = next(iter(repo.remotes)).url
-                except Exception:
-                    remote_url = None
-
-            commits = list(repo.iter_commits())
-            total = len(commits)
-            last_commit_dt = commits[0].committed_datetime if commits else None
-            first_commit_dt = commits[-1].committed_datetime if commits else None
-
-            branch = None
+            rel = commondir.read_text(encoding="utf-8").strip()
+            return (git_dir / rel).resolve()
+        except OSError:
+            pass
+    return git_dir
+
+
+def _resolve_ref(git_dir: Path, ref: str) -> Optional[str]:
+    for base in (git_dir, _common_dir(git_dir)):
+        ref_file = base / ref
+        if ref_file.is_file():
             try:
-                branch = repo.active_branch.name
-            except Exception:
-                branch = None
+                value = ref_file.read_text(encoding="utf-8").strip()
+            except OSError:
+                continue
+            if value.startswith("ref:"):
+                return _resolve_ref(git_dir, value[4:].strip())
+            return value if _SHA_RE.match(value) else None
+
+    packed = _common_dir(git_dir) / "packed-refs"
+    if packed.is_file():
+        try:
+            with open(packed, encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith(("#", "^")):
+                        continue
+                    parts = line.split()
+                    if len(parts) == 2 and parts[1] == ref:
+                        return parts[0]
+        except OSError:
+            pass
+    return None
+
+
+def read_head(git_dir: Path) -> Tuple[Optional[str], Optional[str]]:
+    """Return (branch, sha) for HEAD; branch is None when detached."""
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None, None
+    if head.startswith("ref:"):
+        ref = head[4:].strip()
+        branch = ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+        return branch, _resolve_ref(git_dir, ref)
+    return None, head if _SHA_RE.match(head) else None
+
+
+def read_remote_url(git_dir: Path) -> Optional[str]:
+    """Return the url of the first remote declared in the git config."""
+    config = _common_dir(git_dir) / "config"
+    try:
+        text = config.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return None
+    in_remote = False
+    for raw in text.splitlines():
+        line = raw.strip()
+        if line.startswith("["):
+            in_remote = line.startswith("[remote ")
+            continue
+        if in_remote and "=" in line:
+            key, value = line.split("=", 1)
+            if key.strip().lower() == "url":
+                return value.strip()
+    return None
+
+
+def _format_git_date(timestamp: str, offset: str) -> str:
+    sign = -1 if offset.startswith("-") else 1
+    minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+    tz = timezone(sign * timedelta(minutes=minutes))
+    return datetime.fromtimestamp(int(timestamp), tz).isoformat()
+
+
+# ----- History backends -----
+class CliBackend:
+    """Commit history via the git command line (no Commit objects in Python)."""
+
+    name = "cli"
+
+    def available(self) -> bool:
+        return shutil.which("git") is not None
+
+    def history(self, directory: Path, sha: str) -> Dict[str, Any]:
+        total = self._git(directory, "rev-list", "--count", sha)
+        last = self._git(directory, "log", "-1", "--format=%cI", sha)
+        # Root commits in rev-list order; the last one matches what a full
+        # iter_commits() walk would end on
+        roots = self._git(directory, "log", "--max-parents=0", "--format=%cI", sha)
+        first = roots.splitlines()[-1] if roots else None
+        return {
+            "total_commits": int(total) if total else 0,
+            "last_commit": last or None,
+            "first_commit": first,
+        }
+
+    def _git(self, directory: Path, *args: str) -> str:
+        result = subprocess.run(
+            ["git", "-C", str(directory), *args],
+            capture_output=True, text=True, check=True,
+        )
+        return result.stdout.strip()
 
-            return {
+
+class GitPythonBackend:
+    """Commit history via GitPython, streamed instead of materialized.
+
+    GitPython is slow to import, so it is only imported on first use.
+    """
+
+    name = "gitpython"
+
+    def available(self) -> bool:
+        try:
+            return importlib.util.find_spec("git") is not None
+        except (ImportError, ValueError):  # pragma: no cover
+            return False
+
+    def history(self, directory: Path, sha: str) -> Dict[str, Any]:
+        from git import Repo  # type: ignore
+
+        repo = Repo(str(directory))
+        total = 0
+        newest = oldest = None
+        for commit in repo.iter_commits(sha):
+            if newest is None:
+                newest = commit
+            oldest = commit
+            total += 1
+        return {
+            "total_commits": total,
+            "last_commit": newest.committed_datetime.isoformat() if newest else None,
+            "first_commit": oldest.committed_datetime.isoformat() if oldest else None,
+        }
+
+
+class RefsBackend:
+    """Dependency-free fallback: reads the HEAD commit if it is a loose object."""
+
+    name = "refs"
+
+    def available(self) -> bool:
+        return True
+
+    def history(self, directory: Path, sha: str) -> Dict[str, Any]:
+        last = None
+        git_dir = find_git_dir(directory)
+        if git_dir is not None:
+            obj = _common_dir(git_dir) / "objects" / sha[:2] / sha[2:]
+            try:
+                data = zlib.decompress(obj.read_bytes())
+                for line in data.split(b"\n"):
+                    if line.startswith(b"committer "):
+                        timestamp, offset = line.decode("utf-8", "ignore").rsplit(" ", 2)[-2:]
+                        last = _format_git_date(timestamp, offset)
+                        break
+                    if not line:
+                        break
+            except (OSError, zlib.error, ValueError):
+                pass
+        return {"total_commits": 0, "last_commit": last, "first_commit": None}
+
+
+BACKENDS = {
+    "cli": CliBackend,
+    "gitpython": GitPythonBackend,
+    "refs": RefsBackend,
+}
+
+
+class GitAnalyzer:
+    def __init__(self, backend: str = "auto", activity: bool = False) -> None:
+        if backend == "auto":
+            self.backends = [cls() for cls in BACKENDS.values()]
+            self.backends = [b for b in self.backends if b.available()]
+        elif backend in BACKENDS:
+            self.backends = [BACKENDS[backend](), RefsBackend()]
+        else:
+            raise ValueError(f"Unknown git backend: {backend!r} (expected auto or one of {', '.join(BACKENDS)})")
+
+        # Weekly activity needs the git binary; without it the block is left out
+        self.activity = ActivityAnalyzer() if activity and ActivityAnalyzer.available() else None
+
+        # HEAD sha -> history, shared across projects within a process (LRU)
+        self._history_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def analyze(self, directory: Path, previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Return git metadata for ``directory``.
+
+        ``previous`` is the git block from an earlier scan; when its
+        ``head_sha`` matches the current HEAD the history is reused.
+        """
+        git_dir = find_git_dir(directory)
+        if git_dir is None:
+            return _empty()
+
+        try:
+            branch, sha = read_head(git_dir)
+            data = _empty()
+            data.update({
                 "is_repo": True,
-                "remote_url": remote_url,
-                "last_commit": last_commit_dt.isoformat() if last_commit_dt else None,
-                "first_commit": first_commit_dt.isoformat() if first_commit_dt else None,
-                "total_commits": total,
+                "remote_url": read_remote_url(git_dir),
                 "branch": branch,
-                "is_archived": False,
-            }
+                "head_sha": sha,
+            })
+            if sha is None:
+                # Unborn branch: repository without commits
+                return data
+
+            data.update(self._history(directory, sha, previous))
+            if self.activity is not None:
+                activity = self.activity.analyze(directory, sha, (previous or {}).get("activity"))
+                if activity is not None:
+                    data["activity"] = activity
+            return data
         except Exception:
-            return {
-                "is_repo": False,
-                "remote_url": None,
-                "last_commit": None,
-                "first_commit": None,
-                "total_commits": 0,
-                "branch": None,
-                "is_archived": False,
-            }
+            return _empty()
 
+    def _history(self, directory: Path, sha: str, previous: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        with self._lock:
+            history = self._history_cache.get(sha)
+            if history is not None:
+                self._history_cache.move_to_end(sha)
+                return history
+        if previous and previous.get("head_sha") == sha:
+            history = {key: previous.get(key) for key in ("total_commits", "last_commit", "first_commit")}
+            self._remember(sha, history)
+            return history
+
+        for backend in self.backends:
+            try:
+                history = backend.history(directory, sha)
+            except Exception:
+                continue
+            self._remember(sha, history)
+            return history
+        return {}
 
+    def _remember(self, sha: str, history: Dict[str, Any]) -> None:
+        with self._lock:
+            self._history_cache[sha] = history
+            while len(self._history_cache) > HISTORY_CACHE_SIZE:
+                self._history_cache.popitem(last=False)
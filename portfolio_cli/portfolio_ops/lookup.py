@@ -0,0 +1,108 @@
+"""
+Persisted lookup index for finding a single project without loading them all.
+
+lookup.json maps normalized names, slugs, ids and paths to project ids, and
+each id to the byte range of its record inside the exported array file
+(projects.json, or index.json in the sharded layout). The index also
+records slug collisions so they can be reported instead of silently
+shadowing each other in the frontends.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .serialization import loads
+
+
+LOOKUP_VERSION = 1
+KEY_TYPES = ("id", "slug", "name", "path")
+
+
+def normalize_name(name: str) -> str:
+    return re.sub(r"\s+", " ", name).strip().casefold()
+
+
+def _file_signature(path: Path) -> Optional[List[int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+class LookupIndex:
+    def __init__(self, data: Optional[Dict[str, Any]] = None) -> None:
+        data = data or {}
+        self.source: Optional[str] = data.get("source")
+        self.signature: Optional[List[int]] = data.get("signature")
+        self.records: Dict[str, Dict[str, Any]] = data.get("records", {})
+        self.keys: Dict[str, Dict[str, List[str]]] = data.get("keys", {k: {} for k in KEY_TYPES})
+        self.collisions: Dict[str, List[str]] = data.get("collisions", {})
+
+    @classmethod
+    def build(cls, projects: List[Dict[str, Any]], source: Path,
+              locations: List[Tuple[int, int]], shards: Optional[List[Optional[str]]] = None) -> "LookupIndex":
+        """Index ``projects`` whose records sit at ``locations`` (offset, length) in ``source``."""
+        index = cls({"source": source.name, "signature": _file_signature(source)})
+        for i, (proj, (offset, length)) in enumerate(zip(projects, locations)):
+            record: Dict[str, Any] = {"offset": offset, "length": length}
+            if shards and shards[i]:
+                record["shard"] = shards[i]
+            index.add(proj, record)
+        return index
+
+    def add(self, project: Dict[str, Any], record: Dict[str, Any]) -> None:
+        pid = project.get("id")
+        if not pid:
+            return
+        self.records[pid] = record
+        values = {
+            "id": pid,
+            "slug": project.get("slug"),
+            "name": normalize_name(project.get("name") or ""),
+            "path": project.get("path"),
+        }
+        for key_type, value in values.items():
+            if not value:
+                continue
+            ids = self.keys[key_type].setdefault(value, [])
+            if pid not in ids:
+                ids.append(pid)
+            if key_type == "slug" and len(ids) > 1:
+                self.collisions[value] = list(ids)
+
+    def is_current(self, source: Path) -> bool:
+        """False when ``source`` was rewritten by something other than DataManager."""
+        return self.source == source.name and self.signature == _file_signature(source)
+
+    def resolve(self, key: str) -> Optional[str]:
+        """Return the id of the project matching ``key`` by id, slug, name or path."""
+        for key_type in KEY_TYPES:
+            value = normalize_name(key) if key_type == "name" else key
+            ids = self.keys.get(key_type, {}).get(value)
+            if ids:
+                return ids[0]
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": LOOKUP_VERSION,
+            "source": self.source,
+            "signature": self.signature,
+            "records": self.records,
+            "keys": self.keys,
+            "collisions": self.collisions,
+        }
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["LookupIndex"]:
+        try:
+            data = loads(path.read_bytes())
+        except Exception:
+            return None
+        if not isinstance(data, dict) or data.get("version") != LOOKUP_VERSION:
+            return None
+        return cls(data)
@@ -0,0 +1,124 @@
+"""
+Parsed-manifest cache shared by language detection and project naming.
+
+Manifests (package.json, requirements.txt, pubspec.yaml) are reduced to the
+small summaries detection needs and cached by path, validated against the
+file's (size, mtime_ns). A manifest is therefore parsed at most once per
+scan, and not at all while it is unchanged. Entries persist across runs in
+manifests.json next to cache.json (see DataManager.load_manifests).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+# Bumped whenever a parser's summary changes, so stale entries are re-parsed
+MANIFEST_VERSION = 2
+
+_REQUIREMENT = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
+
+class ManifestCache:
+    def __init__(self, entries: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        # path -> {"size", "mtime_ns", "version", "data"}
+        self.entries: Dict[str, Dict[str, Any]] = dict(entries or {})
+        self.parsed = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Summary of the manifest at ``path`` (see MANIFEST_PARSERS), or None if unreadable."""
+        parser = MANIFEST_PARSERS.get(path.name)
+        if parser is None:
+            raise ValueError(f"Unknown manifest: {path.name!r} (expected one of {', '.join(MANIFEST_PARSERS)})")
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        key = str(path)
+        entry = self.entries.get(key)
+        if (entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns
+                and entry.get("version") == MANIFEST_VERSION):
+            return entry["data"]
+
+        try:
+            data = parser(path)
+        except (OSError, ValueError):
+            # Unreadable or undecodable (UnicodeDecodeError is a ValueError)
+            return None
+        with self._lock:
+            self.entries[key] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                                 "version": MANIFEST_VERSION, "data": data}
+            self.parsed += 1
+        return data
+
+    def for_directory(self, directory: Path) -> Dict[str, Dict[str, Any]]:
+        """Entries of the manifests directly inside ``directory``."""
+        return {key: self.entries[key] for key in (str(directory / name) for name in MANIFEST_PARSERS)
+                if key in self.entries}
+
+    def update(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            self.entries.update(entries)
+
+    def snapshot(self, directories: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Entries belonging to ``directories`` (project paths); others are dropped."""
+        keep = set(directories)
+        return {key: entry for key, entry in self.entries.items() if os.path.dirname(key) in keep}
+
+
+# ----- Internal helpers -----
+def _parse_package_json(path: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except ValueError:
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    deps: Dict[str, Any] = {}
+    for field in ("dependencies", "devDependencies"):
+        if isinstance(data.get(field), dict):
+            deps.update(data[field])
+    name = data.get("name")
+    return {
+        "name": name if isinstance(name, str) else None,
+        "dependencies": sorted({k.lower() for k in deps}),
+    }
+
+
+def _parse_requirements(path: Path) -> Dict[str, Any]:
+    deps = set()
+    for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
+        line = line.split("#", 1)[0].strip()
+        # Options (-r other.txt, -e ., --index-url ...) are not requirements
+        if not line or line.startswith("-"):
+            continue
+        m = _REQUIREMENT.match(line)
+        if m:
+            deps.add(m.group(0).lower().replace("_", "-"))
+    return {"dependencies": sorted(deps)}
+
+
+def _parse_pubspec(path: Path) -> Dict[str, Any]:
+    import yaml
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+    except yaml.YAMLError:
+        data = None
+    name = data.get("name") if isinstance(data, dict) else None
+    return {"name": name if isinstance(name, str) else None}
+
+
+MANIFEST_PARSERS: Dict[str, Callable[[Path], Dict[str, Any]]] = {
+    "package.json": _parse_package_json,
+    "requirements.txt": _parse_requirements,
+    "pubspec.yaml": _parse_pubspec,
+}
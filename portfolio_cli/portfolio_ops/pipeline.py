@@ -0,0 +1,97 @@
+"""
+Worker pool helpers for running per-project detection concurrently.
+
+Results are always yielded in input order so a parallel scan produces the
+same projects.json as a serial one.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Deque, Iterable, Iterator, Optional
+
+
+EXECUTOR_TYPES = ("thread", "process")
+ENGINES = ("sync", "async")
+
+
+def make_executor(workers: int, kind: str = "thread",
+                  initializer: Optional[Callable[..., None]] = None,
+                  initargs: tuple = ()) -> Executor:
+    """Build a thread or process pool with ``workers`` workers."""
+    if kind not in EXECUTOR_TYPES:
+        raise ValueError(f"Unknown executor type: {kind!r} (expected one of {', '.join(EXECUTOR_TYPES)})")
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+    return ThreadPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+
+
+def ordered_map(executor: Executor, func: Callable[..., Any], items: Iterable[Any],
+                queue_size: int) -> Iterator[Any]:
+    """Like ``executor.map`` but with at most ``queue_size`` tasks in flight.
+
+    Items are pulled lazily from ``items`` so a huge input never gets
+    submitted up front, and results come back in input order.
+    """
+    queue_size = max(1, queue_size)
+    pending: Deque[Any] = deque()
+    it = iter(items)
+
+    for item in it:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= queue_size:
+            break
+
+    while pending:
+        future = pending.popleft()
+        result = future.result()
+        for item in it:
+            pending.append(executor.submit(func, item))
+            break
+        yield result
+
+
+def async_ordered_map(func: Callable[[Any], Awaitable[Any]], items: Iterable[Any], concurrency: int,
+                      queue_size: int, executor: Optional[Executor] = None) -> Iterator[Any]:
+    """Run coroutine function ``func`` over ``items`` on a private event loop.
+
+    At most ``concurrency`` coroutines run at once (semaphore) and at most
+    ``queue_size`` are scheduled ahead; ``executor`` becomes the loop's
+    default executor, so ``asyncio.to_thread`` / ``run_in_executor(None, ...)``
+    offload blocking calls to it. Results are yielded in input order as soon
+    as they and everything before them are done.
+    """
+    # Imported here: asyncio is slow to import and only the async engine needs it
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    if executor is not None:
+        loop.set_default_executor(executor)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def guarded(item: Any) -> Any:
+        async with semaphore:
+            return await func(item)
+
+    pending: Deque[Any] = deque()
+    it = iter(items)
+    try:
+        for item in it:
+            pending.append(loop.create_task(guarded(item)))
+            if len(pending) >= max(1, queue_size):
+                break
+
+        while pending:
+            result = loop.run_until_complete(pending.popleft())
+            for item in it:
+                pending.append(loop.create_task(guarded(item)))
+                break
+            yield result
+    finally:
+        # Consumer stopped early (or failed): cancel whatever is still queued
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        loop.close()
@@ -0,0 +1,253 @@
+"""
+Per-stage timing and I/O instrumentation for project detection.
+
+When profiling is enabled (``generate --profile`` / ``--trace``) every
+_detect_project stage records, per project:
+
+- wall time
+- ``stat`` calls: os.stat / os.lstat (which pathlib also goes through) and
+  the os.DirEntry.stat() calls of the scandir walkers, which report them
+  with note_stat(); DirEntry.is_dir() / is_file() answers taken from the
+  directory listing cost no syscall and are not counted
+- ``open`` calls and directory listings (via a sys audit hook)
+- read syscalls and bytes read for the calling thread (from
+  /proc/thread-self/io on Linux; None elsewhere)
+
+Counters are thread-local, so parallel thread workers do not mix them up;
+process workers ship their spans back with the project record. I/O done by
+child processes (the git CLI) shows up as wall time only.
+
+The hooks are only in place between install() and uninstall() (or inside
+``with hooks():``): os.stat / os.lstat are restored afterwards and the
+per-thread /proc descriptors closed, so the rest of the process is not
+affected. The audit hook cannot be removed; outside a stage it returns
+immediately.
+
+ScanProfile aggregates the spans into a slowest projects / stages report
+and can write a Chrome trace event file (chrome://tracing, Perfetto).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+
+COUNTERS = ("stats", "opens", "listdirs", "reads", "bytes_read")
+
+_local = threading.local()
+_lock = threading.Lock()
+_depth = 0                        # install() calls not yet matched by uninstall()
+_audit_added = False
+_originals: Dict[str, Any] = {}   # os functions replaced while installed
+_io_fds: List[int] = []           # /proc/thread-self/io descriptors opened while installed
+_generation = 0                   # bumped by uninstall(); older per-thread descriptors are closed
+
+
+def install() -> None:
+    """Install the counting hooks (nestable; inert until a stage is active)."""
+    global _depth, _audit_added
+    with _lock:
+        _depth += 1
+        if _depth > 1:
+            return
+        if not _audit_added:
+            sys.addaudithook(_audit)
+            _audit_added = True
+        for name in ("stat", "lstat"):
+            _originals[name] = getattr(os, name)
+            setattr(os, name, _counting(_originals[name]))
+
+
+def uninstall() -> None:
+    """Undo the matching install(): restore os.stat / os.lstat and close the /proc descriptors."""
+    global _depth, _generation
+    with _lock:
+        if _depth == 0:
+            return
+        _depth -= 1
+        if _depth:
+            return
+        for name, func in _originals.items():
+            setattr(os, name, func)
+        _originals.clear()
+        for fd in _io_fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        _io_fds.clear()
+        _generation += 1
+
+
+@contextlib.contextmanager
+def hooks() -> Iterator[None]:
+    """install() for the duration of the block."""
+    install()
+    try:
+        yield
+    finally:
+        uninstall()
+
+
+def note_stat() -> None:
+    """Count a stat done without os.stat / os.lstat (os.DirEntry.stat()) in the active stage."""
+    counters = getattr(_local, "counters", None)
+    if counters is not None:
+        counters["stats"] += 1
+
+
+class StageProfiler:
+    """Collects the spans of one project's detection."""
+
+    def __init__(self) -> None:
+        self.spans: List[Dict[str, Any]] = []
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        counters = {key: 0 for key in COUNTERS[:3]}
+        previous = getattr(_local, "counters", None)
+        _local.counters = counters
+        io_before, io_len = _thread_io()
+        start = time.time()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - started
+            io_after, _ = _thread_io()
+            _local.counters = previous
+            span: Dict[str, Any] = {"stage": name, "start": start, "duration": duration}
+            span.update(counters)
+            if io_before is not None and io_after is not None:
+                # The first /proc read itself lands inside the window
+                span["reads"] = io_after["syscr"] - io_before["syscr"] - 1
+                span["bytes_read"] = io_after["rchar"] - io_before["rchar"] - io_len
+            else:
+                span["reads"] = span["bytes_read"] = None
+            span["pid"] = os.getpid()
+            span["tid"] = threading.get_ident()
+            self.spans.append(span)
+
+
+class ScanProfile:
+    """Spans of every project in a scan."""
+
+    def __init__(self) -> None:
+        self.projects: Dict[str, List[Dict[str, Any]]] = {}
+
+    def add(self, project_path: str, spans: List[Dict[str, Any]]) -> None:
+        self.projects[project_path] = spans
+
+    def report(self, top: int = 10) -> str:
+        if not self.projects:
+            return "No profile data collected"
+
+        stage_totals: Dict[str, Dict[str, Any]] = {}
+        project_totals = []
+        for path, spans in self.projects.items():
+            project_totals.append((sum(s["duration"] for s in spans), path, spans))
+            for span in spans:
+                total = stage_totals.setdefault(span["stage"], {"duration": 0.0, "count": 0, **{k: 0 for k in COUNTERS}})
+                total["duration"] += span["duration"]
+                total["count"] += 1
+                for key in COUNTERS:
+                    total[key] += span[key] or 0
+
+        lines = ["Slowest stages (all projects):",
+                 f"  {'stage':<12}{'total ms':>10}{'avg ms':>9}{'stat':>8}{'open':>7}{'list':>7}{'reads':>8}{'KiB read':>10}"]
+        for name, total in sorted(stage_totals.items(), key=lambda x: -x[1]["duration"]):
+            lines.append(
+                f"  {name:<12}{total['duration'] * 1000:>10.1f}{total['duration'] * 1000 / total['count']:>9.2f}"
+                f"{total['stats']:>8}{total['opens']:>7}{total['listdirs']:>7}{total['reads']:>8}"
+                f"{total['bytes_read'] / 1024:>10.1f}"
+            )
+
+        lines.append(f"\nSlowest projects (top {min(top, len(project_totals))}):")
+        for duration, path, spans in sorted(project_totals, key=lambda x: -x[0])[:top]:
+            worst = max(spans, key=lambda s: s["duration"])
+            lines.append(f"  {duration * 1000:>8.1f} ms  {os.path.basename(path)}  "
+                         f"(slowest: {worst['stage']} {worst['duration'] * 1000:.1f} ms)")
+        return "\n".join(lines)
+
+    def trace_events(self) -> List[Dict[str, Any]]:
+        """Chrome trace "complete" events, one per stage span."""
+        events = []
+        for path, spans in self.projects.items():
+            for span in spans:
+                events.append({
+                    "name": span["stage"],
+                    "cat": "stage",
+                    "ph": "X",
+                    "ts": span["start"] * 1e6,
+                    "dur": span["duration"] * 1e6,
+                    "pid": span["pid"],
+                    "tid": span["tid"],
+                    "args": {"project": path, **{k: span[k] for k in COUNTERS}},
+                })
+        return events
+
+    def write_trace(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f)
+
+
+# ----- Internal helpers -----
+def _audit(event: str, args: Any) -> None:
+    counters = getattr(_local, "counters", None)
+    if counters is None:
+        return
+    if event == "open":
+        counters["opens"] += 1
+    elif event in ("os.scandir", "os.listdir"):
+        counters["listdirs"] += 1
+
+
+def _counting(func):
+    def wrapper(*args, **kwargs):
+        counters = getattr(_local, "counters", None)
+        if counters is not None:
+            counters["stats"] += 1
+        return func(*args, **kwargs)
+    wrapper.__wrapped__ = func  # type: ignore[attr-defined]
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+
+def _thread_io() -> "tuple[Optional[Dict[str, int]], int]":
+    # Keep one /proc/thread-self/io descriptor per thread while installed and
+    # pread it, so sampling costs one read syscall and no open; uninstall()
+    # closes them all and bumps the generation
+    if not _depth:
+        return None, 0
+    fd = getattr(_local, "io_fd", None)
+    if fd is None or getattr(_local, "io_generation", None) != _generation:
+        try:
+            saved, _local.counters = getattr(_local, "counters", None), None
+            fd = os.open("/proc/thread-self/io", os.O_RDONLY)
+        except OSError:
+            fd = -1
+        finally:
+            _local.counters = saved
+        if fd >= 0:
+            with _lock:
+                _io_fds.append(fd)
+        _local.io_fd, _local.io_generation = fd, _generation
+    if fd < 0:
+        return None, 0
+    try:
+        data = os.pread(fd, 512, 0)
+    except OSError:
+        return None, 0
+    values = {}
+    for line in data.split(b"\n"):
+        key, _, value = line.partition(b":")
+        if value:
+            values[key.decode()] = int(value)
+    return values, len(data)
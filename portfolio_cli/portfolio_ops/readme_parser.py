@@ -1,17 +1,42 @@
 """
 README parsing utilities.
+
+The README is read once (up to a byte budget) and analyzed in a single
+pass over its lines: word count, first paragraph, headings, demo/badge
+links and image references are collected together. Lines inside fenced
+code blocks are not treated as headings, paragraphs, links or images.
 """
 
 from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import Dict, Any
+from typing import AbstractSet, Dict, Any, List, Optional
+
+
+README_NAMES = ["README.md", "readme.md", "Readme.md", "README.MD"]
+
+MAX_HEADINGS = 20
+MAX_IMAGES = 20
+PREVIEW_LENGTH = 300
+
+# Maximal \w runs: the same words as \b\w+\b, counted with subn() so no
+# list of matches is built
+_WORD = re.compile(r"\w+")
+_FENCE = re.compile(r"^\s{0,3}(```|~~~)")
+_DEMO = re.compile(r"(?i)(demo|live|preview)[^\n]*?(https?://\S+)")
+_BADGE = re.compile(r"\[!\[[^\]]*\]\([^)]*\)\]\((https?://\S+)\)")
+_IMAGE = re.compile(r"!\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+\"[^\"]*\")?\s*\)|<img\s[^>]*?src=[\"']([^\"']+)[\"']", re.I)
+_SPACE = re.compile(r"\s+")
 
 
 class ReadmeParser:
-    def parse(self, directory: Path) -> Dict[str, Any]:
-        readme_path = self._find_readme(directory)
+    def __init__(self, max_bytes: int = 512 * 1024) -> None:
+        # Larger READMEs are analyzed (and stored) up to this many bytes
+        self.max_bytes = max_bytes
+
+    def parse(self, directory: Path, files: Optional[AbstractSet[str]] = None) -> Dict[str, Any]:
+        readme_path = self._find_readme(directory, files)
         if not readme_path:
             return {
                 "exists": False,
@@ -21,64 +46,104 @@ class ReadmeParser:
                 "headings": [],
                 "has_demo": False,
                 "demo_url": None,
+                "images": [],
                 "word_count": 0,
+                "truncated": False,
             }
 
-        content = readme_path.read_text(encoding="utf-8", errors="ignore")
-        preview = self._extract_preview(content)
-        headings = self._extract_headings(content)
-        demo_url = self._extract_demo_url(content)
-        words = len(re.findall(r"\b\w+\b", content))
+        with open(readme_path, "rb") as f:
+            data = f.read(self.max_bytes + 1)
+        truncated = len(data) > self.max_bytes
+        content = data[:self.max_bytes].decode("utf-8", errors="ignore")
 
-        return {
+        result = self.analyze(content)
+        result.update({
             "exists": True,
             "path": str(readme_path.name),
             "content": content,
-            "preview": preview,
+            "truncated": truncated,
+        })
+        return result
+
+    def analyze(self, content: str) -> Dict[str, Any]:
+        """Single pass over ``content`` collecting every README summary field."""
+        words = 0
+        headings: List[str] = []
+        images: List[str] = []
+        paragraph: List[str] = []
+        preview: Optional[str] = None
+        demo_url: Optional[str] = None
+        badge_url: Optional[str] = None
+        fence: Optional[str] = None
+
+        for line in content.splitlines():
+            words += _WORD.subn("", line)[1]
+
+            # Fenced code: only the closing fence matters until it arrives
+            marker = _FENCE.match(line)
+            if fence is not None:
+                if marker and marker.group(1) == fence:
+                    fence = None
+                continue
+            if marker:
+                fence = marker.group(1)
+                if paragraph and preview is None:
+                    preview = " ".join(paragraph)
+                paragraph = []
+                continue
+
+            if demo_url is None:
+                m = _DEMO.search(line)
+                if m:
+                    demo_url = m.group(2)
+            if badge_url is None:
+                m = _BADGE.search(line)
+                if m:
+                    badge_url = m.group(1)
+            if len(images) < MAX_IMAGES and ("![" in line or "<img" in line.lower()):
+                for m in _IMAGE.finditer(line):
+                    images.append(m.group(1) or m.group(2))
+
+            stripped = line.strip()
+            if stripped.startswith("#"):
+                title = line.lstrip("# ").strip()
+                if title and len(headings) < MAX_HEADINGS:
+                    headings.append(title)
+                if preview is None and paragraph:
+                    preview = " ".join(paragraph)
+                paragraph = []
+                continue
+
+            if preview is None:
+                if stripped:
+                    paragraph.append(stripped)
+                    # Enough text for the preview; the rest of the paragraph is irrelevant
+                    if sum(map(len, paragraph)) > PREVIEW_LENGTH:
+                        preview = " ".join(paragraph)
+                elif paragraph:
+                    preview = " ".join(paragraph)
+                    paragraph = []
+
+        if preview is None and paragraph:
+            preview = " ".join(paragraph)
+        demo_url = demo_url or badge_url
+
+        return {
+            "preview": _SPACE.sub(" ", preview or "")[:PREVIEW_LENGTH],
             "headings": headings,
             "has_demo": bool(demo_url),
             "demo_url": demo_url,
+            "images": images[:MAX_IMAGES],
             "word_count": words,
         }
 
-    def _find_readme(self, directory: Path) -> Path | None:
-        for name in ["README.md", "readme.md", "Readme.md", "README.MD"]:
+    def _find_readme(self, directory: Path, files: Optional[AbstractSet[str]] = None) -> Path | None:
+        for name in README_NAMES:
+            if files is not None:
+                if name in files:
+                    return directory / name
+                continue
             p = directory / name
             if p.exists():
                 return p
         return None
-
-    def _extract_preview(self, content: str) -> str:
-        # First non-empty paragraph
-        for block in content.split("\n\n"):
-            text = block.strip()
-            if text and not text.startswith("#"):
-                # Collapse whitespace
-                return re.sub(r"\s+", " ", text)[:300]
-        return ""
-
-    def _extract_headings(self, content: str) -> list[str]:
-        headings: list[str] = []
-        for line in content.splitlines():
-            if line.lstrip().startswith("#"):
-                title = line.lstrip("# ").strip()
-                if title:
-                    headings.append(title)
-        return headings[:20]
-
-    def _extract_demo_url(self, content: str) -> str | None:
-        # Look for lines containing demo/live/preview and a URL
-        demo_patterns = [
-            r"(?i)(demo|live|preview)[^\n]*?(https?://\S+)",
-        ]
-        for pat in demo_patterns:
-            m = re.search(pat, content)
-            if m:
-                return m.group(2)
-        # Fallback: detect a likely demo badge link
-        m = re.search(r"\[!\[[^\]]*\]\([^)]*\)\]\((https?://\S+)\)", content)
-        if m:
-            return m.group(1)
-        return None
-
-
@@ -3,14 +3,43 @@ Core scanning logic for Portfolio-OPs
 """
 
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import AbstractSet, List, Dict, Iterator, Optional, Tuple
 from datetime import datetime
+from functools import partial
+import asyncio
+import contextlib
 import hashlib
 
 from .detectors import LanguageDetector
+from .manifest_cache import ManifestCache
 from .readme_parser import ReadmeParser
 from .asset_finder import AssetFinder
 from .git_analyzer import GitAnalyzer
+from .discovery import ProjectCandidate, ProjectDiscovery, list_directory
+from .fingerprint import Fingerprinter, STAGES
+from .stats import StatsCounter
+from .pipeline import ENGINES, async_ordered_map, make_executor, ordered_map
+from .profiling import ScanProfile, StageProfiler, hooks as profiling_hooks, install as install_profiling
+from .sharding import shard_of
+
+
+# Per-process scanner used when detection runs in a process pool
+_worker_scanner = None
+
+
+def _init_worker(config, profiling: bool = False, manifests: Optional[Dict] = None) -> None:
+    global _worker_scanner
+    _worker_scanner = PortfolioScanner(config)
+    _worker_scanner.manifests.update(manifests or {})
+    if profiling:
+        # Hooks stay installed for the worker process's lifetime
+        install_profiling()
+        _worker_scanner.enable_profiling()
+
+
+def _detect_in_worker(item: Tuple[ProjectCandidate, Optional[Dict]], verbose: bool = False) -> Optional[Dict]:
+    candidate, cached = item
+    return _worker_scanner._detect_candidate(candidate, verbose, cached)
 
 
 class PortfolioScanner:
@@ -19,14 +48,50 @@ class PortfolioScanner:
     def __init__(self, config):
         self.config = config
         self.ignore_dirs = set(config.ignore_dirs)
+        if config.engine not in ENGINES:
+            raise ValueError(f"Unknown scan engine: {config.engine!r} (expected one of {', '.join(ENGINES)})")
         
         # Initialize components
-        self.language_detector = LanguageDetector()
-        self.readme_parser = ReadmeParser()
-        self.asset_finder = AssetFinder()
-        self.git_analyzer = GitAnalyzer()
-        
-    def scan(self, root_path: Path, max_depth: int = 3, verbose: bool = False) -> List[Dict]:
+        self.manifests = ManifestCache()
+        self.language_detector = LanguageDetector(self.manifests, config.detectors)
+        self.readme_parser = ReadmeParser(max_bytes=config.readme_max_kb * 1024)
+        self.asset_finder = AssetFinder(config.screenshot_dirs, config.ignore_dirs)
+        self.git_analyzer = GitAnalyzer(config.git_backend, activity=config.git_activity)
+        # Markers of every registered detector also identify project roots
+        file_patterns = dict(config.file_patterns)
+        for language, markers in self.language_detector.registry.marker_patterns.items():
+            file_patterns[language] = list(dict.fromkeys(file_patterns.get(language, []) + markers))
+        self.discovery = ProjectDiscovery(config.ignore_dirs, file_patterns)
+        # The data directory may live inside a scanned project (e.g. a
+        # frontend's public/ folder); its files are ours, not the project's
+        exclude_paths = [config.output_dir]
+        self.fingerprinter = Fingerprinter(
+            config.ignore_dirs,
+            marker_names=self.discovery.marker_names,
+            screenshot_dirs=config.screenshot_dirs,
+            include_inode=config.fingerprint_inode,
+            exclude_paths=exclude_paths,
+        )
+        
+        self.stats_counter = StatsCounter(
+            config.ignore_dirs,
+            max_file_size_kb=config.max_file_size_kb,
+            breakdown=config.loc_breakdown,
+            exclude_paths=exclude_paths,
+        )
+        
+        # Stage fingerprints of the last scan, keyed by project path (for cache.json)
+        self.fingerprints: Dict[str, Dict[str, str]] = {}
+        
+        # Per-stage timing and I/O of the last scan (see enable_profiling)
+        self.profile: Optional[ScanProfile] = None
+        
+    def enable_profiling(self) -> None:
+        """Record wall time and I/O of every detection stage in self.profile"""
+        self.profile = ScanProfile()
+        
+    def scan(self, root_path: Path, max_depth: int = 3, verbose: bool = False,
+             workers: Optional[int] = None) -> List[Dict]:
         """
         Full scan of directory tree
         
@@ -34,27 +99,47 @@ class PortfolioScanner:
             root_path: Root directory to scan
             max_depth: Maximum depth to traverse
             verbose: Print detailed progress
+            workers: Number of detection workers (defaults to scanner.workers)
             
         Returns:
             List of project dictionaries
         """
+        return list(self.iter_scan(root_path, max_depth, verbose, workers))
+        
+    def iter_scan(self, root_path: Path, max_depth: int = 3, verbose: bool = False,
+                  workers: Optional[int] = None, shard: Optional[Tuple[int, int]] = None,
+                  history: Optional[Dict] = None) -> Iterator[Dict]:
+        """
+        Full scan that yields each project as soon as it is detected
+        
+        self.fingerprints is filled in as projects are yielded. ``shard``
+        (index, count) keeps only the project directories of that shard
+        (see sharding.py). ``history`` is the previous scan cache: every
+        stage is still recomputed, but the git stage starts from the
+        cached git block, so history and activity are extended from the
+        last analyzed sha instead of re-read.
+        """
         print(f"Scanning: {root_path}")
         project_dirs = self._find_project_directories(root_path, max_depth, verbose)
         
         print(f"Found {len(project_dirs)} project directories")
-        
-        projects = []
-        for idx, project_dir in enumerate(project_dirs, 1):
-            if verbose:
-                print(f"[{idx}/{len(project_dirs)}] Processing: {project_dir.name}")
-                
-            project = self._detect_project(project_dir, verbose)
+        if shard is not None:
+            index, count = shard
+            project_dirs = [c for c in project_dirs if shard_of(c.path, root_path, count) == index]
+            print(f"Shard {index}/{count}: {len(project_dirs)} project directories")
+        
+        self.fingerprints.clear()
+        if self.profile is not None:
+            self.profile = ScanProfile()
+        history = history or {}
+        items = [(candidate, self._git_only(history.get(str(candidate.path)))) for candidate in project_dirs]
+        for project in self._detect_projects(items, verbose, workers):
             if project:
-                projects.append(project)
-                
-        return projects
+                self._pop_fingerprints(project)
+                yield project
         
-    def incremental_scan(self, root_path: Path, cache: Dict, verbose: bool = False) -> List[Dict]:
+    def incremental_scan(self, root_path: Path, cache: Dict, verbose: bool = False,
+                         workers: Optional[int] = None) -> List[Dict]:
         """
         Incremental scan - only process changed projects
         
@@ -62,186 +147,357 @@ class PortfolioScanner:
             root_path: Root directory to scan
             cache: Previous scan cache
             verbose: Print detailed progress
+            workers: Number of detection workers (defaults to scanner.workers)
             
         Returns:
             List of all projects (unchanged + updated)
         """
+        return list(self.iter_incremental_scan(root_path, cache, verbose, workers))
+        
+    def iter_incremental_scan(self, root_path: Path, cache: Dict, verbose: bool = False,
+                              workers: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Incremental scan that yields each project as soon as it is processed
+        """
         print(f"Incremental scan: {root_path}")
         
         project_dirs = self._find_project_directories(root_path, self.config.max_depth, verbose)
         
-        projects = []
+        # Every project is fingerprinted (stat only); stages whose inputs
+        # match the cached fingerprints are reused instead of recomputed
+        self.fingerprints.clear()
+        if self.profile is not None:
+            self.profile = ScanProfile()
         new_count = 0
         updated_count = 0
         unchanged_count = 0
         
-        for project_dir in project_dirs:
-            project_path = str(project_dir)
+        items = [(candidate, cache.get(str(candidate.path))) for candidate in project_dirs]
+        for (candidate, cached), project in zip(items, self._detect_projects(items, verbose, workers)):
+            if not project:
+                continue
+            stages = self._pop_fingerprints(project)
             
-            # Check if project exists in cache
-            if project_path in cache:
-                cached_data = cache[project_path]
-                current_mtime = self._get_directory_mtime(project_dir)
-                
-                # If unchanged, use cached data
-                if current_mtime <= cached_data.get('last_modified'):
-                    if verbose:
-                        print(f"  Unchanged: {project_dir.name}")
-                    # Load from cache
-                    projects.append(cached_data.get('project_data'))
-                    unchanged_count += 1
-                    continue
-                else:
-                    if verbose:
-                        print(f"  Updated: {project_dir.name}")
-                    updated_count += 1
-            else:
+            if cached is None:
                 if verbose:
-                    print(f"  New: {project_dir.name}")
+                    print(f"  New: {candidate.name}")
                 new_count += 1
-                
-            # Scan project
-            project = self._detect_project(project_dir, verbose)
-            if project:
-                projects.append(project)
+            elif stages:
+                if verbose:
+                    print(f"  Updated: {candidate.name} ({', '.join(stages)})")
+                updated_count += 1
+            else:
+                if verbose:
+                    print(f"  Unchanged: {candidate.name}")
+                unchanged_count += 1
+            yield project
                 
         print(f"\nResults: {new_count} new, {updated_count} updated, {unchanged_count} unchanged")
         
-        return projects
+    def refresh_project(self, directory: Path, cached: Optional[Dict] = None,
+                        verbose: bool = False) -> Tuple[Optional[Dict], List[str]]:
+        """
+        Re-detect a single project, recomputing only stages whose inputs changed
         
-    def _find_project_directories(self, root_path: Path, max_depth: int, verbose: bool) -> List[Path]:
+        Returns:
+            (project or None if it is gone / no longer a project, recomputed stages)
         """
-        Recursively find all project directories
+        candidate = self.discovery.candidate(directory)
+        if candidate is None:
+            self.fingerprints.pop(str(directory), None)
+            return None, []
+            
+        project = self._detect_candidate(candidate, verbose, cached)
+        if not project:
+            self.fingerprints.pop(str(directory), None)
+            return None, []
+        return project, self._pop_fingerprints(project)
+        
+    def _detect_projects(self, items: List[Tuple[ProjectCandidate, Optional[Dict]]], verbose: bool = False,
+                         workers: Optional[int] = None) -> Iterator[Optional[Dict]]:
+        """
+        Run _detect_candidate over many (candidate, cache entry) pairs,
+        serially or in a worker pool
         
-        A directory is considered a project if it contains known project files
+        Results are yielded in the same order as items (None for
+        directories that could not be detected). When profiling, the
+        counting hooks are installed for this run only.
         """
-        project_dirs = []
+        with profiling_hooks() if self.profile is not None else contextlib.nullcontext():
+            yield from self._run_detection(items, verbose, workers)
+            
+    def _run_detection(self, items: List[Tuple[ProjectCandidate, Optional[Dict]]], verbose: bool = False,
+                       workers: Optional[int] = None) -> Iterator[Optional[Dict]]:
+        if self.config.engine == "async":
+            yield from self._detect_projects_async(items, verbose, workers)
+            return
+            
+        workers = workers or self.config.workers
+        total = len(items)
         
-        def traverse(current_path: Path, depth: int):
-            if depth > max_depth:
-                return
-                
-            try:
-                for item in current_path.iterdir():
-                    if not item.is_dir():
-                        continue
-                        
-                    # Skip ignored directories
-                    if item.name in self.ignore_dirs:
-                        continue
-                        
-                    # Check if it's a project directory
-                    if self._is_project_directory(item):
-                        project_dirs.append(item)
-                        if verbose:
-                            print(f"  Found project: {item.name}")
-                    else:
-                        # Recurse deeper
-                        traverse(item, depth + 1)
-                        
-            except PermissionError:
+        if workers <= 1 or total <= 1:
+            for idx, (candidate, cached) in enumerate(items, 1):
                 if verbose:
-                    print(f"  Permission denied: {current_path}")
-                    
-        traverse(root_path, 0)
-        return project_dirs
-        
-    def _is_project_directory(self, directory: Path) -> bool:
-        """Check if directory contains project marker files"""
-        marker_files = [
-            'package.json',      # JavaScript/Node
-            'requirements.txt',  # Python
-            'setup.py',          # Python
-            'pyproject.toml',    # Python
-            'pubspec.yaml',      # Dart/Flutter
-            'Cargo.toml',        # Rust
-            'go.mod',            # Go
-            'pom.xml',           # Java/Maven
-            'build.gradle',      # Java/Gradle
-            'Gemfile',           # Ruby
-            'composer.json',     # PHP
-        ]
+                    print(f"[{idx}/{total}] Processing: {candidate.name}")
+                yield self._detect_candidate(candidate, verbose, cached)
+            return
+            
+        kind = self.config.executor
+        if verbose:
+            print(f"Detecting with {workers} {kind} workers")
+            
+        if kind == "process":
+            executor = make_executor(workers, kind, initializer=_init_worker,
+                                     initargs=(self.config, self.profile is not None, self.manifests.entries))
+            func = partial(_detect_in_worker, verbose=verbose)
+        else:
+            executor = make_executor(workers, kind)
+            func = partial(self._detect_item, verbose=verbose)
+            
+        queue_size = self.config.queue_size or workers * 4
+        with executor:
+            for idx, project in enumerate(ordered_map(executor, func, items, queue_size), 1):
+                if verbose:
+                    print(f"[{idx}/{total}] Processed: {items[idx - 1][0].name}")
+                yield project
         
-        for marker in marker_files:
-            if (directory / marker).exists():
-                return True
-                
-        # Also check for .csproj files (C#)
-        for file in directory.glob('*.csproj'):
-            return True
+    def _detect_projects_async(self, items: List[Tuple[ProjectCandidate, Optional[Dict]]], verbose: bool = False,
+                               concurrency: Optional[int] = None) -> Iterator[Optional[Dict]]:
+        """
+        Async engine: up to ``concurrency`` projects in flight, the stages of
+        each overlapping on a thread pool; yields in input order
+        """
+        concurrency = concurrency or self.config.concurrency
+        total = len(items)
+        if verbose:
+            print(f"Detecting with async engine (concurrency {concurrency})")
             
-        return False
+        def detect(item: Tuple[ProjectCandidate, Optional[Dict]]):
+            candidate, cached = item
+            return self._detect_project_async(candidate, verbose, cached)
+            
+        queue_size = self.config.queue_size or concurrency * 4
+        with make_executor(concurrency, "thread") as executor:
+            results = async_ordered_map(detect, items, concurrency, queue_size, executor)
+            for idx, project in enumerate(results, 1):
+                if verbose:
+                    print(f"[{idx}/{total}] Processed: {items[idx - 1][0].name}")
+                yield project
+                
+    def _find_project_directories(self, root_path: Path, max_depth: int, verbose: bool) -> List[ProjectCandidate]:
+        """
+        Recursively find all project directories
         
-    def _detect_project(self, directory: Path, verbose: bool = False) -> Optional[Dict]:
+        A directory is considered a project if it contains known project files
+        (built-in markers plus scanner.file_patterns). Each candidate carries
+        its directory listing so detection does not stat marker files again.
+        """
+        return self.discovery.find(root_path, max_depth, verbose)
+        
+    def _detect_item(self, item: Tuple[ProjectCandidate, Optional[Dict]], verbose: bool = False) -> Optional[Dict]:
+        candidate, cached = item
+        return self._detect_candidate(candidate, verbose, cached)
+        
+    def _detect_candidate(self, candidate: ProjectCandidate, verbose: bool = False,
+                          cached: Optional[Dict] = None) -> Optional[Dict]:
+        """Detect a discovered project, reusing its directory listing"""
+        return self._detect_project(candidate.path, verbose, files=candidate.files, cached=cached)
+        
+    @staticmethod
+    def _git_only(cached: Optional[Dict]) -> Optional[Dict]:
+        """Cache entry carrying only the previous git block (no fingerprints, so no stage is reused)"""
+        git = ((cached or {}).get('project_data') or {}).get('git')
+        return {'project_data': {'git': git}} if git else None
+        
+    def _pop_fingerprints(self, project: Dict) -> List[str]:
+        """Move scan bookkeeping off a project record; returns the recomputed stages"""
+        fingerprints = project.pop('_fingerprints', None)
+        if fingerprints:
+            self.fingerprints[project['path']] = fingerprints
+        spans = project.pop('_profile', None)
+        if spans is not None and self.profile is not None:
+            self.profile.add(project['path'], spans)
+        # Manifests parsed in a worker process (a no-op for thread workers)
+        self.manifests.update(project.pop('_manifests', {}))
+        return project.pop('_stages', [])
+        
+    def _detect_project(self, directory: Path, verbose: bool = False,
+                        files: Optional[AbstractSet[str]] = None,
+                        cached: Optional[Dict] = None) -> Optional[Dict]:
         """
         Detect and extract all information about a project
         
+        Args:
+            directory: Project directory
+            verbose: Print detailed progress
+            files: File names directly inside directory, if already listed
+            cached: Previous cache.json entry; stages whose input
+                fingerprints are unchanged are copied from it
+            
         Returns:
             Complete project dictionary or None if detection fails
         """
+        profiler = StageProfiler() if self.profile is not None else None
+        
         try:
-            # 1. Detect language and framework
-            detection = self.language_detector.detect(directory)
+            if files is None:
+                files = list_directory(directory)[0]
+                
+            fingerprints, previous, stages = self._plan_stages(directory, files, cached, profiler)
             
-            if not detection:
-                if verbose:
-                    print(f"    Could not detect language for: {directory.name}")
-                return None
+            # Nothing changed: serve the cached record without reading any file
+            if not stages:
+                return self._reuse_cached(previous, fingerprints, profiler)
                 
-            # 2. Parse README
-            readme_data = self.readme_parser.parse(directory)
+            results = {
+                name: self._run_stage(name, directory, files, previous, stages, profiler)
+                for name in STAGES
+            }
+            return self._build_project(directory, files, results, previous, fingerprints, stages, profiler, verbose)
             
-            # 3. Find assets (screenshots, logos)
-            assets = self.asset_finder.find_assets(directory, self.config.output_dir)
+        except Exception as e:
+            if verbose:
+                print(f"    Error detecting project: {e}")
+            return None
             
-            # 4. Extract git metadata
-            git_data = self.git_analyzer.analyze(directory)
+    async def _detect_project_async(self, candidate: ProjectCandidate, verbose: bool = False,
+                                    cached: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Async _detect_project: the changed stages of one project run
+        concurrently, each offloaded to the event loop's default executor
+        """
+        directory, files = candidate.path, candidate.files
+        profiler = StageProfiler() if self.profile is not None else None
+        run = asyncio.to_thread
+        
+        try:
+            fingerprints, previous, stages = await run(self._plan_stages, directory, files, cached, profiler)
+            if not stages:
+                return self._reuse_cached(previous, fingerprints, profiler)
+                
+            # Unchanged stages are plain copies; only changed ones go to the executor
+            results = {
+                name: self._run_stage(name, directory, files, previous, stages)
+                for name in STAGES if name not in stages
+            }
+            values = await asyncio.gather(*(
+                run(self._run_stage, name, directory, files, previous, stages, profiler)
+                for name in stages
+            ))
+            results.update(zip(stages, values))
+            return await run(self._build_project, directory, files, results, previous,
+                             fingerprints, stages, profiler, verbose)
             
-            # 5. Calculate stats
-            stats = self._calculate_stats(directory)
+        except Exception as e:
+            if verbose:
+                print(f"    Error detecting project: {e}")
+            return None
             
-            # 6. Build project object
-            project = {
-                'id': self._generate_id(directory),
-                'name': self._get_project_name(directory, detection),
-                'path': str(directory),
-                'slug': self._generate_slug(directory.name),
+    def _plan_stages(self, directory: Path, files: AbstractSet[str], cached: Optional[Dict],
+                     profiler: Optional[StageProfiler] = None) -> Tuple[Dict[str, str], Dict, List[str]]:
+        """Fingerprint a project; returns (fingerprints, previous record, stages to recompute)"""
+        with profiler.stage('fingerprint') if profiler else contextlib.nullcontext():
+            fingerprints = self.fingerprinter.compute(directory, files)
+        previous = (cached or {}).get('project_data') or {}
+        old_fingerprints = (cached or {}).get('fingerprints') or {}
+        stages = [
+            stage for stage in STAGES
+            if not previous or old_fingerprints.get(stage) != fingerprints[stage]
+        ]
+        return fingerprints, previous, stages
+        
+    def _reuse_cached(self, previous: Dict, fingerprints: Dict[str, str],
+                      profiler: Optional[StageProfiler] = None) -> Dict:
+        project = dict(previous)
+        project['_fingerprints'] = fingerprints
+        project['_stages'] = []
+        if profiler:
+            project['_profile'] = profiler.spans
+        return project
+        
+    def _run_stage(self, name: str, directory: Path, files: AbstractSet[str], previous: Dict,
+                   stages: List[str], profiler: Optional[StageProfiler] = None):
+        """Compute one detection stage, or copy it from the previous record if its inputs are unchanged"""
+        if name not in stages:
+            return dict(previous['metadata']) if name == 'detect' else previous[name]
+            
+        with profiler.stage(name) if profiler else contextlib.nullcontext():
+            # Detect language and framework
+            if name == 'detect':
+                return self.language_detector.detect(directory, files) or self._detect_from_patterns(files)
                 
-                'metadata': {
-                    'language': detection['language'],
-                    'framework': detection['framework'],
-                    'type': detection['type'],
-                    'tags': detection['tags'],
-                },
+            # Parse README
+            if name == 'readme':
+                return self.readme_parser.parse(directory, files)
                 
-                'readme': readme_data,
-                'assets': assets,
-                'git': git_data,
-                'stats': stats,
+            # Find assets (screenshots, logos)
+            if name == 'assets':
+                return self.asset_finder.find_assets(directory, self.config.output_dir, files)
                 
-                'display': {
-                    'featured': self._should_be_featured(git_data, stats),
-                    'priority': 0,
-                    'category': self._infer_category(detection),
-                    'status': self._determine_status(git_data),
-                    'visibility': 'public',
-                    'custom_description': None,
-                },
+            # Extract git metadata
+            if name == 'git':
+                return self.git_analyzer.analyze(directory, previous.get('git'))
                 
-                'timestamps': {
-                    'created': self._get_creation_date(directory, git_data),
-                    'modified': self._get_directory_mtime(directory),
-                    'last_scanned': datetime.now().isoformat(),
-                }
-            }
+            # Calculate stats
+            return self._calculate_stats(directory)
             
-            return project
-            
-        except Exception as e:
+    def _build_project(self, directory: Path, files: AbstractSet[str], results: Dict, previous: Dict,
+                       fingerprints: Dict[str, str], stages: List[str],
+                       profiler: Optional[StageProfiler] = None, verbose: bool = False) -> Optional[Dict]:
+        """Assemble the project record from per-stage results"""
+        detection = results['detect']
+        if not detection:
             if verbose:
-                print(f"    Error detecting project: {e}")
+                print(f"    Could not detect language for: {directory.name}")
             return None
+        name = self._get_project_name(directory, detection, files) if 'detect' in stages else previous['name']
+        git_data = results['git']
+        stats = results['stats']
+        
+        project = {
+            'id': self._generate_id(directory),
+            'name': name,
+            'path': str(directory),
+            'slug': self._generate_slug(directory.name),
+            
+            'metadata': {
+                'language': detection['language'],
+                'languages': detection.get('languages') or [detection['language']],
+                'framework': detection['framework'],
+                'type': detection['type'],
+                'tags': detection['tags'],
+            },
+            
+            'readme': results['readme'],
+            'assets': results['assets'],
+            'git': git_data,
+            'stats': stats,
+            
+            'display': {
+                'featured': self._should_be_featured(git_data, stats),
+                'priority': 0,
+                'category': self._infer_category(detection),
+                'status': self._determine_status(git_data),
+                'visibility': 'public',
+                'custom_description': None,
+            },
+            
+            'timestamps': {
+                'created': self._get_creation_date(directory, git_data),
+                'modified': self._get_directory_mtime(directory),
+                'last_scanned': datetime.now().isoformat(),
+            },
+            
+            '_fingerprints': fingerprints,
+            '_stages': stages,
+        }
+        if 'detect' in stages and self is _worker_scanner:
+            project['_manifests'] = self.manifests.for_directory(directory)
+        if profiler:
+            project['_profile'] = profiler.spans
             
+        return project
+        
     def _generate_id(self, directory: Path) -> str:
         """Generate unique project ID"""
         path_str = str(directory.absolute())
@@ -254,34 +510,39 @@ class PortfolioScanner:
         slug = ''.join(c for c in slug if c.isalnum() or c == '-')
         return slug
         
-    def _get_project_name(self, directory: Path, detection: Dict) -> str:
+    def _detect_from_patterns(self, files: AbstractSet[str]) -> Optional[Dict]:
+        """Fallback detection for projects matched only by scanner.file_patterns"""
+        language = self.discovery.pattern_language(files)
+        if not language:
+            return None
+        return {
+            'language': language.title(),
+            'framework': language.title(),
+            'type': 'Other',
+            'tags': [language.lower()],
+            'languages': [language.title()],
+        }
+        
+    def _get_project_name(self, directory: Path, detection: Dict,
+                          files: Optional[AbstractSet[str]] = None) -> str:
         """
         Extract project name from various sources
         Priority: package.json > directory name
         """
-        # Try to get name from package.json
-        package_json = directory / 'package.json'
-        if package_json.exists():
-            import json
-            try:
-                with open(package_json) as f:
-                    data = json.load(f)
-                    if 'name' in data:
-                        return data['name'].replace('-', ' ').title()
-            except:
-                pass
+        def has(name: str) -> bool:
+            return name in files if files is not None else (directory / name).exists()
+            
+        # Try to get name from package.json (parsed once, shared with the detector)
+        if has('package.json'):
+            name = (self.manifests.get(directory / 'package.json') or {}).get('name')
+            if name:
+                return name.replace('-', ' ').title()
                 
         # Try to get from pubspec.yaml
-        pubspec = directory / 'pubspec.yaml'
-        if pubspec.exists():
-            try:
-                import yaml
-                with open(pubspec) as f:
-                    data = yaml.safe_load(f)
-                    if data and 'name' in data:
-                        return data['name'].replace('_', ' ').title()
-            except:
-                pass
+        if has('pubspec.yaml'):
+            name = (self.manifests.get(directory / 'pubspec.yaml') or {}).get('name')
+            if name:
+                return name.replace('_', ' ').title()
                 
         # Fallback to directory name
         return directory.name.replace('-', ' ').replace('_', ' ').title()
@@ -298,24 +559,9 @@ class PortfolioScanner:
             'documentation_completeness': 0,
         }
         
-        # Count files and lines of code (excluding common ignored dirs)
-        code_extensions = {'.js', '.ts', '.py', '.dart', '.rs', '.go', '.java', '.php', '.rb'}
+        # Count files and lines of code (ignored dirs are pruned during the walk)
+        stats.update(self.stats_counter.count(directory))
         
-        for file_path in directory.rglob('*'):
-            if file_path.is_file():
-                # Skip ignored directories
-                if any(ignored in file_path.parts for ignored in self.ignore_dirs):
-                    continue
-                    
-                stats['file_count'] += 1
-                
-                if file_path.suffix in code_extensions:
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            stats['lines_of_code'] += len(f.readlines())
-                    except:
-                        pass
-                        
         # Calculate documentation completeness (0-100)
         doc_score = 0
         if (directory / 'README.md').exists():
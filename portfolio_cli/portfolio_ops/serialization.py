@@ -0,0 +1,152 @@
+"""
+JSON serialization and crash-safe file writes.
+
+Uses orjson or msgspec when installed (both are optional) and falls back to
+the standard library. Output is either ``pretty`` (2-space indent, byte for
+byte what json.dumps(obj, indent=2, ensure_ascii=False) produces for the
+data we write) or ``compact`` for machine consumers.
+
+Files are written to a temporary sibling, fsynced and renamed over the
+target, so readers never observe a truncated file. AtomicWriter does the
+same for output produced incrementally.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, BinaryIO, Optional, Union
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+try:
+    import msgspec  # type: ignore
+except Exception:  # pragma: no cover
+    msgspec = None  # type: ignore
+
+
+SERIALIZERS = ("auto", "orjson", "msgspec", "json")
+FORMATS = ("pretty", "compact")
+
+
+def resolve_serializer(name: str = "auto") -> str:
+    """Return the backend to use for ``name``, falling back to ``json``."""
+    if name not in SERIALIZERS:
+        raise ValueError(f"Unknown serializer: {name!r} (expected one of {', '.join(SERIALIZERS)})")
+    if name in ("auto", "orjson") and orjson is not None:
+        return "orjson"
+    if name in ("auto", "msgspec") and msgspec is not None:
+        return "msgspec"
+    return "json"
+
+
+def dumps(obj: Any, pretty: bool = True, serializer: str = "json") -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes with the given backend."""
+    if serializer == "orjson":
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if serializer == "msgspec":
+        data = msgspec.json.encode(obj)
+        return msgspec.json.format(data, indent=2) if pretty else data
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class AtomicWriter:
+    """Stream bytes into ``path`` atomically.
+
+    Data goes to a temporary sibling; on a clean exit it is fsynced and
+    renamed over ``path``, on an exception it is discarded and ``path`` is
+    left untouched.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.bytes_written = 0
+        self._file: Optional[BinaryIO] = None
+        self._tmp: Optional[str] = None
+
+    def __enter__(self) -> "AtomicWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp = tempfile.mkstemp(prefix=f".{self.path.name}.", suffix=".tmp", dir=str(self.path.parent))
+        self._file = os.fdopen(fd, "wb")
+        return self
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+        self.bytes_written += len(data)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self._discard()
+            return
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            try:
+                mode = self.path.stat().st_mode & 0o777
+            except OSError:
+                mode = 0o644
+            os.chmod(self._tmp, mode)
+            os.replace(self._tmp, self.path)
+        except BaseException:
+            self._discard()
+            raise
+        _fsync_dir(self.path.parent)
+
+    def _discard(self) -> None:
+        self._file.close()
+        try:
+            os.unlink(self._tmp)
+        except OSError:
+            pass
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` atomically (temp file + fsync + rename)."""
+    with AtomicWriter(path) as f:
+        f.write(data)
+
+
+def link_or_copy(source: Path, dest: Path) -> bool:
+    """Hard-link (or else copy) ``source`` to ``dest`` unless ``dest`` exists; True if placed."""
+    if dest.exists():
+        return False
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(source, dest)
+        return True
+    except FileExistsError:
+        return False
+    except OSError:
+        pass
+    with open(source, "rb") as f, AtomicWriter(dest) as out:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            out.write(chunk)
+    return True
+
+
+def _fsync_dir(directory: Path) -> None:
+    # Persist the rename itself; not supported on every platform
+    try:
+        fd = os.open(str(directory), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,132 @@
+"""
+Sharded scanning and merging of shard outputs.
+
+``generate --shard i/N`` (1 <= i <= N) scans only the discovered project
+directories whose stable hash falls into shard i. The hash is taken over
+the path relative to the scan root, so every shard of one tree sees the
+same discovery result and the split does not depend on where the tree is
+mounted. Each shard writes a complete data directory under
+``<data_dir>/shards/<i>-of-<N>/``.
+
+``merge`` combines one complete set of shard data directories (1..N for a
+single N, the most recently written one when several splits were run) into
+the main one: projects are deduplicated by ``id``, keeping the record with
+the latest ``timestamps.last_scanned``, and the cache entries (stage
+fingerprints) of the winning records are kept with them.
+
+Project ids and paths are derived from the absolute project path, so all
+hosts must mount the tree at the same path: a project scanned through two
+different mount points gets two ids and appears twice in the merge.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SHARDS_DIR = "shards"
+
+_SHARD_NAME = re.compile(r"(\d+)-of-(\d+)")
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """``"i/N"`` -> (i, N); raises ValueError unless 1 <= i <= N."""
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard: {spec!r} (expected i/N, e.g. 1/4)") from None
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard: {spec!r} (i must be between 1 and N)")
+    return index, count
+
+
+def shard_of(directory: Path, root: Path, count: int) -> int:
+    """Shard number (1..count) of a project directory below ``root``."""
+    try:
+        key = directory.relative_to(root).as_posix()
+    except ValueError:
+        key = directory.as_posix()
+    digest = hashlib.md5(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def shard_dir(data_dir: Path, index: int, count: int) -> Path:
+    """Data directory a ``generate --shard index/count`` run writes to."""
+    return data_dir / SHARDS_DIR / f"{index}-of-{count}"
+
+
+def find_shard_dirs(data_dir: Path) -> List[Path]:
+    """The newest complete set of shard data directories below ``data_dir``.
+
+    Shard directories are grouped by N and the group written to most
+    recently is returned in shard order, so the outputs of an earlier split
+    into a different N are never mixed in. Raises ValueError when a shard of
+    that group is missing.
+    """
+    root = data_dir / SHARDS_DIR
+    if not root.is_dir():
+        return []
+    groups: Dict[int, Dict[int, Path]] = {}
+    for path in root.iterdir():
+        match = _SHARD_NAME.fullmatch(path.name)
+        if match and path.is_dir():
+            index, count = int(match.group(1)), int(match.group(2))
+            if 1 <= index <= count:
+                groups.setdefault(count, {})[index] = path
+    if not groups:
+        return []
+
+    count = max(groups, key=lambda n: max(_mtime(p) for p in groups[n].values()))
+    shards = groups[count]
+    missing = [str(i) for i in range(1, count + 1) if i not in shards]
+    if missing:
+        raise ValueError(f"Incomplete shard set {count}: missing {', '.join(missing)} of {count} "
+                         f"(run 'generate --shard i/{count}' for each)")
+    return [shards[i] for i in range(1, count + 1)]
+
+
+def merge_projects(shards: Iterable[Tuple[List[Dict[str, Any]], Dict[str, Any]]]
+                   ) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, str]], int]:
+    """Merge (projects, cache) pairs loaded from shard data directories.
+
+    Returns (projects, fingerprints, conflicts): one record per ``id`` (a
+    hash of the absolute path, see above), the one scanned last (a later
+    shard wins a tie), ordered by path;
+    ``fingerprints`` maps project paths to the stage fingerprints cached
+    alongside the winning record; ``conflicts`` counts ids found in more
+    than one shard.
+    """
+    winners: Dict[str, Tuple[Dict[str, Any], Optional[Dict[str, str]]]] = {}
+    conflicts = 0
+    for projects, cache in shards:
+        for proj in projects:
+            pid = proj.get("id")
+            if not pid:
+                continue
+            entry = cache.get(proj.get("path")) or {}
+            current = winners.get(pid)
+            if current is not None:
+                conflicts += 1
+                if _last_scanned(proj) < _last_scanned(current[0]):
+                    continue
+            winners[pid] = (proj, entry.get("fingerprints"))
+
+    ordered = sorted(winners.values(), key=lambda item: Path(item[0].get("path") or "").parts)
+    fingerprints = {proj["path"]: fp for proj, fp in ordered if proj.get("path") and fp}
+    return [proj for proj, _ in ordered], fingerprints, conflicts
+
+
+# ----- Internal helpers -----
+def _mtime(path: Path) -> int:
+    # Data files are replaced by rename, which updates the directory mtime
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _last_scanned(project: Dict[str, Any]) -> str:
+    # ISO 8601 timestamps from datetime.isoformat() sort chronologically as text
+    return (project.get("timestamps") or {}).get("last_scanned") or ""
@@ -0,0 +1,199 @@
+"""
+Lines-of-code and file statistics.
+
+The project tree is walked with os.scandir and ignored directories are
+pruned before descending. Code files are read in fixed-size binary chunks,
+so memory use does not depend on file size. Binary, minified, vendored and
+oversized files are left out of the line counts.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from .profiling import note_stat
+
+
+CHUNK_SIZE = 64 * 1024
+
+# Only the leading bytes of a line are needed to classify it as blank/comment
+_PREFIX_BYTES = 64
+
+CODE_LANGUAGES = {
+    ".js": "JavaScript",
+    ".jsx": "JavaScript",
+    ".mjs": "JavaScript",
+    ".cjs": "JavaScript",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".py": "Python",
+    ".dart": "Dart",
+    ".rs": "Rust",
+    ".go": "Go",
+    ".java": "Java",
+    ".php": "PHP",
+    ".rb": "Ruby",
+    ".cs": "C#",
+}
+
+LINE_COMMENTS = {
+    "JavaScript": (b"//", b"/*", b"*"),
+    "TypeScript": (b"//", b"/*", b"*"),
+    "Python": (b"#",),
+    "Dart": (b"//", b"/*", b"*"),
+    "Rust": (b"//", b"/*", b"*"),
+    "Go": (b"//", b"/*", b"*"),
+    "Java": (b"//", b"/*", b"*"),
+    "PHP": (b"//", b"#", b"/*", b"*"),
+    "Ruby": (b"#",),
+    "C#": (b"//", b"/*", b"*"),
+}
+
+VENDORED_DIRS = {"vendor", "vendors", "third_party", "third-party", "bower_components", "Pods", "external"}
+MINIFIED_SUFFIXES = (".min.js", ".min.mjs", "-min.js", ".bundle.js")
+
+# Average bytes per line above which a file is treated as minified/generated
+MINIFIED_LINE_LENGTH = 300
+
+
+class StatsCounter:
+    def __init__(self, ignore_dirs: Iterable[str], max_file_size_kb: int = 1024,
+                 breakdown: bool = False, exclude_paths: Iterable[str] = ()) -> None:
+        self.ignore_dirs = set(ignore_dirs)
+        # Absolute directories never entered (the data directory inside a project)
+        self.exclude_paths = {os.path.abspath(p) for p in exclude_paths}
+        self.max_file_size = max_file_size_kb * 1024
+        self.breakdown = breakdown
+
+    def count(self, directory: Path) -> Dict:
+        """Return file_count, lines_of_code and per-language LOC for ``directory``.
+
+        With ``breakdown`` enabled, ``loc_breakdown`` splits the lines into
+        code, comment and blank (line comments only; block comment bodies
+        are counted when their lines start with ``*``).
+        """
+        file_count = 0
+        skipped = 0
+        languages: Dict[str, int] = {}
+        totals = {"code": 0, "comment": 0, "blank": 0}
+
+        for path, size, vendored in self._walk(directory):
+            file_count += 1
+            language = CODE_LANGUAGES.get(os.path.splitext(path)[1])
+            if language is None:
+                continue
+            if vendored or size > self.max_file_size or path.endswith(MINIFIED_SUFFIXES):
+                skipped += 1
+                continue
+
+            counts = self._count_file(path, LINE_COMMENTS.get(language, ()))
+            if counts is None:
+                skipped += 1
+                continue
+            lines, code, comment, blank = counts
+            languages[language] = languages.get(language, 0) + lines
+            totals["code"] += code
+            totals["comment"] += comment
+            totals["blank"] += blank
+
+        stats = {
+            "lines_of_code": sum(languages.values()),
+            "file_count": file_count,
+            "languages": dict(sorted(languages.items(), key=lambda x: -x[1])),
+            "skipped_files": skipped,
+        }
+        if self.breakdown:
+            stats["loc_breakdown"] = totals
+        return stats
+
+    # ----- Internal helpers -----
+    def _walk(self, directory: Path):
+        """Yield (path, size, vendored) for every file, pruning ignored dirs."""
+        stack = [(str(directory), False)]
+        while stack:
+            path, vendored = stack.pop()
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try:
+                            # Symlinked directories are not followed, like Path.rglob
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in self.ignore_dirs and not self._excluded(entry.path):
+                                    stack.append((entry.path, vendored or entry.name in VENDORED_DIRS))
+                            elif entry.is_file():
+                                note_stat()
+                                yield entry.path, entry.stat().st_size, vendored
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+    def _excluded(self, path: str) -> bool:
+        return bool(self.exclude_paths) and os.path.abspath(path) in self.exclude_paths
+
+    def _count_file(self, path: str, comments: Tuple[bytes, ...]) -> Optional[Tuple[int, int, int, int]]:
+        """Return (lines, code, comment, blank), or None for binary/minified files."""
+        lines = code = comment = blank = 0
+        size = 0
+        prefix = b""      # leading bytes of the line currently being read
+        last_byte = b"\n"
+        try:
+            with open(path, "rb") as f:
+                first = True
+                while True:
+                    chunk = f.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if first and b"\0" in chunk:
+                        return None
+                    first = False
+                    size += len(chunk)
+                    last_byte = chunk[-1:]
+
+                    if not self.breakdown:
+                        lines += chunk.count(b"\n")
+                        continue
+
+                    parts = chunk.split(b"\n")
+                    for part in parts[:-1]:
+                        kind = self._classify(prefix + part[:_PREFIX_BYTES], comments)
+                        prefix = b""
+                        lines += 1
+                        if kind == "blank":
+                            blank += 1
+                        elif kind == "comment":
+                            comment += 1
+                        else:
+                            code += 1
+                    if len(prefix) < _PREFIX_BYTES:
+                        prefix += parts[-1][:_PREFIX_BYTES - len(prefix)]
+        except OSError:
+            return None
+
+        # A final line without a trailing newline still counts
+        if size and last_byte != b"\n":
+            lines += 1
+            if self.breakdown:
+                kind = self._classify(prefix, comments)
+                if kind == "blank":
+                    blank += 1
+                elif kind == "comment":
+                    comment += 1
+                else:
+                    code += 1
+
+        if lines and size > 2048 and size / lines > MINIFIED_LINE_LENGTH:
+            return None
+        if not self.breakdown:
+            code = lines
+        return lines, code, comment, blank
+
+    def _classify(self, line: bytes, comments: Tuple[bytes, ...]) -> str:
+        stripped = line.strip()
+        if not stripped:
+            return "blank"
+        if comments and stripped.startswith(comments):
+            return "comment"
+        return "code"
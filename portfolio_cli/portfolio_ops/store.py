@@ -0,0 +1,269 @@
+"""
+SQLite project store (``output.backend: sqlite``).
+
+portfolio.db (WAL mode) holds:
+
+- ``projects``: one row per project with the full record plus indexed
+  columns for the fields the CLI filters and sorts on (slug, language,
+  framework, category, featured, status, modified, ...)
+- ``project_languages``: every language of a project (primary and
+  secondary), so ``list --language`` also finds secondary languages
+- ``display_overrides``: display fields set by hand (feature, categorize,
+  apply); they are re-applied to every scan, so edits survive a regenerate
+- ``cache``: the incremental-scan cache entries otherwise kept in cache.json
+
+projects.json (or the sharded files) is still exported from the same
+stream, so the frontends read exactly what they read before.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .data_manager import SORTS
+from .lookup import normalize_name
+from .serialization import dumps, loads
+
+
+SCHEMA_VERSION = 1
+
+# ORDER BY clause of each data_manager.SORTS choice
+_ORDER_BY = {
+    "name": "name_key ASC",
+    "date": "modified DESC",
+    "commits": "commits DESC",
+    "priority": "priority DESC, position ASC",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    slug TEXT,
+    name TEXT,
+    name_key TEXT,
+    path TEXT,
+    language TEXT COLLATE NOCASE,
+    framework TEXT COLLATE NOCASE,
+    type TEXT,
+    category TEXT COLLATE NOCASE,
+    featured INTEGER NOT NULL DEFAULT 0,
+    status TEXT,
+    priority INTEGER NOT NULL DEFAULT 0,
+    modified TEXT,
+    commits INTEGER NOT NULL DEFAULT 0,
+    record BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_projects_position ON projects(position);
+CREATE INDEX IF NOT EXISTS ix_projects_slug ON projects(slug);
+CREATE INDEX IF NOT EXISTS ix_projects_name ON projects(name_key);
+CREATE INDEX IF NOT EXISTS ix_projects_path ON projects(path);
+CREATE INDEX IF NOT EXISTS ix_projects_language ON projects(language);
+CREATE INDEX IF NOT EXISTS ix_projects_framework ON projects(framework);
+CREATE INDEX IF NOT EXISTS ix_projects_category ON projects(category);
+CREATE INDEX IF NOT EXISTS ix_projects_featured ON projects(featured);
+CREATE INDEX IF NOT EXISTS ix_projects_status ON projects(status);
+CREATE INDEX IF NOT EXISTS ix_projects_modified ON projects(modified);
+CREATE INDEX IF NOT EXISTS ix_projects_commits ON projects(commits);
+CREATE TABLE IF NOT EXISTS project_languages (
+    language TEXT NOT NULL COLLATE NOCASE,
+    id TEXT NOT NULL,
+    PRIMARY KEY (language, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS display_overrides (
+    id TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (id, field)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cache (
+    path TEXT PRIMARY KEY,
+    entry BLOB NOT NULL
+);
+"""
+
+
+class ProjectStore:
+    def __init__(self, path: Path, serializer: str = "json") -> None:
+        self.path = path
+        self.serializer = serializer
+        # Autocommit; writes are grouped with explicit transactions
+        self.conn = sqlite3.connect(str(path), isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self.conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                          (str(SCHEMA_VERSION),))
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # ----- Projects -----
+    def write_projects(self, projects: Iterable[Dict[str, Any]],
+                       cache_entry=None) -> Iterator[Dict[str, Any]]:
+        """Replace every project with ``projects``, yielding each one once it is stored.
+
+        ``cache_entry(project)``, when given, returns the cache entry to store
+        for the project; the cache table is then replaced as well. Everything
+        commits together once the stream is exhausted.
+        """
+        with self._transaction():
+            self.conn.execute("DELETE FROM projects")
+            self.conn.execute("DELETE FROM project_languages")
+            if cache_entry is not None:
+                self.conn.execute("DELETE FROM cache")
+            for position, proj in enumerate(projects):
+                self._insert(proj, position)
+                if cache_entry is not None and proj.get("path"):
+                    self._put_cache(proj["path"], cache_entry(proj))
+                yield proj
+
+    def save_project(self, project: Dict[str, Any]) -> None:
+        """Insert or update one project, keeping its position."""
+        row = self.conn.execute("SELECT position FROM projects WHERE id = ?", (project.get("id"),)).fetchone()
+        if row is None:
+            row = self.conn.execute("SELECT COALESCE(MAX(position) + 1, 0) FROM projects").fetchone()
+        with self._transaction():
+            self.conn.execute("DELETE FROM project_languages WHERE id = ?", (project.get("id"),))
+            self._insert(project, row[0])
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The project whose id, slug, name or path is ``key``."""
+        for column, value in (("id", key), ("slug", key), ("name_key", normalize_name(key)), ("path", key)):
+            row = self.conn.execute(
+                f"SELECT record FROM projects WHERE {column} = ? ORDER BY position LIMIT 1", (value,)
+            ).fetchone()
+            if row:
+                return loads(row[0])
+        return None
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Every full record, in export order."""
+        for (record,) in self.conn.execute("SELECT record FROM projects ORDER BY position"):
+            yield loads(record)
+
+    def query(self, language: Optional[str] = None, framework: Optional[str] = None,
+              category: Optional[str] = None, featured: Optional[bool] = None,
+              status: Optional[str] = None, sort: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Light records (id, slug, name, path, metadata, display) matching every
+        given filter; built from the indexed columns, so no record is decoded."""
+        where: List[str] = []
+        params: List[Any] = []
+        if language:
+            where.append("id IN (SELECT id FROM project_languages WHERE language = ?)")
+            params.append(language)
+        for column, value in (("framework", framework), ("category", category), ("status", status)):
+            if value:
+                where.append(f"{column} = ?")
+                params.append(value)
+        if featured is not None:
+            where.append("featured = ?")
+            params.append(int(featured))
+
+        sql = ("SELECT id, slug, name, path, language, framework, type, category, featured, status, priority"
+               " FROM projects")
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        if sort and sort not in SORTS:
+            raise ValueError(f"Unknown sort: {sort!r} (expected one of {', '.join(SORTS)})")
+        sql += f" ORDER BY {_ORDER_BY[sort] if sort else 'position'}"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return [
+            {
+                "id": pid, "slug": slug, "name": name, "path": path,
+                "metadata": {"language": language, "framework": framework, "type": proj_type},
+                "display": {"category": category, "featured": bool(featured), "status": status,
+                            "priority": priority},
+            }
+            for pid, slug, name, path, language, framework, proj_type, category, featured, status, priority
+            in self.conn.execute(sql, params)
+        ]
+
+    # ----- Display overrides -----
+    def record_overrides(self, project: Dict[str, Any], fields: Iterable[str]) -> None:
+        """Remember ``fields`` of the project's display as hand-set values."""
+        display = project.get("display") or {}
+        with self._transaction():
+            for field in fields:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO display_overrides (id, field, value) VALUES (?, ?, ?)",
+                    (project.get("id"), field, dumps(display.get(field), False).decode("utf-8")),
+                )
+
+    def overrides(self) -> Dict[str, Dict[str, Any]]:
+        result: Dict[str, Dict[str, Any]] = {}
+        for pid, field, value in self.conn.execute("SELECT id, field, value FROM display_overrides"):
+            result.setdefault(pid, {})[field] = loads(value)
+        return result
+
+    def apply_overrides(self, projects: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield ``projects`` with hand-set display fields laid over the scanned ones."""
+        overrides = self.overrides()
+        for proj in projects:
+            fields = overrides.get(proj.get("id"))
+            if fields:
+                proj = {**proj, "display": {**(proj.get("display") or {}), **fields}}
+            yield proj
+
+    # ----- Cache -----
+    def load_cache(self) -> Dict[str, Any]:
+        return {path: loads(entry) for path, entry in self.conn.execute("SELECT path, entry FROM cache")}
+
+    def save_cache(self, entries: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        with self._transaction():
+            self.conn.execute("DELETE FROM cache")
+            for path, entry in entries:
+                self._put_cache(path, entry)
+
+    # ----- Internal helpers -----
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[None]:
+        if self.conn.in_transaction:
+            # Nested in a write_projects stream: that transaction commits it
+            yield
+            return
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def _insert(self, proj: Dict[str, Any], position: int) -> None:
+        metadata = proj.get("metadata") or {}
+        display = proj.get("display") or {}
+        pid = proj.get("id")
+        self.conn.execute(
+            "INSERT OR REPLACE INTO projects (id, position, slug, name, name_key, path, language, framework,"
+            " type, category, featured, status, priority, modified, commits, record)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                pid, position, proj.get("slug"), proj.get("name"), normalize_name(proj.get("name") or ""),
+                proj.get("path"), metadata.get("language"), metadata.get("framework"), metadata.get("type"),
+                display.get("category"), int(bool(display.get("featured"))), display.get("status"),
+                int(display.get("priority") or 0),
+                (proj.get("timestamps") or {}).get("modified"),
+                int((proj.get("git") or {}).get("total_commits") or 0),
+                dumps(proj, False, self.serializer),
+            ),
+        )
+        languages = metadata.get("languages") or [metadata.get("language")]
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO project_languages (language, id) VALUES (?, ?)",
+            [(language, pid) for language in languages if language],
+        )
+
+    def _put_cache(self, path: str, entry: Dict[str, Any]) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO cache (path, entry) VALUES (?, ?)",
+                          (path, dumps(entry, False, self.serializer)))
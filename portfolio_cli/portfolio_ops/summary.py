@@ -0,0 +1,33 @@
+"""
+Running totals for the end-of-scan summary.
+
+ScanSummary counts projects as they stream past (see ``track``), so the
+summary never needs the complete project list in memory.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator
+
+
+class ScanSummary:
+    def __init__(self) -> None:
+        self.total = 0
+        self.featured = 0
+        self.languages: Dict[str, int] = {}
+        self.types: Dict[str, int] = {}
+
+    def add(self, project: Dict[str, Any]) -> None:
+        lang = project['metadata']['language']
+        proj_type = project['metadata']['type']
+        self.languages[lang] = self.languages.get(lang, 0) + 1
+        self.types[proj_type] = self.types.get(proj_type, 0) + 1
+        if project['display'].get('featured'):
+            self.featured += 1
+        self.total += 1
+
+    def track(self, projects: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Pass ``projects`` through unchanged, counting each one."""
+        for project in projects:
+            self.add(project)
+            yield project
@@ -0,0 +1,370 @@
+"""
+Watch mode: keep the portfolio data up to date as projects change.
+
+On Linux the watcher uses inotify directly through ctypes (no extra
+dependency). Elsewhere, or when inotify is unavailable or out of watches,
+it falls back to polling project fingerprints.
+
+Events are debounced, mapped to the project that owns the changed path and
+handed to PortfolioScanner.refresh_project, which recomputes only the
+detection stages whose inputs changed. State is bounded by the number of
+projects and watched directories, so memory stays flat over long uptimes.
+
+The data directory is never watched and events below it are dropped: it
+may sit inside a watched project (a frontend's public/ folder), and every
+save would otherwise trigger another refresh of that project.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from .fingerprint import GIT_FILES
+
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+_EVENT = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+# Sentinel paths: "the event queue overflowed; resync everything" and
+# "polling interval elapsed; re-check every project"
+RESYNC = "\0resync"
+POLL = "\0poll"
+
+
+class InotifyBackend:
+    """Directory watches through the inotify syscalls."""
+
+    name = "inotify"
+
+    def __init__(self, ignore_dirs: Iterable[str], exclude_paths: Iterable[str] = ()) -> None:
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify is not available on this platform")
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.ignore_dirs = set(ignore_dirs)
+        self.exclude_paths = set(exclude_paths)
+        self._paths: Dict[int, str] = {}
+        self._wds: Dict[str, int] = {}
+
+    def watch(self, path: str) -> None:
+        if path in self._wds:
+            return
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            if errno == 28:  # ENOSPC: max_user_watches reached
+                raise OSError(errno, "inotify watch limit reached (fs.inotify.max_user_watches)")
+            return  # vanished or unreadable directory
+        self._paths[wd] = path
+        self._wds[path] = wd
+
+    def watch_tree(self, path: str) -> None:
+        """Watch ``path`` and every non-ignored directory below it."""
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            if os.path.abspath(current) in self.exclude_paths:
+                continue
+            self.watch(current)
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False) and entry.name not in self.ignore_dirs:
+                            stack.append(entry.path)
+            except OSError:
+                continue
+
+    def wait(self, timeout: Optional[float]) -> Set[str]:
+        """Return directories that saw events, waiting up to ``timeout`` seconds."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed: Set[str] = set()
+        try:
+            data = os.read(self._fd, _READ_SIZE)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+            offset += _EVENT.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                changed.add(RESYNC)
+                continue
+            path = self._paths.get(wd)
+            if path is None:
+                continue
+            if mask & IN_IGNORED:
+                self._paths.pop(wd, None)
+                self._wds.pop(path, None)
+                continue
+
+            child = os.path.join(path, os.fsdecode(name)) if name else path
+            changed.add(child if mask & IN_ISDIR else path)
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                if os.path.basename(child) not in self.ignore_dirs:
+                    self.watch_tree(child)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class PollingBackend:
+    """Fallback that re-fingerprints known projects every ``interval`` seconds."""
+
+    name = "polling"
+
+    def __init__(self, interval: float = 5.0) -> None:
+        self.interval = interval
+
+    def watch(self, path: str) -> None:
+        pass
+
+    def watch_tree(self, path: str) -> None:
+        pass
+
+    def wait(self, timeout: Optional[float]) -> Set[str]:
+        # Polling is inherently debounced: nothing arrives during the debounce window
+        if timeout is not None:
+            return set()
+        time.sleep(self.interval)
+        return {POLL}
+
+    def close(self) -> None:
+        pass
+
+
+class PortfolioWatcher:
+    def __init__(self, scanner, data_manager, root_path: Path, max_depth: int,
+                 debounce: float = 1.0, max_delay: float = 10.0,
+                 poll: bool = False, poll_interval: float = 5.0, verbose: bool = False) -> None:
+        self.scanner = scanner
+        self.data_manager = data_manager
+        self.root_path = root_path
+        self.max_depth = max_depth
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.verbose = verbose
+        # Our own output: cache.json, portfolio.db and the exported files
+        self.exclude_paths = {os.path.abspath(data_manager.output_dir),
+                              os.path.abspath(data_manager.cache_file.parent)}
+
+        self.backend = None
+        if not poll:
+            try:
+                self.backend = InotifyBackend(scanner.config.ignore_dirs, self.exclude_paths)
+            except OSError as e:
+                print(f"⚠️  inotify unavailable ({e}); falling back to polling")
+        if self.backend is None:
+            self.backend = PollingBackend(poll_interval)
+
+        # Project records and cache entries keyed by project path, in export order
+        self.projects: Dict[str, Dict] = {}
+        self.cache: Dict[str, Dict] = {}
+
+    def run(self) -> None:
+        print(f"👀 Watching {self.root_path} ({self.backend.name})")
+        self._resync()
+        try:
+            while True:
+                changed = self.backend.wait(None)
+                deadline = time.monotonic() + self.max_delay
+                while changed and time.monotonic() < deadline:
+                    more = self.backend.wait(self.debounce)
+                    if not more:
+                        break
+                    changed |= more
+                if changed:
+                    self._process(changed)
+        except KeyboardInterrupt:
+            print("\n✓ Stopped watching")
+        finally:
+            self.backend.close()
+
+    # ----- Internal helpers -----
+    def _resync(self) -> None:
+        """Rediscover the whole tree and refresh every project (start-up / overflow)."""
+        if not self.cache:
+            self.scanner.manifests.update(self.data_manager.load_manifests())
+        cache = self.data_manager.load_cache() if not self.cache else self.cache
+        projects = self.scanner.incremental_scan(self.root_path, cache, verbose=self.verbose)
+        self.projects = {p["path"]: p for p in projects}
+        self._rebuild_cache()
+        self._save()
+        self._watch_all()
+
+    def _watch_all(self) -> None:
+        if isinstance(self.backend, PollingBackend):
+            return
+        try:
+            self._watch_discovery_dirs(self.root_path, 0)
+            for path in self.projects:
+                self._watch_project(path)
+        except OSError as e:
+            print(f"⚠️  {e}; falling back to polling")
+            self.backend.close()
+            self.backend = PollingBackend()
+
+    def _watch_discovery_dirs(self, path: Path, depth: int) -> None:
+        # Non-project directories that discovery descends into
+        if depth > self.max_depth:
+            return
+        self.backend.watch(str(path))
+        try:
+            with os.scandir(path) as it:
+                subdirs = [Path(e.path) for e in it if e.is_dir() and e.name not in self.scanner.ignore_dirs]
+        except OSError:
+            return
+        for sub in subdirs:
+            if str(sub) not in self.projects and not self._excluded(str(sub)):
+                self._watch_discovery_dirs(sub, depth + 1)
+
+    def _watch_project(self, path: str) -> None:
+        self.backend.watch_tree(path)
+        # Git stage inputs live in the ignored .git directory
+        for rel in {os.path.dirname(name) for name in GIT_FILES}:
+            git_dir = os.path.join(path, ".git", rel) if rel else os.path.join(path, ".git")
+            if os.path.isdir(git_dir):
+                self.backend.watch(git_dir)
+
+    def _excluded(self, path: str) -> bool:
+        path = os.path.abspath(path)
+        return any(path == excluded or path.startswith(excluded + os.sep) for excluded in self.exclude_paths)
+
+    def _owner(self, path: str) -> Optional[str]:
+        """The known project containing ``path``; None outside projects and in the data directory."""
+        if self._excluded(path):
+            return None
+        current = path
+        while True:
+            if current in self.projects:
+                return current
+            parent = os.path.dirname(current)
+            if parent == current:
+                return None
+            current = parent
+
+    def _process(self, changed: Set[str]) -> None:
+        if RESYNC in changed:
+            if self.verbose:
+                print("  Resyncing all projects")
+            self._resync()
+            return
+        if POLL in changed:
+            self._poll()
+            return
+
+        affected: List[str] = []
+        for path in sorted(changed):
+            if self._excluded(path):
+                continue
+            owner = self._owner(path)
+            if owner is not None:
+                if owner not in affected:
+                    affected.append(owner)
+            else:
+                affected.extend(p for p in self._discover(Path(path)) if p not in affected)
+
+        self._refresh(affected)
+
+    def _poll(self) -> None:
+        # Stat-only rediscovery plus fingerprint check of every known project
+        found = self.scanner.discovery.find(self.root_path, self.max_depth)
+        paths = [str(c.path) for c in found]
+        seen = set(paths)
+        self._refresh(paths + [p for p in self.projects if p not in seen])
+
+    def _refresh(self, affected: List[str]) -> None:
+        """Re-detect ``affected`` project paths and save once if anything changed."""
+        updated: Set[str] = set()
+        removed = False
+        for path in affected:
+            project, stages = self.scanner.refresh_project(Path(path), self.cache.get(path), self.verbose)
+            if project is None:
+                if self.projects.pop(path, None) is not None:
+                    self.cache.pop(path, None)
+                    removed = True
+                    print(f"  Removed: {Path(path).name}")
+                continue
+            if not stages and path in self.projects:
+                continue
+            is_new = path not in self.projects
+            self.projects[path] = project
+            self.cache[path] = {
+                "fingerprints": self.scanner.fingerprints.get(path),
+                "project_data": project,
+            }
+            updated.add(project["id"])
+            label = "New" if is_new else "Updated"
+            print(f"  {label}: {project['name']} ({', '.join(stages)})")
+
+        if updated or removed:
+            self._save()
+
+    def _discover(self, path: Path) -> List[str]:
+        """Find new projects at or below a directory outside any known project."""
+        try:
+            rel_depth = len(path.relative_to(self.root_path).parts) - 1
+        except ValueError:
+            return []
+        if rel_depth < 0 or rel_depth > self.max_depth or not path.is_dir():
+            return []
+
+        candidate = self.scanner.discovery.candidate(path)
+        if candidate is not None:
+            found = [candidate]
+        else:
+            found = self.scanner.discovery.find(path, self.max_depth - rel_depth - 1)
+            self._watch_discovery_dirs(path, rel_depth)
+
+        new = [str(c.path) for c in found if str(c.path) not in self.projects]
+        for p in new:
+            self._watch_project(p)
+        return new
+
+    def _rebuild_cache(self) -> None:
+        self.cache = {
+            path: {"fingerprints": self.scanner.fingerprints.get(path), "project_data": proj}
+            for path, proj in self.projects.items()
+        }
+
+    def _save(self) -> None:
+        # Same export path as generate/update, so README text and asset paths
+        # in the projects and cache.json are settled the same way
+        self.data_manager.export_stream(list(self.projects.values()), self.scanner.fingerprints)
+        self.data_manager.save_manifests(self.scanner.manifests.snapshot(self.scanner.fingerprints))
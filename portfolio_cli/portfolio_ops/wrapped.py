@@ -0,0 +1,229 @@
+"""
+Portfolio-wide year in review ("wrapped").
+
+Yearly numbers come from a commit-date index (``commit_index.json`` in the
+data directory, see DataManager.load_commit_index) rather than from the
+repositories themselves. Per project it keeps the HEAD sha it was built at
+and two parallel sorted arrays: commit days (date ordinals, author date in
+the author's time zone) and commits on each day. ``CommitIndex.refresh``
+re-reads only projects whose scanned HEAD moved, and then only
+``<old head>..<new head>`` when the old head is still an ancestor.
+
+``compute_wrapped`` slices each project's arrays to the year by bisection
+and aggregates the concatenation with bincounts: NumPy when installed,
+otherwise the same array arithmetic in plain Python.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from bisect import bisect_left
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .git_activity import is_ancestor
+from .pipeline import make_executor, ordered_map
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+
+# Bumped whenever the entry layout changes, so stored entries are rebuilt
+INDEX_VERSION = 1
+
+TOP_N = 5
+
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+class CommitIndex:
+    def __init__(self, entries: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        # project id -> {"version", "head_sha", "days": [ordinal, ...], "counts": [n, ...]}
+        self.entries: Dict[str, Dict[str, Any]] = {
+            pid: entry for pid, entry in (entries or {}).items()
+            if isinstance(entry, dict) and entry.get("version") == INDEX_VERSION
+        }
+
+    def refresh(self, projects: Iterable[Dict[str, Any]], workers: int = 4) -> Tuple[int, List[str]]:
+        """Bring every git project up to its scanned HEAD.
+
+        Returns (updated, failed): how many entries were re-read, and the ids
+        of projects git could not read, whose previous entry (if any) is
+        kept. Entries of projects no longer present are dropped.
+        """
+        stale: List[Tuple[str, Path, str]] = []
+        present = set()
+        for proj in projects:
+            git = proj.get("git") or {}
+            pid, sha = proj.get("id"), git.get("head_sha")
+            if not (pid and sha and proj.get("path")):
+                continue
+            present.add(pid)
+            if (self.entries.get(pid) or {}).get("head_sha") != sha:
+                stale.append((pid, Path(proj["path"]), sha))
+        for pid in set(self.entries) - present:
+            del self.entries[pid]
+
+        updated = 0
+        failed: List[str] = []
+        with make_executor(max(1, workers), "thread") as executor:
+            for (pid, _, _), entry in zip(stale, ordered_map(executor, self._read, stale, workers * 2)):
+                if entry is None:
+                    failed.append(pid)
+                    continue
+                self.entries[pid] = entry
+                updated += 1
+        return updated, failed
+
+    # ----- Internal helpers -----
+    def _read(self, item: Tuple[str, Path, str]) -> Optional[Dict[str, Any]]:
+        pid, directory, sha = item
+        previous = self.entries.get(pid)
+        base = previous if previous and is_ancestor(directory, previous.get("head_sha"), sha) else None
+
+        per_day: Dict[int, int] = dict(zip(base["days"], base["counts"])) if base else {}
+        cmd = ["git", "-C", str(directory), "-c", "log.showSignature=false", "log",
+               "--format=%ad", "--date=format:%Y-%m-%d",
+               f"{base['head_sha']}..{sha}" if base else sha, "--"]
+        try:
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                  text=True, encoding="utf-8", errors="replace") as proc:
+                for line in proc.stdout:
+                    day = date.fromisoformat(line.strip()).toordinal()
+                    per_day[day] = per_day.get(day, 0) + 1
+                if proc.wait() != 0:
+                    return None
+        except (OSError, ValueError):
+            return None
+
+        days = sorted(per_day)
+        return {"version": INDEX_VERSION, "head_sha": sha, "days": days, "counts": [per_day[d] for d in days]}
+
+
+def compute_wrapped(index: CommitIndex, projects: List[Dict[str, Any]], year: int) -> Dict[str, Any]:
+    """Portfolio-wide statistics for ``year`` (JSON-serializable)."""
+    start = date(year, 1, 1).toordinal()
+    end = date(year + 1, 1, 1).toordinal()
+
+    # Per project, the slice of its sorted arrays that falls in the year
+    active: List[Dict[str, Any]] = []
+    day_slices: List[List[int]] = []
+    count_slices: List[List[int]] = []
+    for proj in projects:
+        entry = index.entries.get(proj.get("id"))
+        if not entry:
+            continue
+        lo, hi = bisect_left(entry["days"], start), bisect_left(entry["days"], end)
+        if hi > lo:
+            active.append(proj)
+            day_slices.append(entry["days"][lo:hi])
+            count_slices.append(entry["counts"][lo:hi])
+
+    aggregate = _aggregate_numpy if np is not None else _aggregate_python
+    daily, per_project = aggregate(day_slices, count_slices, start, end - start)
+
+    # Month of every day of the year, for the monthly bincount
+    months = [date.fromordinal(start + offset).month - 1 for offset in range(end - start)]
+    per_month = [0] * 12
+    for month, count in zip(months, daily):
+        per_month[month] += count
+
+    languages: Dict[str, int] = {}
+    for proj, commits in zip(active, per_project):
+        language = (proj.get("metadata") or {}).get("language") or "Unknown"
+        languages[language] = languages.get(language, 0) + commits
+
+    busiest = max(range(len(daily)), key=daily.__getitem__) if any(daily) else None
+    streak, streak_end = _longest_streak(daily)
+    ranked = sorted(zip(active, per_project), key=lambda item: -item[1])
+
+    return {
+        "year": year,
+        "commits": sum(daily),
+        "active_days": sum(1 for count in daily if count),
+        "active_projects": len(active),
+        "commits_per_month": per_month,
+        "busiest_day": {
+            "date": date.fromordinal(start + busiest).isoformat(),
+            "commits": daily[busiest],
+        } if busiest is not None else None,
+        "longest_streak": {
+            "days": streak,
+            "start": date.fromordinal(start + streak_end - streak + 1).isoformat(),
+            "end": date.fromordinal(start + streak_end).isoformat(),
+        } if streak else None,
+        "top_languages": [
+            {"language": language, "commits": commits}
+            for language, commits in sorted(languages.items(), key=lambda item: -item[1])[:TOP_N]
+        ],
+        "top_projects": [
+            {"id": proj.get("id"), "name": proj.get("name"), "slug": proj.get("slug"), "commits": commits}
+            for proj, commits in ranked[:TOP_N]
+        ],
+    }
+
+
+def format_wrapped(stats: Dict[str, Any]) -> str:
+    """Human-readable summary of compute_wrapped() output."""
+    lines = [
+        f"🎁 {stats['year']} Wrapped",
+        "",
+        f"Commits: {stats['commits']} across {stats['active_projects']} projects",
+        f"Active days: {stats['active_days']}",
+    ]
+    if stats["busiest_day"]:
+        lines.append(f"Busiest day: {stats['busiest_day']['date']} ({stats['busiest_day']['commits']} commits)")
+    if stats["longest_streak"]:
+        streak = stats["longest_streak"]
+        lines.append(f"Longest streak: {streak['days']} days ({streak['start']} → {streak['end']})")
+
+    peak = max(stats["commits_per_month"]) or 1
+    lines += ["", "Commits per month:"]
+    for name, count in zip(MONTHS, stats["commits_per_month"]):
+        lines.append(f"  {name} {'█' * round(count / peak * 30):<30} {count}")
+
+    if stats["top_languages"]:
+        lines += ["", "Top languages:"]
+        lines += [f"  {item['language']}: {item['commits']}" for item in stats["top_languages"]]
+    if stats["top_projects"]:
+        lines += ["", "Most active projects:"]
+        lines += [f"  {item['name']}: {item['commits']}" for item in stats["top_projects"]]
+    return "\n".join(lines)
+
+
+# ----- Internal helpers -----
+def _aggregate_numpy(day_slices: List[List[int]], count_slices: List[List[int]],
+                     start: int, ndays: int) -> Tuple[List[int], List[int]]:
+    if not day_slices:
+        return [0] * ndays, []
+    lengths = [len(days) for days in day_slices]
+    offsets = np.fromiter((d for days in day_slices for d in days), dtype=np.int64, count=sum(lengths)) - start
+    counts = np.fromiter((c for cs in count_slices for c in cs), dtype=np.int64, count=sum(lengths))
+    owners = np.repeat(np.arange(len(day_slices)), lengths)
+    daily = np.bincount(offsets, weights=counts, minlength=ndays)
+    per_project = np.bincount(owners, weights=counts, minlength=len(day_slices))
+    return daily.astype(np.int64).tolist(), per_project.astype(np.int64).tolist()
+
+
+def _aggregate_python(day_slices: List[List[int]], count_slices: List[List[int]],
+                      start: int, ndays: int) -> Tuple[List[int], List[int]]:
+    daily = [0] * ndays
+    per_project = []
+    for days, counts in zip(day_slices, count_slices):
+        for day, count in zip(days, counts):
+            daily[day - start] += count
+        per_project.append(sum(counts))
+    return daily, per_project
+
+
+def _longest_streak(daily: List[int]) -> Tuple[int, int]:
+    """(length, offset of its last day) of the longest run of days with commits."""
+    best = best_end = run = 0
+    for offset, count in enumerate(daily):
+        run = run + 1 if count else 0
+        if run > best:
+            best, best_end = run, offset
+    return best, best_end
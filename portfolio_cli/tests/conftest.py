@@ -0,0 +1,20 @@
+import itertools
+
+import pytest
+
+from portfolio_ops.config import Config
+
+_configs = itertools.count()
+
+
+@pytest.fixture
+def make_config(tmp_path, monkeypatch):
+    """Build a Config from YAML text; the parsed-config cache stays inside tmp_path."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ".cache"))
+
+    def make(text=""):
+        path = tmp_path / f"portfolio-config-{next(_configs)}.yaml"
+        path.write_text(text)
+        return Config(path)
+
+    return make
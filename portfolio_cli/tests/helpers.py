@@ -0,0 +1,77 @@
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def write_files(root, files):
+    """Create ``{relative path: text}`` below ``root``; dicts are written as JSON."""
+    for rel, content in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(json.dumps(content) if isinstance(content, dict) else content)
+    return root
+
+
+# A small workspace with one project per detector family plus a nested one
+SAMPLE_WORKSPACE = {
+    "web/package.json": {"name": "web-app", "dependencies": {"react": "18", "next": "14"}},
+    "web/README.md": "# Web App\n\nA storefront built with Next.js.\n\n## Features\n\n- Fast\n",
+    "web/src/App.jsx": "export default function App() {\n  return null;\n}\n",
+    "api/requirements.txt": "flask==3.0\nrequests\n",
+    "api/app.py": "# Entry point\nfrom flask import Flask\n\napp = Flask(__name__)\n",
+    "api/README.md": "# API\n\nBackend service.\n",
+    "mobile/pubspec.yaml": "name: mobile_app\ndependencies:\n  flutter:\n    sdk: flutter\n",
+    "mobile/lib/main.dart": "void main() {}\n",
+    "tools/cli/Cargo.toml": "[package]\nname = \"cli\"\n",
+    "tools/cli/src/main.rs": "fn main() {}\n",
+    "tools/lib/go.mod": "module example.com/lib\n",
+    "tools/lib/lib.go": "package lib\n",
+}
+
+BASE_CONFIG = """scanner:
+  git_activity: false
+output:
+  copy_assets: false
+"""
+
+
+def without_scan_times(projects):
+    """Project records with the per-run scan timestamp removed, for comparisons."""
+    return [
+        {**p, "timestamps": {k: v for k, v in p["timestamps"].items() if k != "last_scanned"}}
+        for p in projects
+    ]
+
+
+def git(repo, *args, date=None, author=("Ada", "ada@example.com")):
+    """Run git in ``repo`` with a fixed identity (and author/committer date)."""
+    env = dict(os.environ, GIT_AUTHOR_NAME=author[0], GIT_AUTHOR_EMAIL=author[1],
+               GIT_COMMITTER_NAME=author[0], GIT_COMMITTER_EMAIL=author[1],
+               GIT_CONFIG_GLOBAL=os.devnull, GIT_CONFIG_SYSTEM=os.devnull)
+    if date:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = date
+    result = subprocess.run(["git", "-C", str(repo), *args], env=env, check=True,
+                            capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+def commit(repo, files, date, message="change", author=("Ada", "ada@example.com")):
+    """Write ``files`` into ``repo`` and commit them at ``date`` (ISO 8601 with offset)."""
+    write_files(repo, files)
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", message, date=date, author=author)
+    return git(repo, "rev-parse", "HEAD")
+
+
+def init_repo(repo):
+    repo.mkdir(parents=True, exist_ok=True)
+    git(repo, "init", "-q", "-b", "main")
+    return repo
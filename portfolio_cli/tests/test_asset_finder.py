@@ -0,0 +1,91 @@
+import struct
+
+from portfolio_ops.asset_finder import AssetFinder, read_image_size
+from portfolio_ops.scanner import PortfolioScanner
+
+from .helpers import write_files
+
+
+def png(width, height):
+    return b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR" + struct.pack(">II", width, height) + b"\x08\x06\0\0\0"
+
+
+def gif(width, height):
+    return b"GIF89a" + struct.pack("<HH", width, height) + b"\0" * 8
+
+
+def jpeg(width, height):
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\0" + b"\0" * 9
+    sof0 = b"\xff\xc0" + struct.pack(">HBHH", 11, 8, height, width) + b"\x01\x01\x11\0"
+    return b"\xff\xd8" + app0 + sof0 + b"\xff\xd9"
+
+
+def names(paths):
+    return [p.rsplit("/", 1)[-1] for p in paths]
+
+
+def test_header_dimensions(tmp_path):
+    write_files(tmp_path, {"a.png": png(1280, 720), "b.gif": gif(64, 32), "c.jpg": jpeg(800, 600),
+                           "d.png": b"not an image"})
+
+    assert read_image_size(str(tmp_path / "a.png")) == (1280, 720)
+    assert read_image_size(str(tmp_path / "b.gif")) == (64, 32)
+    assert read_image_size(str(tmp_path / "c.jpg")) == (800, 600)
+    assert read_image_size(str(tmp_path / "d.png")) is None
+    assert read_image_size(str(tmp_path / "missing.png")) is None
+
+
+def test_screenshots_are_ranked_by_cheap_signals(tmp_path):
+    write_files(tmp_path, {
+        "assets/icon.png": png(1280, 720),
+        "assets/sprite-sheet.png": png(64, 64),
+        "assets/background.png": png(1920, 1080),
+        "assets/app-screenshot.png": png(1440, 900),
+        "assets/tall.png": png(400, 2000),
+    })
+
+    found = AssetFinder(["assets"]).find_screenshots(tmp_path)
+
+    assert names(found) == ["app-screenshot.png", "background.png", "tall.png", "icon.png", "sprite-sheet.png"]
+
+
+def test_walk_honours_dirs_depth_and_ignores(tmp_path):
+    write_files(tmp_path, {
+        "media/shot.png": png(800, 600),
+        "media/a/b/deep.png": png(800, 600),
+        "media/a/b/c/too-deep.png": png(800, 600),
+        "media/node_modules/pkg/logo.png": png(800, 600),
+        "screenshots/default.png": png(800, 600),
+    })
+
+    found = AssetFinder(["media/"], ignore_dirs=["node_modules"], max_depth=2).find_screenshots(tmp_path)
+
+    assert sorted(names(found)) == ["deep.png", "shot.png"]
+
+
+def test_walk_stops_at_the_candidate_bound(tmp_path):
+    write_files(tmp_path, {f"screenshots/{i:03d}.png": png(800, 600) for i in range(50)})
+    finder = AssetFinder(limit=5, max_candidates=10)
+    visited = []
+    iter_images = finder.iter_images
+    finder.iter_images = lambda base: (visited.append(item) or item for item in iter_images(base))
+
+    found = finder.find_screenshots(tmp_path)
+
+    assert names(found) == [f"{i:03d}.png" for i in range(5)]
+    assert len(visited) == 10
+
+
+def test_logo_wins_the_thumbnail(tmp_path):
+    write_files(tmp_path, {"logo.svg": "<svg/>", "screenshots/home.png": png(800, 600)})
+
+    assets = AssetFinder().find_assets(tmp_path, "data", frozenset({"logo.svg"}))
+
+    assert assets["logo"] == assets["thumbnail"] == str(tmp_path / "logo.svg")
+    assert names(assets["screenshots"]) == ["home.png"]
+
+
+def test_scanner_uses_configured_screenshot_dirs(make_config):
+    scanner = PortfolioScanner(make_config("output:\n  screenshot_dirs: [media, docs/shots/]\n"))
+
+    assert scanner.asset_finder.screenshot_dirs == ["media", "docs/shots"]
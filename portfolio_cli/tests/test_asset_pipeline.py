@@ -0,0 +1,107 @@
+import pytest
+
+from portfolio_ops import asset_pipeline
+from portfolio_ops.asset_pipeline import AssetPipeline
+from portfolio_ops.bench import _PNG
+from portfolio_ops.data_manager import DataManager
+from portfolio_ops.scanner import PortfolioScanner
+
+from .helpers import SAMPLE_WORKSPACE, write_files
+
+
+@pytest.fixture
+def no_pillow(monkeypatch):
+    monkeypatch.setattr(asset_pipeline, "Image", None)
+
+
+def record(slug, *screenshots, logo=None):
+    return {"slug": slug, "assets": {"screenshots": [str(p) for p in screenshots],
+                                     "logo": str(logo) if logo else None, "thumbnail": None}}
+
+
+def run(pipeline, projects):
+    referenced = set()
+    return list(pipeline.process(projects, referenced)), referenced
+
+
+def test_identical_images_are_stored_once(tmp_path, no_pillow):
+    src = write_files(tmp_path / "src", {"a/shot.png": _PNG, "b/same.png": _PNG, "b/logo.svg": "<svg/>"})
+    pipeline = AssetPipeline(tmp_path / "data")
+
+    (a, b), referenced = run(pipeline, [record("a", src / "a/shot.png"),
+                                        record("b", src / "b/same.png", logo=src / "b/logo.svg")])
+
+    shot = a["assets"]["screenshots"][0]
+    assert shot.startswith("assets/a/") and shot.endswith(".png")
+    assert b["assets"]["logo"].startswith("assets/b/")
+    assert a["assets"]["images"][0]["source"] == str(src / "a/shot.png")
+    assert a["assets"]["images"][0]["width"] == 1
+    assert referenced == {shot, b["assets"]["screenshots"][0], b["assets"]["logo"]}
+    copy, link = (tmp_path / "data" / shot), (tmp_path / "data" / b["assets"]["screenshots"][0])
+    assert copy.stat().st_ino == link.stat().st_ino
+    assert pipeline.stats["copied"] == 2 and pipeline.stats["linked"] == 1
+
+
+def test_republishing_is_idempotent_and_skips_unchanged_files(tmp_path, no_pillow, monkeypatch):
+    src = write_files(tmp_path / "src", {"a/shot.png": _PNG})
+    first, _ = run(AssetPipeline(tmp_path / "data"), [record("a", src / "a/shot.png")])
+
+    hashed = []
+    sha256 = asset_pipeline.hashlib.sha256
+    monkeypatch.setattr(asset_pipeline.hashlib, "sha256", lambda *a: hashed.append(a) or sha256(*a))
+    pipeline = AssetPipeline(tmp_path / "data")
+    second, _ = run(pipeline, first)
+
+    assert second == first
+    assert hashed == []
+    assert pipeline.stats["unchanged"] == 1 and pipeline.stats["copied"] == 0
+
+
+def test_oversized_files_are_dropped_without_pillow(tmp_path, no_pillow):
+    src = write_files(tmp_path / "src", {"a/big.png": _PNG + b"\0" * 2048, "a/small.png": _PNG})
+    pipeline = AssetPipeline(tmp_path / "data", max_size_mb=1 / 1024)
+
+    (project,), _ = run(pipeline, [record("a", src / "a/big.png", src / "a/small.png")])
+
+    assert len(project["assets"]["screenshots"]) == 1
+    assert pipeline.stats["skipped"] == 1
+
+
+def test_prune_removes_unreferenced_files(tmp_path, no_pillow):
+    src = write_files(tmp_path / "src", {"a/shot.png": _PNG, "b/other.png": _PNG + b"\0"})
+    pipeline = AssetPipeline(tmp_path / "data")
+    run(pipeline, [record("a", src / "a/shot.png"), record("b", src / "b/other.png")])
+
+    _, keep = run(pipeline, [record("a", src / "a/shot.png")])
+    assert pipeline.prune(keep) == 1
+
+    assert not (tmp_path / "data" / "assets" / "b").exists()
+    assert all((tmp_path / "data" / rel).exists() for rel in keep)
+
+
+def test_pillow_variants(tmp_path):
+    pytest.importorskip("PIL")
+    src = write_files(tmp_path / "src", {"a/shot.png": _PNG})
+
+    (project,), referenced = run(AssetPipeline(tmp_path / "data"), [record("a", src / "a/shot.png")])
+
+    image = project["assets"]["images"][0]
+    assert image["webp"].endswith(".webp") and image["thumbnail"].endswith(".thumb.webp")
+    assert {image["path"], image["webp"], image["thumbnail"]} == referenced
+
+
+def test_export_publishes_assets_into_the_data_dir(tmp_path, make_config, no_pillow):
+    root = write_files(tmp_path / "workspace", dict(SAMPLE_WORKSPACE, **{"web/screenshots/home.png": _PNG}))
+    config = make_config(f"""
+scanner:
+  git_activity: false
+output:
+  data_dir: "{tmp_path / 'data'}"
+  copy_assets: true
+""")
+    DataManager(config).export_stream(PortfolioScanner(config).iter_scan(root))
+
+    web = DataManager(config).find_project("web")
+    (shot,) = web["assets"]["screenshots"]
+    assert shot.startswith("assets/web/")
+    assert (tmp_path / "data" / shot).read_bytes() == _PNG
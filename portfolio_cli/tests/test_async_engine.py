@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from portfolio_ops.data_manager import DataManager
+from portfolio_ops.pipeline import async_ordered_map
+from portfolio_ops.scanner import PortfolioScanner
+
+from .helpers import BASE_CONFIG, SAMPLE_WORKSPACE, without_scan_times, write_files
+
+
+def async_config(make_config, tmp_path, concurrency=4):
+    return make_config(f"""
+scanner:
+  git_activity: false
+  engine: async
+  concurrency: {concurrency}
+output:
+  data_dir: "{tmp_path / 'data'}"
+  copy_assets: false
+""")
+
+
+def test_async_ordered_map_keeps_order_and_bounds_concurrency():
+    in_flight = peak = 0
+
+    async def work(n):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001 * (n % 3))
+        in_flight -= 1
+        return n * n
+
+    assert list(async_ordered_map(work, range(30), concurrency=3, queue_size=10)) == [n * n for n in range(30)]
+    assert peak == 3
+
+
+def test_async_ordered_map_cancels_pending_work_when_stopped():
+    started = []
+
+    async def work(n):
+        started.append(n)
+        await asyncio.sleep(0.01)
+        return n
+
+    results = async_ordered_map(work, range(100), concurrency=2, queue_size=4)
+    assert next(results) == 0
+    results.close()
+
+    assert len(started) <= 4
+
+
+def test_async_scan_matches_sync_scan(tmp_path, make_config):
+    root = write_files(tmp_path / "workspace", SAMPLE_WORKSPACE)
+
+    sync = PortfolioScanner(make_config(BASE_CONFIG)).scan(root)
+    scanner = PortfolioScanner(async_config(make_config, tmp_path))
+    projects = scanner.scan(root)
+
+    assert len(projects) == 5
+    assert without_scan_times(projects) == without_scan_times(sync)
+    assert set(scanner.fingerprints) == {p["path"] for p in projects}
+
+
+def test_async_incremental_scan_reruns_only_changed_stages(tmp_path, make_config):
+    root = write_files(tmp_path / "workspace", SAMPLE_WORKSPACE)
+    config = async_config(make_config, tmp_path)
+    scanner = PortfolioScanner(config)
+    data_manager = DataManager(config)
+    data_manager.save_cache(scanner.scan(root), scanner.fingerprints)
+    (root / "api" / "README.md").write_text("# API\n\nNow documented.\n")
+
+    scanner = PortfolioScanner(config)
+    parsed = []
+    parse = scanner.readme_parser.parse
+    scanner.readme_parser.parse = lambda directory, *a: parsed.append(directory.name) or parse(directory, *a)
+    projects = scanner.incremental_scan(root, data_manager.load_cache())
+
+    assert parsed == ["api"]
+    assert [p["slug"] for p in projects if "Now documented" in (p["readme"] or {}).get("content", "")] == ["api"]
+
+
+def test_unknown_engine_is_rejected(make_config):
+    with pytest.raises(ValueError, match="Unknown scan engine"):
+        PortfolioScanner(make_config("scanner:\n  engine: trio\n"))
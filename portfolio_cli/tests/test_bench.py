@@ -0,0 +1,52 @@
+import json
+
+from portfolio_ops.bench import LANGUAGE_TEMPLATES, format_report, generate_workspace, run_benchmark
+from portfolio_ops.fingerprint import STAGES
+from portfolio_ops.scanner import PortfolioScanner
+
+from .helpers import BASE_CONFIG, requires_git
+
+
+def tree(root):
+    return sorted((str(p.relative_to(root)), p.read_bytes() if p.is_file() else None)
+                  for p in root.rglob("*") if ".git" not in p.parts)
+
+
+def test_workspace_is_deterministic_and_covers_every_language(tmp_path, make_config):
+    params = dict(projects=len(LANGUAGE_TEMPLATES), depth=2, junk_files=5, commits=0, readme_kb=1, source_files=2)
+    generate_workspace(tmp_path / "a", **params)
+    generate_workspace(tmp_path / "b", **params)
+    assert tree(tmp_path / "a") == tree(tmp_path / "b")
+
+    projects = PortfolioScanner(make_config(BASE_CONFIG)).scan(tmp_path / "a")
+
+    assert sorted(p["metadata"]["language"] for p in projects) == sorted(LANGUAGE_TEMPLATES)
+    # Sources, manifest, README and screenshots; node_modules junk is pruned
+    assert {p["stats"]["file_count"] for p in projects} == {2 + 1 + 1 + 3}
+    assert all(len(p["assets"]["screenshots"]) == 3 for p in projects)
+
+
+@requires_git
+def test_generated_repositories_have_the_requested_commits(tmp_path, make_config):
+    generate_workspace(tmp_path / "ws", projects=2, depth=1, junk_files=0, commits=4, readme_kb=1, source_files=1)
+
+    config = make_config(BASE_CONFIG.replace("git_activity: false", "git_activity: true"))
+    projects = PortfolioScanner(config).scan(tmp_path / "ws")
+
+    assert [p["git"]["total_commits"] for p in projects] == [4, 4]
+
+
+def test_benchmark_report_covers_every_operation(tmp_path, make_config):
+    root = tmp_path / "ws"
+    generate_workspace(root, projects=3, depth=1, junk_files=5, commits=0, readme_kb=1, source_files=2)
+
+    report = run_benchmark(make_config(BASE_CONFIG), root, repeat=1)
+
+    assert report["project_count"] == 3
+    assert set(report["results"]) == {"scan", "incremental_scan", "incremental_scan_touched"}
+    assert set(report["stages"]) == {"discovery", "fingerprint", *STAGES}
+    assert set(report["data_manager"]) == {"export_projects", "load_projects", "load_index",
+                                           "find_project", "save_cache", "load_cache"}
+    assert len(report["startup"]["list"]["runs"]) == 1
+    assert json.loads(json.dumps(report)) == report
+    assert "cli list" in format_report(report)
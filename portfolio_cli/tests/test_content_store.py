@@ -0,0 +1,79 @@
+import pytest
+
+from portfolio_ops.content_store import ContentStore
+from portfolio_ops.data_manager import DataManager
+from portfolio_ops.scanner import PortfolioScanner
+
+from .helpers import SAMPLE_WORKSPACE, write_files
+
+README = "# Shared\n\nThe same text in two projects.\n"
+
+
+@pytest.fixture
+def scanned(tmp_path, make_config):
+    files = dict(SAMPLE_WORKSPACE, **{"web/README.md": README, "api/README.md": README,
+                                      "mobile/README.md": "# Mobile\n\nFlutter app.\n"})
+    root = write_files(tmp_path / "workspace", files)
+    return PortfolioScanner(make_config("scanner:\n  git_activity: false\n")).scan(root)
+
+
+def data_manager(make_config, data_dir, mode):
+    return DataManager(make_config(f"""
+output:
+  data_dir: "{data_dir}"
+  copy_assets: false
+  readme_content: {mode}
+"""))
+
+
+def test_store_mode_keeps_readme_text_out_of_records(tmp_path, make_config, scanned):
+    dm = data_manager(make_config, tmp_path / "data", "store")
+    dm.export_stream(scanned)
+
+    web = dm.find_project("web")
+    assert "content" not in web["readme"]
+    assert web["readme"]["content_path"] == f"content/{web['readme']['content_hash']}.md"
+    assert web["readme"]["preview"]
+    assert dm.load_readme(web) == README
+    assert README.encode() not in dm.projects_file.read_bytes()
+    assert README.encode() not in dm.cache_file.read_bytes()
+    # Identical READMEs share one file
+    assert len(list((tmp_path / "data" / "content").glob("*.md"))) == 2
+
+
+def test_switching_back_to_inline_restores_text_and_prunes_store(tmp_path, make_config, scanned):
+    data_dir = tmp_path / "data"
+    data_manager(make_config, data_dir, "store").export_stream(scanned)
+    stored = data_manager(make_config, data_dir, "store").load_projects()
+
+    inline = data_manager(make_config, data_dir, "inline")
+    inline.export_projects(stored)
+
+    assert inline.find_project("api")["readme"]["content"] == README
+    assert "content_hash" not in inline.find_project("api")["readme"]
+    assert list((data_dir / "content").glob("*.md")) == []
+
+
+def test_content_of_removed_projects_is_pruned(tmp_path, make_config, scanned):
+    dm = data_manager(make_config, tmp_path / "data", "store")
+    dm.export_stream(scanned)
+
+    dm.export_stream([p for p in scanned if p["slug"] != "mobile"])
+
+    assert len(list((tmp_path / "data" / "content").glob("*.md"))) == 1
+
+
+def test_put_is_content_addressed(tmp_path):
+    store = ContentStore(tmp_path)
+    digest, rel = store.put(README)
+
+    assert store.put(README) == (digest, rel)
+    assert store.get(digest) == README
+    assert store.get("0" * 64) is None
+    assert store.prune([digest]) == 0
+    assert store.prune([]) == 1
+
+
+def test_unknown_readme_mode_is_rejected(tmp_path, make_config):
+    with pytest.raises(ValueError, match="Unknown readme_content mode"):
+        data_manager(make_config, tmp_path / "data", "external")
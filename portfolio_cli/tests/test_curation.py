@@ -0,0 +1,101 @@
+import argparse
+import json
+
+import pytest
+
+from portfolio import PortfolioCLI
+from portfolio_ops.curation import EditError, apply_edits, load_edits
+from portfolio_ops.data_manager import DataManager
+from portfolio_ops.scanner import PortfolioScanner
+
+from .helpers import SAMPLE_WORKSPACE, write_files
+
+
+def project(pid, slug, name):
+    return {"id": pid, "slug": slug, "name": name, "path": f"/work/{slug}", "display": {}}
+
+
+def test_edit_formats_load_to_the_same_edits(tmp_path):
+    (tmp_path / "edits.yaml").write_text("edits:\n  - slug: web\n    featured: yes\n    priority: '3'\n")
+    (tmp_path / "edits.json").write_text(json.dumps([{"slug": "web", "featured": True, "priority": 3}]))
+    (tmp_path / "edits.csv").write_text("slug,featured,priority,category\nweb,true,3,\n")
+
+    expected = [{"selector": "slug", "value": "web", "set": {"featured": True, "priority": 3}}]
+    for name in ("edits.yaml", "edits.json", "edits.csv"):
+        assert load_edits(tmp_path / name) == expected
+
+
+@pytest.mark.parametrize("edit, message", [
+    ({"featured": True}, "exactly one of"),
+    ({"slug": "a", "name": "A", "featured": True}, "exactly one of"),
+    ({"slug": "a", "colour": "red"}, "unknown field"),
+    ({"slug": "a"}, "no fields to set"),
+    ({"slug": "a", "priority": "high"}, "priority must be an integer"),
+    ({"slug": "a", "visibility": "secret"}, "visibility must be one of"),
+    ({"slug": "a", "featured": "maybe"}, "featured must be true/false"),
+])
+def test_malformed_edits_are_rejected(tmp_path, edit, message):
+    path = tmp_path / "edits.json"
+    path.write_text(json.dumps([edit]))
+    with pytest.raises(EditError, match=message):
+        load_edits(path)
+
+
+def test_edits_apply_in_order_and_report_unmatched_selectors():
+    projects = [project("1", "test-alpha", "Test Alpha"), project("2", "test-beta", "Test Beta"),
+                project("3", "formqr", "Form QR")]
+    edits = [
+        {"selector": "glob", "value": "TEST-*", "set": {"visibility": "hidden"}},
+        {"selector": "name", "value": "  form qr ", "set": {"featured": True}},
+        {"selector": "slug", "value": "test-beta", "set": {"visibility": "public"}},
+        {"selector": "slug", "value": "missing", "set": {"featured": True}},
+    ]
+
+    changed, unmatched = apply_edits(projects, edits)
+
+    assert changed == {"1", "2", "3"}
+    assert [p["display"] for p in projects] == [
+        {"visibility": "hidden"}, {"visibility": "public"}, {"featured": True}]
+    assert unmatched == [edits[-1]]
+
+
+def test_unchanged_values_are_not_reported():
+    projects = [project("1", "web", "Web")]
+    projects[0]["display"] = {"featured": True}
+
+    changed, unmatched = apply_edits(projects, [{"selector": "id", "value": "1", "set": {"featured": True}}])
+
+    assert changed == set()
+    assert unmatched == []
+
+
+def test_apply_command_saves_once_and_warns_about_unmatched(tmp_path, monkeypatch, capsys):
+    root = write_files(tmp_path / "workspace", SAMPLE_WORKSPACE)
+    (tmp_path / "portfolio-config.yaml").write_text(f"""
+scanner:
+  git_activity: false
+output:
+  data_dir: "{tmp_path / 'data'}"
+  copy_assets: false
+""")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ".cache"))
+    monkeypatch.chdir(tmp_path)
+    cli = PortfolioCLI()
+    cli.data_manager.export_projects(PortfolioScanner(cli.config).scan(root))
+    (tmp_path / "edits.yaml").write_text("- slug: web\n  featured: true\n- slug: nowhere\n  priority: 1\n")
+
+    saves = []
+    save_projects = DataManager.save_projects
+    monkeypatch.setattr(DataManager, "save_projects",
+                        lambda self, *a, **kw: saves.append(a) or save_projects(self, *a, **kw))
+
+    cli.apply(argparse.Namespace(file=str(tmp_path / "edits.yaml"), dry_run=True))
+    assert saves == []
+    assert "Would update 1 projects from 2 edits" in capsys.readouterr().out
+
+    cli.apply(argparse.Namespace(file=str(tmp_path / "edits.yaml"), dry_run=False))
+    out = capsys.readouterr().out
+    assert len(saves) == 1
+    assert "Updated 1 projects from 2 edits" in out
+    assert "No project matched slug 'nowhere'" in out
+    assert cli.data_manager.find_project("web")["display"]["featured"] is True
@@ -0,0 +1,99 @@
+import importlib.metadata
+
+import pytest
+
+from portfolio_ops.detectors import DetectorRegistry, LanguageDetector
+from portfolio_ops.scanner import PortfolioScanner
+
+from .helpers import write_files
+
+ELIXIR = {"name": "elixir", "language": "Elixir", "framework": "Phoenix", "markers": ["mix.exs"]}
+
+
+def detect(root, files, detectors=None):
+    write_files(root, files)
+    return LanguageDetector(detectors=detectors).detect(root)
+
+
+def test_every_matching_language_is_reported(tmp_path):
+    result = detect(tmp_path, {"package.json": {"dependencies": {"react": "18"}}, "pyproject.toml": "",
+                               "go.mod": "module x\n"})
+
+    assert result["language"] == "JavaScript"
+    assert result["framework"] == "React"
+    assert result["languages"] == ["JavaScript", "Python", "Go"]
+    assert {"react", "python", "go"} <= set(result["tags"])
+
+
+def test_dependency_rules_pick_framework_and_type(tmp_path):
+    result = detect(tmp_path, {"package.json": {"dependencies": {"Express": "4", "react": "18", "next": "14"}}})
+
+    assert (result["framework"], result["type"]) == ("Next.js", "Backend/API")
+    assert result["tags"] == ["api", "backend", "javascript", "node", "react"]
+
+
+def test_glob_markers_match(tmp_path):
+    result = detect(tmp_path, {"App.csproj": "<Project/>"})
+
+    assert (result["language"], result["languages"]) == ("C#", ["C#"])
+
+
+def test_unrecognized_directory(tmp_path):
+    assert detect(tmp_path, {"notes.txt": "hi"}) is None
+
+
+def test_config_detectors_come_first_and_replace_builtins(tmp_path):
+    custom_go = {"name": "go", "language": "Go", "framework": "Gin", "markers": ["go.mod"], "type": "Backend/API"}
+    result = detect(tmp_path, {"mix.exs": "", "go.mod": "module x\n"}, [ELIXIR, custom_go])
+
+    assert result["language"] == "Elixir"
+    assert result["languages"] == ["Elixir", "Go"]
+    assert LanguageDetector(detectors=[custom_go]).detect(tmp_path)["framework"] == "Gin"
+
+
+def test_entry_point_detectors_are_loaded(tmp_path, monkeypatch, capsys):
+    class EntryPoint:
+        def __init__(self, name, value):
+            self.name, self.value = name, value
+
+        def load(self):
+            if isinstance(self.value, Exception):
+                raise self.value
+            return self.value
+
+    plugins = [EntryPoint("elixir", lambda: [ELIXIR]), EntryPoint("broken", ImportError("no module"))]
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda group: plugins)
+
+    registry = DetectorRegistry.build()
+
+    assert registry.detectors[0]["name"] == "elixir"
+    assert "Could not load detector plugin 'broken'" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("detector, message", [
+    ({"name": "x", "language": "X"}, "missing: markers"),
+    ({"name": "x", "language": "X", "markers": ["x"], "manifest": "Gemfile"}, "Unknown manifest"),
+    ("elixir", "must be a mapping"),
+])
+def test_invalid_detectors_are_rejected(detector, message):
+    with pytest.raises(ValueError, match=message):
+        DetectorRegistry([detector])
+
+
+def test_config_detector_markers_are_discovered(tmp_path, make_config):
+    root = write_files(tmp_path / "workspace", {"phx/mix.exs": "", "phx/lib/app.ex": ""})
+    config = make_config("""
+scanner:
+  git_activity: false
+  detectors:
+    - name: elixir
+      language: Elixir
+      framework: Phoenix
+      markers: [mix.exs]
+output:
+  copy_assets: false
+""")
+
+    (project,) = PortfolioScanner(config).scan(root)
+
+    assert (project["metadata"]["language"], project["metadata"]["framework"]) == ("Elixir", "Phoenix")
@@ -0,0 +1,47 @@
+from portfolio_ops.discovery import ProjectDiscovery
+
+from .helpers import SAMPLE_WORKSPACE, write_files
+
+
+def found_paths(discovery, root, max_depth=3):
+    return sorted(c.path.relative_to(root).as_posix() for c in discovery.find(root, max_depth))
+
+
+def test_finds_projects_with_their_listing(tmp_path):
+    root = write_files(tmp_path, SAMPLE_WORKSPACE)
+
+    candidates = {c.path.relative_to(root).as_posix(): c for c in ProjectDiscovery(["node_modules"]).find(root, 3)}
+
+    assert sorted(candidates) == ["api", "mobile", "tools/cli", "tools/lib", "web"]
+    assert candidates["web"].files == {"package.json", "README.md"}
+    assert candidates["web"].dirs == {"src"}
+
+
+def test_does_not_descend_into_projects_or_ignored_dirs(tmp_path):
+    root = write_files(tmp_path, {
+        "app/package.json": {"name": "app"},
+        "app/packages/inner/package.json": {"name": "inner"},
+        "node_modules/dep/package.json": {"name": "dep"},
+    })
+
+    assert found_paths(ProjectDiscovery(["node_modules"]), root) == ["app"]
+
+
+def test_honors_max_depth(tmp_path):
+    root = write_files(tmp_path, {"a/b/c/d/package.json": {"name": "deep"}})
+
+    assert found_paths(ProjectDiscovery([]), root, max_depth=2) == []
+    assert found_paths(ProjectDiscovery([]), root, max_depth=3) == ["a/b/c/d"]
+
+
+def test_configured_patterns_and_globs(tmp_path):
+    root = write_files(tmp_path, {
+        "dotnet/App.csproj": "<Project />",
+        "elixir/mix.exs": "defmodule App do\nend\n",
+        "notes/todo.txt": "nothing here",
+    })
+    discovery = ProjectDiscovery([], {"elixir": ["mix.exs"]})
+
+    assert found_paths(discovery, root) == ["dotnet", "elixir"]
+    assert discovery.pattern_language({"mix.exs"}) == "elixir"
+    assert discovery.candidate(root / "notes") is None
@@ -0,0 +1,14 @@
+import os
+
+from portfolio_ops.fingerprint import Fingerprinter
+
+
+def test_symlinked_directories_are_not_followed(tmp_path):
+    (tmp_path / "index.js").write_text("console.log(1);\n")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "notes.txt").write_text("notes\n")
+    os.symlink("..", tmp_path / "sub" / "loop")
+
+    paths = [rel for rel, _ in Fingerprinter(ignore_dirs=["node_modules"])._walk(tmp_path)]
+
+    assert paths == ["index.js", "sub/", "sub/loop", "sub/notes.txt"]
@@ -0,0 +1,106 @@
+import pytest
+
+from portfolio_ops import git_activity
+from portfolio_ops.git_activity import ActivityAnalyzer
+from portfolio_ops.git_analyzer import GitAnalyzer
+
+from .helpers import commit, git, init_repo, requires_git
+
+pytestmark = requires_git
+
+BOB = ("Bob", "bob@example.com")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = init_repo(tmp_path / "repo")
+    # Mon 2024-01-01 and Wed 2024-01-03, then Mon 2024-01-15 (an empty week between)
+    commit(repo, {"a.txt": "1\n2\n3\n"}, "2024-01-01T09:00:00+00:00", "one")
+    commit(repo, {"a.txt": "1\n"}, "2024-01-03T09:00:00+00:00", "two", author=BOB)
+    commit(repo, {"b.bin": b"\0\1\2"}, "2024-01-03T18:00:00+00:00", "three", author=BOB)
+    commit(repo, {"c.txt": "x\n"}, "2024-01-15T23:30:00-08:00", "four")
+    return repo
+
+
+def head(repo):
+    return git(repo, "rev-parse", "HEAD")
+
+
+def streamed(monkeypatch):
+    ranges = []
+    stream = ActivityAnalyzer._stream
+    monkeypatch.setattr(ActivityAnalyzer, "_stream",
+                        lambda self, d, revisions, totals: ranges.append(revisions) or stream(self, d, revisions, totals))
+    return ranges
+
+
+def test_aggregate(repo):
+    activity = ActivityAnalyzer().analyze(repo, head(repo))
+
+    assert activity["start"] == "2024-01-01"
+    assert activity["weekly"] == [3, 0, 1]
+    # Bits: Monday and Wednesday, then Monday in the author's own time zone
+    assert activity["days"] == [0b101, 0, 0b1]
+    assert (activity["commits"], activity["active_days"]) == (4, 3)
+    assert (activity["lines_added"], activity["lines_deleted"]) == (4, 2)
+    assert activity["contributors"] == [
+        {"name": "Ada", "email": "ada@example.com", "commits": 2, "added": 4, "deleted": 0},
+        {"name": "Bob", "email": "bob@example.com", "commits": 2, "added": 0, "deleted": 2},
+    ]
+    assert activity["head_sha"] == head(repo)
+
+
+def test_extension_from_cached_sha_matches_full_recompute(repo, monkeypatch):
+    analyzer = ActivityAnalyzer()
+    before = analyzer.analyze(repo, head(repo))
+    old_head = head(repo)
+    commit(repo, {"a.txt": "1\n2\n"}, "2024-02-01T10:00:00+00:00", "five", author=("Carol", "carol@example.com"))
+
+    ranges = streamed(monkeypatch)
+    extended = analyzer.analyze(repo, head(repo), before)
+
+    assert ranges == [f"{old_head}..{head(repo)}"]
+    assert extended == analyzer.analyze(repo, head(repo))
+    assert extended["commits"] == 5 and len(extended["weekly"]) == 5
+
+
+def test_unchanged_head_reads_nothing(repo, monkeypatch):
+    analyzer = ActivityAnalyzer()
+    before = analyzer.analyze(repo, head(repo))
+    ranges = streamed(monkeypatch)
+
+    assert analyzer.analyze(repo, head(repo), before) is before
+    assert ranges == []
+
+
+def test_rewritten_history_is_read_in_full(repo, monkeypatch):
+    analyzer = ActivityAnalyzer()
+    before = analyzer.analyze(repo, head(repo))
+    new_date = "2024-01-16T10:00:00+00:00"
+    git(repo, "commit", "-q", "--amend", "-m", "four again", f"--date={new_date}", date=new_date)
+
+    ranges = streamed(monkeypatch)
+    activity = analyzer.analyze(repo, head(repo), before)
+
+    assert ranges == [head(repo)]
+    assert activity["days"] == [0b101, 0, 0b10]
+    assert activity["commits"] == 4
+
+
+def test_stale_layout_is_rebuilt(repo, monkeypatch):
+    analyzer = ActivityAnalyzer()
+    before = dict(analyzer.analyze(repo, head(repo)), version=git_activity.ACTIVITY_VERSION - 1)
+    ranges = streamed(monkeypatch)
+
+    assert analyzer.analyze(repo, head(repo), before)["version"] == git_activity.ACTIVITY_VERSION
+    assert ranges == [head(repo)]
+
+
+def test_git_block_carries_activity(repo):
+    block = GitAnalyzer("cli", activity=True).analyze(repo)
+    assert block["activity"]["commits"] == block["total_commits"] == 4
+
+    commit(repo, {"d.txt": "y\n"}, "2024-01-17T10:00:00+00:00", "five")
+    extended = GitAnalyzer("cli", activity=True).analyze(repo, block)
+    assert extended["activity"] == ActivityAnalyzer().analyze(repo, head(repo))
+    assert "activity" not in GitAnalyzer("cli").analyze(repo)
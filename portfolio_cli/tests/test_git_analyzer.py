@@ -0,0 +1,59 @@
+import subprocess
+
+import pytest
+
+from portfolio_ops.git_analyzer import CliBackend, GitAnalyzer, RefsBackend, find_git_dir, read_head, read_remote_url
+
+from .helpers import commit, git, init_repo, requires_git
+
+pytestmark = requires_git
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = init_repo(tmp_path / "repo")
+    commit(repo, {"a.txt": "1\n"}, "2024-01-05T10:00:00+00:00", "first")
+    commit(repo, {"a.txt": "2\n"}, "2024-03-10T12:00:00+01:00", "second")
+    git(repo, "remote", "add", "origin", "https://example.com/repo.git")
+    return repo
+
+
+def test_refs_are_read_without_git(repo):
+    git_dir = find_git_dir(repo)
+
+    assert read_head(git_dir) == ("main", git(repo, "rev-parse", "HEAD"))
+    assert read_remote_url(git_dir) == "https://example.com/repo.git"
+
+
+def test_backends_agree_on_history(repo):
+    sha = git(repo, "rev-parse", "HEAD")
+
+    cli = CliBackend().history(repo, sha)
+    refs = RefsBackend().history(repo, sha)
+
+    assert cli == {"total_commits": 2, "last_commit": "2024-03-10T12:00:00+01:00",
+                   "first_commit": "2024-01-05T10:00:00+00:00"}
+    assert refs["last_commit"] == cli["last_commit"]
+
+
+def test_history_is_reused_while_head_is_unchanged(repo, monkeypatch):
+    first = GitAnalyzer("cli").analyze(repo)
+    assert first["total_commits"] == 2 and first["branch"] == "main"
+
+    calls = []
+    real_run = subprocess.run
+    monkeypatch.setattr(subprocess, "run", lambda *a, **kw: calls.append(a) or real_run(*a, **kw))
+
+    again = GitAnalyzer("cli").analyze(repo, previous=first)
+
+    assert again == first
+    assert calls == []
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown git backend"):
+        GitAnalyzer("svn")
+
+
+def test_not_a_repository(tmp_path):
+    assert GitAnalyzer("cli").analyze(tmp_path)["is_repo"] is False
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from portfolio_ops.data_manager import INDEX_FIELDS, DataManager
+from portfolio_ops.scanner import PortfolioScanner
+
+from .helpers import SAMPLE_WORKSPACE, write_files
+
+
+@pytest.fixture
+def scanned(tmp_path, make_config):
+    root = write_files(tmp_path / "workspace", SAMPLE_WORKSPACE)
+    config = make_config("scanner:\n  git_activity: false\n")
+    return PortfolioScanner(config).scan(root)
+
+
+def data_manager(make_config, data_dir, layout):
+    return DataManager(make_config(f"""
+output:
+  data_dir: "{data_dir}"
+  layout: {layout}
+  copy_assets: false
+"""))
+
+
+def test_sharded_layout_round_trips(tmp_path, make_config, scanned):
+    dm = data_manager(make_config, tmp_path / "data", "sharded")
+    dm.export_projects(scanned)
+
+    index = json.loads((tmp_path / "data" / "index.json").read_text())
+    assert [set(entry) for entry in index] == [set(INDEX_FIELDS) | {"shard"}] * len(scanned)
+    assert "readme" not in index[0]
+    assert dm.load_projects() == scanned
+    assert dm.export_target.name == "index.json"
+
+
+def test_switching_layouts_removes_stale_files(tmp_path, make_config, scanned):
+    data_dir = tmp_path / "data"
+    data_manager(make_config, data_dir, "single").export_projects(scanned)
+    assert (data_dir / "projects.json").exists()
+
+    data_manager(make_config, data_dir, "sharded").export_projects(scanned)
+    assert not (data_dir / "projects.json").exists()
+
+    data_manager(make_config, data_dir, "single").export_projects(scanned)
+    assert not (data_dir / "index.json").exists()
+    assert json.loads((data_dir / "projects.json").read_text()) == scanned
+
+
+def test_single_project_edit_rewrites_one_shard(tmp_path, make_config, scanned):
+    dm = data_manager(make_config, tmp_path / "data", "sharded")
+    dm.export_projects(scanned)
+    shards = {p["id"]: tmp_path / "data" / "projects" / f"{p['id']}.json" for p in scanned}
+    before = {pid: path.stat().st_mtime_ns for pid, path in shards.items()}
+
+    project = dict(scanned[0], display={**scanned[0]["display"], "featured": True})
+    dm.save_project(project)
+
+    changed = [pid for pid, path in shards.items() if path.stat().st_mtime_ns != before[pid]]
+    assert changed == [project["id"]]
+    assert dm.find_project(project["slug"])["display"]["featured"] is True
+
+
+def test_shards_of_removed_projects_are_dropped(tmp_path, make_config, scanned):
+    dm = data_manager(make_config, tmp_path / "data", "sharded")
+    dm.export_projects(scanned)
+    dm.export_projects(scanned[1:])
+
+    remaining = sorted(p.stem for p in (tmp_path / "data" / "projects").glob("*.json"))
+    assert remaining == sorted(p["id"] for p in scanned[1:])
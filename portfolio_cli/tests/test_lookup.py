@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from portfolio_ops.data_manager import DataManager
+from portfolio_ops.lookup import LookupIndex
+from portfolio_ops.scanner import PortfolioScanner
+
+from .helpers import SAMPLE_WORKSPACE, write_files
+
+
+@pytest.fixture
+def scanned(tmp_path, make_config):
+    root = write_files(tmp_path / "workspace", SAMPLE_WORKSPACE)
+    return PortfolioScanner(make_config("scanner:\n  git_activity: false\n")).scan(root)
+
+
+def data_manager(make_config, data_dir, layout="single"):
+    return DataManager(make_config(f"""
+output:
+  data_dir: "{data_dir}"
+  layout: {layout}
+  copy_assets: false
+"""))
+
+
+@pytest.mark.parametrize("layout", ["single", "sharded"])
+def test_find_by_id_slug_name_and_path(tmp_path, make_config, scanned, layout):
+    dm = data_manager(make_config, tmp_path / "data", layout)
+    dm.export_projects(scanned)
+    web = next(p for p in scanned if p["path"].endswith("web"))
+
+    for key in (web["id"], web["slug"], f"  {web['name'].upper()} ", web["path"]):
+        assert dm.find_project(key) == web
+    assert dm.find_project("no-such-project") is None
+
+
+def test_lookup_points_at_each_record(tmp_path, make_config, scanned):
+    dm = data_manager(make_config, tmp_path / "data")
+    dm.export_projects(scanned)
+
+    lookup = LookupIndex.load(tmp_path / "data" / "lookup.json")
+    raw = (tmp_path / "data" / "projects.json").read_bytes()
+    for proj in scanned:
+        record = lookup.records[proj["id"]]
+        assert json.loads(raw[record["offset"]:record["offset"] + record["length"]]) == proj
+
+
+def test_external_rewrite_rebuilds_the_lookup(tmp_path, make_config, scanned):
+    dm = data_manager(make_config, tmp_path / "data")
+    dm.export_projects(scanned)
+
+    # Another tool rewrites projects.json with a different order and spacing
+    (tmp_path / "data" / "projects.json").write_text(json.dumps(scanned[::-1]))
+    fresh = data_manager(make_config, tmp_path / "data")
+
+    assert fresh.find_project(scanned[0]["slug"]) == scanned[0]
+
+
+def test_slug_collisions_are_reported(tmp_path, make_config, scanned):
+    dm = data_manager(make_config, tmp_path / "data")
+    twins = [dict(scanned[0], id="aaa"), dict(scanned[0], id="bbb", path="/elsewhere/web")]
+    dm.export_projects(twins)
+
+    assert dm.slug_collisions() == {scanned[0]["slug"]: ["aaa", "bbb"]}
@@ -0,0 +1,73 @@
+from portfolio_ops.data_manager import DataManager
+from portfolio_ops.manifest_cache import ManifestCache
+from portfolio_ops.scanner import PortfolioScanner
+
+from .helpers import write_files
+
+NOT_UTF8 = b"name: caf\xe9_app\ndescription: \xff\xfe\n"
+
+
+def test_undecodable_manifest_is_unreadable(tmp_path):
+    write_files(tmp_path, {"pubspec.yaml": NOT_UTF8})
+
+    assert ManifestCache().get(tmp_path / "pubspec.yaml") is None
+
+
+def test_undecodable_manifest_does_not_drop_project(tmp_path, make_config):
+    root = write_files(tmp_path / "workspace", {
+        "app/pubspec.yaml": NOT_UTF8,
+        "app/lib/main.dart": "void main() {}\n",
+        "web/package.json": {"name": "web"},
+    })
+    config = make_config("scanner:\n  git_activity: false\noutput:\n  copy_assets: false\n")
+
+    projects = PortfolioScanner(config).scan(root)
+
+    assert sorted(p["path"].rsplit("/", 1)[1] for p in projects) == ["app", "web"]
+
+
+def test_unchanged_manifest_is_parsed_once(tmp_path):
+    write_files(tmp_path, {"package.json": {"name": "web", "dependencies": {"React": "18"}}})
+    cache = ManifestCache()
+
+    first = cache.get(tmp_path / "package.json")
+    second = cache.get(tmp_path / "package.json")
+
+    assert first == second == {"name": "web", "dependencies": ["react"]}
+    assert cache.parsed == 1
+
+
+def test_persisted_entries_skip_parsing_until_the_file_changes(tmp_path, make_config):
+    root = write_files(tmp_path / "workspace", {
+        "web/package.json": {"name": "web", "dependencies": {"next": "14"}},
+        "app/pubspec.yaml": "name: app\n",
+    })
+    config = make_config(f"""
+scanner:
+  git_activity: false
+output:
+  data_dir: "{tmp_path / 'data'}"
+  copy_assets: false
+""")
+    scanner = PortfolioScanner(config)
+    scanner.scan(root)
+    data_manager = DataManager(config)
+    data_manager.save_manifests(scanner.manifests.snapshot(scanner.fingerprints))
+
+    scanner = PortfolioScanner(config)
+    scanner.manifests.update(data_manager.load_manifests())
+    scanner.scan(root)
+    assert scanner.manifests.parsed == 0
+
+    write_files(root, {"web/package.json": {"name": "web", "dependencies": {"react": "18"}}})
+    scanner.scan(root)
+    assert scanner.manifests.parsed == 1
+
+
+def test_snapshot_keeps_only_scanned_projects(tmp_path):
+    write_files(tmp_path, {"a/package.json": {"name": "a"}, "b/package.json": {"name": "b"}})
+    cache = ManifestCache()
+    cache.get(tmp_path / "a" / "package.json")
+    cache.get(tmp_path / "b" / "package.json")
+
+    assert list(cache.snapshot([str(tmp_path / "a")])) == [str(tmp_path / "a" / "package.json")]
@@ -0,0 +1,48 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from portfolio_ops.pipeline import make_executor, ordered_map
+from portfolio_ops.scanner import PortfolioScanner
+
+from .helpers import BASE_CONFIG, SAMPLE_WORKSPACE, without_scan_times, write_files
+
+
+def test_ordered_map_keeps_input_order_and_bounds_in_flight():
+    in_flight = peak = 0
+    lock = threading.Lock()
+
+    def work(n):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.001 * (n % 3))
+        with lock:
+            in_flight -= 1
+        return n * n
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(ordered_map(executor, work, range(40), queue_size=3))
+
+    assert results == [n * n for n in range(40)]
+    assert peak <= 3
+
+
+def test_make_executor_rejects_unknown_kind():
+    with pytest.raises(ValueError, match="Unknown executor type"):
+        make_executor(2, "fiber")
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_scan_matches_serial(tmp_path, make_config, executor):
+    root = write_files(tmp_path / "workspace", SAMPLE_WORKSPACE)
+    config = make_config(BASE_CONFIG.replace("scanner:\n", f"scanner:\n  executor: {executor}\n"))
+
+    serial = PortfolioScanner(config).scan(root, workers=1)
+    parallel = PortfolioScanner(config).scan(root, workers=4)
+
+    assert len(serial) == 5
+    assert without_scan_times(parallel) == without_scan_times(serial)
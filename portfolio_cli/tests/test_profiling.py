@@ -0,0 +1,50 @@
+import os
+import threading
+
+from portfolio_ops import profiling
+from portfolio_ops.stats import StatsCounter
+
+
+def _open_fds():
+    return len(os.listdir("/proc/self/fd"))
+
+
+def test_scandir_stats_are_counted(tmp_path):
+    for i in range(5):
+        (tmp_path / f"file{i}.js").write_text("let x = 1;\n")
+
+    profiler = profiling.StageProfiler()
+    with profiling.hooks():
+        with profiler.stage("stats"):
+            StatsCounter(ignore_dirs=[]).count(tmp_path)
+
+    span = profiler.spans[0]
+    assert span["stats"] >= 5
+    assert span["listdirs"] == 1
+
+
+def test_hooks_are_removed_after_the_run():
+    original_stat, original_lstat = os.stat, os.lstat
+    with profiling.hooks():
+        with profiling.hooks():
+            assert os.stat is not original_stat
+        assert os.stat is not original_stat
+    assert os.stat is original_stat
+    assert os.lstat is original_lstat
+
+
+def test_thread_io_descriptors_are_closed():
+    before = _open_fds()
+
+    def work():
+        with profiling.StageProfiler().stage("readme"):
+            os.stat(".")
+
+    with profiling.hooks():
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert _open_fds() == before
@@ -0,0 +1,88 @@
+import re
+
+from portfolio_ops.readme_parser import MAX_HEADINGS, PREVIEW_LENGTH, ReadmeParser
+from portfolio_ops.scanner import PortfolioScanner
+
+README = """\
+# FormQR
+
+Turns forms into QR codes.
+Works offline.
+
+[![Website](https://img.shields.io/badge/site-up-green)](https://formqr.example.com)
+
+![Screenshot](docs/screen.png "Main view")
+
+## Install
+
+```bash
+# not a heading
+npm install
+![not an image](ignored.png)
+```
+
+~~~
+## still code
+~~~
+
+## Usage
+
+<img src="docs/usage.gif" width="300">
+"""
+
+
+def test_single_pass_collects_every_field():
+    result = ReadmeParser().analyze(README)
+
+    assert result["headings"] == ["FormQR", "Install", "Usage"]
+    assert result["preview"] == "Turns forms into QR codes. Works offline."
+    assert result["demo_url"] == "https://formqr.example.com"
+    assert result["has_demo"] is True
+    assert result["images"] == ["https://img.shields.io/badge/site-up-green", "docs/screen.png", "docs/usage.gif"]
+    assert result["word_count"] == len(re.findall(r"\b\w+\b", README))
+
+
+def test_unclosed_fence_hides_the_rest_of_the_file():
+    result = ReadmeParser().analyze("# Title\n\nIntro.\n\n```\n# code\n\n## also code\n")
+
+    assert result["headings"] == ["Title"]
+    assert result["preview"] == "Intro."
+
+
+def test_inline_demo_link_wins_over_badge():
+    content = "[![Docs](https://img.shields.io/x)](https://badge.example.com)\n\nTry the live demo at https://demo.example.com\n"
+
+    assert ReadmeParser().analyze(content)["demo_url"] == "https://demo.example.com"
+
+
+def test_limits_are_applied():
+    content = "".join(f"## Heading {i}\n\n" for i in range(MAX_HEADINGS + 5)) + "word " * 200
+    content = "Intro " * 200 + "\n\n" + content
+    result = ReadmeParser().analyze(content)
+
+    assert len(result["headings"]) == MAX_HEADINGS
+    assert len(result["preview"]) == PREVIEW_LENGTH
+
+
+def test_read_budget_truncates_large_readmes(tmp_path):
+    (tmp_path / "README.md").write_text("# Big\n\n" + "é" * 4000)
+
+    result = ReadmeParser(max_bytes=1024).parse(tmp_path)
+
+    assert result["truncated"] is True
+    assert len(result["content"].encode()) <= 1024
+    assert result["headings"] == ["Big"]
+    assert ReadmeParser().parse(tmp_path)["truncated"] is False
+
+
+def test_missing_readme(tmp_path):
+    result = ReadmeParser().parse(tmp_path, files=frozenset({"package.json"}))
+
+    assert result["exists"] is False
+    assert result["word_count"] == 0
+
+
+def test_scanner_uses_configured_budget(make_config):
+    scanner = PortfolioScanner(make_config("scanner:\n  readme_max_kb: 2\n"))
+
+    assert scanner.readme_parser.max_bytes == 2048
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from portfolio_ops import serialization
+from portfolio_ops.data_manager import DataManager
+from portfolio_ops.scanner import PortfolioScanner
+from portfolio_ops.serialization import AtomicWriter, atomic_write, dumps, loads, resolve_serializer
+
+from .helpers import SAMPLE_WORKSPACE, write_files
+
+SAMPLE = [{"name": "Café", "tags": ["a", "ü"], "stats": {"files": 3, "lines": 0}, "readme": None,
+           "featured": False, "nested": {"empty": [], "also_empty": {}}}]
+
+BACKENDS = [name for name in ("orjson", "msgspec") if getattr(serialization, name) is not None] + ["json"]
+
+
+@pytest.mark.parametrize("serializer", BACKENDS)
+def test_backends_match_the_standard_library(serializer):
+    assert dumps(SAMPLE, True, serializer) == json.dumps(SAMPLE, indent=2, ensure_ascii=False).encode()
+    assert loads(dumps(SAMPLE, False, serializer)) == SAMPLE
+    assert b"\n" not in dumps(SAMPLE, False, serializer)
+
+
+def test_serializer_resolution(monkeypatch):
+    with pytest.raises(ValueError, match="Unknown serializer"):
+        resolve_serializer("pickle")
+    assert resolve_serializer("json") == "json"
+
+    monkeypatch.setattr(serialization, "orjson", None)
+    monkeypatch.setattr(serialization, "msgspec", None)
+    assert [resolve_serializer(name) for name in ("auto", "orjson", "msgspec")] == ["json"] * 3
+
+
+def test_failed_write_leaves_target_untouched(tmp_path):
+    target = tmp_path / "projects.json"
+    target.write_bytes(b"[]")
+
+    with pytest.raises(RuntimeError):
+        with AtomicWriter(target) as f:
+            f.write(b"[{\"partial\":")
+            raise RuntimeError("interrupted")
+
+    assert target.read_bytes() == b"[]"
+    assert [p.name for p in tmp_path.iterdir()] == ["projects.json"]
+
+
+def test_atomic_write_replaces_and_keeps_mode(tmp_path):
+    target = tmp_path / "data" / "projects.json"
+    atomic_write(target, b"[1]")
+    target.chmod(0o600)
+
+    atomic_write(target, b"[2]")
+
+    assert target.read_bytes() == b"[2]"
+    assert target.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in target.parent.iterdir()] == ["projects.json"]
+
+
+@pytest.mark.parametrize("output_format", ["pretty", "compact"])
+def test_streamed_projects_file_matches_json_dumps(tmp_path, make_config, output_format):
+    root = write_files(tmp_path / "workspace", SAMPLE_WORKSPACE)
+    config = make_config(f"""
+scanner:
+  git_activity: false
+output:
+  data_dir: "{tmp_path / 'data'}"
+  copy_assets: false
+  format: {output_format}
+""")
+    projects = PortfolioScanner(config).scan(root)
+    DataManager(config).export_projects(projects)
+
+    written = (tmp_path / "data" / "projects.json").read_bytes()
+    if output_format == "pretty":
+        assert written == json.dumps(projects, indent=2, ensure_ascii=False).encode()
+    else:
+        assert b"\n" not in written
+    assert json.loads(written) == projects
@@ -0,0 +1,90 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from portfolio_ops.sharding import find_shard_dirs, shard_dir
+
+PORTFOLIO = Path(__file__).resolve().parent.parent / "portfolio.py"
+
+CONFIG = """scanner:
+  git_activity: false
+output:
+  data_dir: "./portfolio-data"
+  copy_assets: false
+"""
+
+
+def make_tree(root, names):
+    for name in names:
+        project = root / name
+        project.mkdir(parents=True, exist_ok=True)
+        (project / "package.json").write_text(json.dumps({"name": name, "description": f"{name} app"}))
+        (project / "index.js").write_text("console.log(1);\n")
+
+
+def run(workdir, *args):
+    env = dict(os.environ, XDG_CACHE_HOME=str(workdir / ".cache"))
+    return subprocess.Popen([sys.executable, str(PORTFOLIO), *args], cwd=workdir, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+
+def wait_all(procs):
+    for proc in procs:
+        _, err = proc.communicate()
+        assert proc.returncode == 0, err
+
+
+def scanned(workdir):
+    projects = json.loads((workdir / "portfolio-data" / "projects.json").read_text())
+    return sorted((p["id"], p["path"], p["name"]) for p in projects)
+
+
+def make_workspace(tmp_path, name):
+    workdir = tmp_path / name
+    workdir.mkdir()
+    (workdir / "portfolio-config.yaml").write_text(CONFIG)
+    return workdir
+
+
+def test_parallel_shards_merge_to_full_scan(tmp_path):
+    tree = tmp_path / "tree"
+    make_tree(tree, [f"app-{i}" for i in range(12)] + [f"group/lib-{i}" for i in range(6)])
+
+    full = make_workspace(tmp_path, "full")
+    wait_all([run(full, "generate", "--path", str(tree))])
+
+    sharded = make_workspace(tmp_path, "sharded")
+    count = 3
+    wait_all([run(sharded, "generate", "--path", str(tree), "--shard", f"{i}/{count}")
+              for i in range(1, count + 1)])
+    wait_all([run(sharded, "merge")])
+
+    assert len(scanned(full)) == 18
+    assert scanned(sharded) == scanned(full)
+
+
+def test_merge_uses_newest_shard_set(tmp_path):
+    tree = tmp_path / "tree"
+    make_tree(tree, ["a", "b", "c", "d"])
+    workdir = make_workspace(tmp_path, "work")
+
+    wait_all([run(workdir, "generate", "--path", str(tree), "--shard", f"{i}/3") for i in (1, 2, 3)])
+    for path in (tree / "b").iterdir():
+        path.unlink()
+    (tree / "b").rmdir()
+    wait_all([run(workdir, "generate", "--path", str(tree), "--shard", f"{i}/2") for i in (1, 2)])
+    wait_all([run(workdir, "merge")])
+
+    assert sorted(Path(path).name for _, path, _ in scanned(workdir)) == ["a", "c", "d"]
+
+
+def test_find_shard_dirs_rejects_incomplete_set(tmp_path):
+    for index in (1, 3):
+        shard_dir(tmp_path, index, 3).mkdir(parents=True)
+
+    with pytest.raises(ValueError, match="missing 2 of 3"):
+        find_shard_dirs(tmp_path)
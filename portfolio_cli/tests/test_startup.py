@@ -0,0 +1,74 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from portfolio_ops.config import Config
+
+PORTFOLIO = Path(__file__).resolve().parent.parent / "portfolio.py"
+
+# Run a command in a fresh interpreter and report which heavy modules it imported
+PROBE = """
+import json, os, runpy, sys
+sys.argv = sys.argv[1:]
+sys.path.insert(0, os.path.dirname(sys.argv[0]))
+try:
+    runpy.run_path(sys.argv[0], run_name="__main__")
+except SystemExit:
+    pass
+heavy = ("yaml", "sqlite3", "asyncio", "git", "portfolio_ops.scanner", "portfolio_ops.git_analyzer")
+print(json.dumps(sorted(m for m in heavy if m in sys.modules)), file=sys.stderr)
+"""
+
+
+def imported(workdir, *args):
+    env = dict(os.environ, XDG_CACHE_HOME=str(workdir / ".cache"))
+    result = subprocess.run([sys.executable, "-c", PROBE, str(PORTFOLIO), *args], cwd=workdir, env=env,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+
+def test_list_imports_no_heavy_modules(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "projects.json").write_text("[]")
+    (tmp_path / "portfolio-config.yaml").write_text(f'output:\n  data_dir: "{data_dir}"\n')
+
+    # The first run parses the YAML and fills the config cache
+    assert imported(tmp_path, "list") == ["yaml"]
+    assert imported(tmp_path, "list") == []
+    assert imported(tmp_path, "show", "anything") == []
+
+
+def test_config_is_served_from_cache_until_the_file_changes(tmp_path, make_config, monkeypatch):
+    config = make_config("scanner:\n  max_depth: 5\n")
+    path = config._config_path
+
+    monkeypatch.setattr(Config, "_safe_yaml_load", lambda self, text: pytest.fail("YAML parsed"))
+    assert Config(path).max_depth == 5
+
+    monkeypatch.undo()
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ".cache"))
+    path.write_text("scanner:\n  max_depth: 7\n  workers: 2\n")
+    assert Config(path).max_depth == 7
+
+
+def test_values_json_cannot_hold_are_loaded_without_caching(tmp_path, make_config):
+    config = make_config("display:\n  since: 2024-01-02\n")
+
+    assert config.max_depth == Config(config._config_path).max_depth
+    assert not any((tmp_path / ".cache" / "portfolio-ops").glob("*.tmp"))
+
+
+def test_components_are_built_on_first_use(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ".cache"))
+    monkeypatch.chdir(tmp_path)
+    from portfolio import PortfolioCLI
+
+    cli = PortfolioCLI()
+
+    assert "scanner" not in vars(cli) and "data_manager" not in vars(cli)
+    assert not (tmp_path / "portfolio-data").exists()
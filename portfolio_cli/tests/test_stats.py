@@ -0,0 +1,16 @@
+import os
+
+from portfolio_ops.stats import StatsCounter
+
+
+def test_symlinked_directories_are_not_followed(tmp_path):
+    (tmp_path / "index.js").write_text("console.log(1);\n")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "notes.txt").write_text("notes\n")
+    os.symlink("..", tmp_path / "sub" / "loop")
+
+    stats = StatsCounter(ignore_dirs=["node_modules"]).count(tmp_path)
+
+    assert stats["lines_of_code"] == 1
+    assert stats["file_count"] == 2
+    assert stats["languages"] == {"JavaScript": 1}
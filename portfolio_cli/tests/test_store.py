@@ -0,0 +1,118 @@
+import argparse
+import json
+
+import pytest
+
+from portfolio import PortfolioCLI
+from portfolio_ops.data_manager import DataManager
+from portfolio_ops.scanner import PortfolioScanner
+
+from .helpers import SAMPLE_WORKSPACE, write_files
+
+WORKSPACE = dict(SAMPLE_WORKSPACE, **{"web/pyproject.toml": "[project]\nname = 'web'\n"})
+
+CONFIG = """
+scanner:
+  git_activity: false
+output:
+  data_dir: "{data_dir}"
+  copy_assets: false
+  backend: {backend}
+"""
+
+
+@pytest.fixture
+def root(tmp_path):
+    return write_files(tmp_path / "workspace", WORKSPACE)
+
+
+def exported(make_config, data_dir, backend, root):
+    config = make_config(CONFIG.format(data_dir=data_dir, backend=backend))
+    projects = PortfolioScanner(config).scan(root)
+    for project, (category, featured, priority) in zip(projects, [("Web", True, 5), ("backend", False, 9),
+                                                                  ("web", True, 1), (None, False, 0),
+                                                                  (None, True, 3)]):
+        project["display"].update(category=category, featured=featured, priority=priority)
+    dm = DataManager(config)
+    dm.export_stream(projects)
+    return dm
+
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {"language": "python"},
+    {"language": "Rust"},
+    {"category": "WEB"},
+    {"featured": True},
+    {"featured": False, "sort": "name"},
+    {"sort": "priority", "limit": 3},
+    {"language": "javascript", "featured": True, "sort": "name"},
+])
+def test_sqlite_queries_match_json(tmp_path, make_config, root, filters):
+    json_dm = exported(make_config, tmp_path / "json", "json", root)
+    sqlite_dm = exported(make_config, tmp_path / "sqlite", "sqlite", root)
+
+    expected = [p["slug"] for p in json_dm.query(**filters)]
+    assert expected
+    assert [p["slug"] for p in sqlite_dm.query(**filters)] == expected
+
+
+def test_secondary_languages_are_queryable(tmp_path, make_config, root):
+    dm = exported(make_config, tmp_path / "data", "sqlite", root)
+
+    assert sorted(p["slug"] for p in dm.query(language="Python")) == ["api", "web"]
+    assert dm.find_project("web")["metadata"]["language"] == "JavaScript"
+
+
+def test_store_exports_files_and_keeps_the_cache(tmp_path, make_config, root):
+    config = make_config(CONFIG.format(data_dir=tmp_path / "data", backend="sqlite"))
+    scanner = PortfolioScanner(config)
+    dm = DataManager(config)
+    dm.export_stream(scanner.iter_scan(root), scanner.fingerprints)
+
+    assert (tmp_path / "data" / "portfolio.db").exists()
+    assert not dm.cache_file.exists()
+    assert json.loads(dm.projects_file.read_text()) == list(dm.store.records())
+    assert set(dm.load_cache()) == {p["path"] for p in dm.load_projects()}
+    assert dm.find_project("mobile")["slug"] == dm.store.get("  mobile APP")["slug"] == "mobile"
+
+
+def test_hand_edits_survive_a_regenerate(tmp_path, make_config, root):
+    config = make_config(CONFIG.format(data_dir=tmp_path / "data", backend="sqlite"))
+    dm = DataManager(config)
+    dm.export_stream(PortfolioScanner(config).iter_scan(root))
+    projects = dm.load_projects()
+    api = next(p for p in projects if p["slug"] == "api")
+    api["display"].update(featured=True, category="Services")
+    dm.save_projects(projects, {api["id"]}, edited=True)
+
+    dm.export_stream(PortfolioScanner(config).iter_scan(root))
+
+    display = dm.find_project("api")["display"]
+    assert (display["featured"], display["category"]) == (True, "Services")
+    on_disk = next(p for p in json.loads(dm.projects_file.read_text()) if p["slug"] == "api")
+    assert on_disk["display"]["category"] == "Services"
+    assert [p["slug"] for p in dm.query(featured=True)] == ["api"]
+
+
+def test_unknown_sort_and_backend_are_rejected(tmp_path, make_config, root):
+    dm = exported(make_config, tmp_path / "data", "sqlite", root)
+    with pytest.raises(ValueError, match="Unknown sort"):
+        dm.query(sort="stars")
+    with pytest.raises(ValueError, match="Unknown storage backend"):
+        DataManager(make_config(CONFIG.format(data_dir=tmp_path / "data", backend="postgres")))
+
+
+def test_list_command_filters(tmp_path, make_config, root, monkeypatch, capsys):
+    (tmp_path / "portfolio-config.yaml").write_text(CONFIG.format(data_dir=tmp_path / "data", backend="sqlite"))
+    monkeypatch.chdir(tmp_path)
+    cli = PortfolioCLI()
+    cli.data_manager.export_stream(cli.scanner.iter_scan(root))
+    capsys.readouterr()
+
+    cli.list_projects(argparse.Namespace(language="go", category=None, featured=False, sort=None, limit=None))
+    out = capsys.readouterr().out
+    assert "Found 1 projects" in out and "/tools/lib" in out
+
+    cli.list_projects(argparse.Namespace(language="cobol", category=None, featured=False, sort=None, limit=None))
+    assert "No projects match these filters." in capsys.readouterr().out
@@ -0,0 +1,83 @@
+import pytest
+
+from portfolio_ops.data_manager import DataManager
+from portfolio_ops.scanner import PortfolioScanner
+from portfolio_ops.summary import ScanSummary
+
+from .helpers import SAMPLE_WORKSPACE, without_scan_times, write_files
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    return write_files(tmp_path / "workspace", SAMPLE_WORKSPACE)
+
+
+def scanner_and_manager(make_config, data_dir):
+    config = make_config(f"""
+scanner:
+  git_activity: false
+output:
+  data_dir: "{data_dir}"
+  copy_assets: false
+""")
+    return PortfolioScanner(config), DataManager(config)
+
+
+def test_stream_writes_what_the_list_export_writes(tmp_path, make_config, workspace):
+    scanner, listed = scanner_and_manager(make_config, tmp_path / "listed")
+    projects = scanner.scan(workspace)
+    listed.export_projects(projects)
+    listed.save_cache(projects, scanner.fingerprints)
+
+    scanner, streamed = scanner_and_manager(make_config, tmp_path / "streamed")
+    streamed.export_stream(scanner.iter_scan(workspace), scanner.fingerprints)
+
+    assert without_scan_times(streamed.load_projects()) == without_scan_times(listed.load_projects())
+    assert ({path: entry["fingerprints"] for path, entry in streamed.load_cache().items()}
+            == {path: entry["fingerprints"] for path, entry in listed.load_cache().items()})
+
+
+def test_projects_are_consumed_one_at_a_time(tmp_path, make_config, workspace):
+    scanner, data_manager = scanner_and_manager(make_config, tmp_path / "data")
+    consumed = []
+
+    def produce():
+        for project in scanner.iter_scan(workspace):
+            consumed.append(project["slug"])
+            # Nothing is published until the stream ends
+            assert not data_manager.projects_file.exists()
+            yield project
+
+    data_manager.export_stream(produce(), scanner.fingerprints)
+
+    assert len(consumed) == 5
+    assert [p["slug"] for p in data_manager.load_projects()] == consumed
+
+
+def test_failed_stream_keeps_previous_export(tmp_path, make_config, workspace):
+    scanner, data_manager = scanner_and_manager(make_config, tmp_path / "data")
+    data_manager.export_stream(scanner.iter_scan(workspace), scanner.fingerprints)
+    before = data_manager.projects_file.read_bytes(), data_manager.cache_file.read_bytes()
+
+    def interrupted():
+        yield from scanner.scan(workspace)[:2]
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        data_manager.export_stream(interrupted(), scanner.fingerprints)
+
+    assert (data_manager.projects_file.read_bytes(), data_manager.cache_file.read_bytes()) == before
+    assert not list(data_manager.output_dir.glob(".*.tmp"))
+
+
+def test_summary_counts_projects_as_they_pass(tmp_path, make_config, workspace):
+    scanner, _ = scanner_and_manager(make_config, tmp_path / "data")
+    projects = scanner.scan(workspace)
+    projects[0]["display"]["featured"] = True
+    summary = ScanSummary()
+
+    assert list(summary.track(iter(projects))) == projects
+    assert summary.total == 5
+    assert summary.featured == 1
+    assert sum(summary.languages.values()) == sum(summary.types.values()) == 5
+    assert summary.languages["Rust"] == summary.languages["Go"] == 1
@@ -0,0 +1,90 @@
+import json
+import time
+
+import pytest
+
+from portfolio_ops.data_manager import DataManager
+from portfolio_ops.scanner import PortfolioScanner
+from portfolio_ops.watcher import InotifyBackend, PortfolioWatcher
+
+from .helpers import write_files
+
+
+def make_watcher(config, root, **kwargs):
+    return PortfolioWatcher(PortfolioScanner(config), DataManager(config), root, config.max_depth,
+                            debounce=0.05, **kwargs)
+
+
+def settle(watcher, rounds=5):
+    """Process events until a quiet period; returns the number of refresh rounds."""
+    count = 0
+    for _ in range(rounds):
+        changed = watcher.backend.wait(0.3)
+        if not changed:
+            return count
+        watcher._process(changed)
+        count += 1
+    return count
+
+
+@pytest.fixture
+def workspace(tmp_path, make_config):
+    root = tmp_path / "workspace"
+    write_files(root, {
+        "frontend/package.json": {"name": "frontend", "dependencies": {"next": "14"}},
+        "frontend/README.md": "# Frontend\n\nThe portfolio site.\n",
+        "frontend/src/index.js": "console.log(1);\n",
+        "frontend/public/robots.txt": "User-agent: *\n",
+    })
+    data_dir = root / "frontend" / "public" / "portfolio-data"
+    config = make_config(f"""
+scanner:
+  git_activity: false
+output:
+  data_dir: "{data_dir}"
+  readme_content: store
+  copy_assets: false
+""")
+    return root, data_dir, config
+
+
+def test_data_dir_inside_project_does_not_retrigger(workspace, capsys):
+    try:
+        InotifyBackend([]).close()
+    except OSError:
+        pytest.skip("inotify unavailable")
+    root, data_dir, config = workspace
+    watcher = make_watcher(config, root)
+    watcher._resync()
+    assert settle(watcher) == 0
+
+    (root / "frontend" / "src" / "index.js").write_text("console.log(1);\nconsole.log(2);\n")
+    time.sleep(0.05)
+    changed = watcher.backend.wait(1.0)
+    assert changed
+    watcher._process(changed)
+
+    # The save wrote into the project's tree; that must not refresh it again
+    assert settle(watcher) == 0
+    assert capsys.readouterr().out.count("Updated: ") == 1
+    projects = json.loads((data_dir / "projects.json").read_text())
+    assert projects[0]["stats"]["lines_of_code"] == 2
+    watcher.backend.close()
+
+
+def test_polling_ignores_data_dir_changes(workspace, capsys):
+    root, data_dir, config = workspace
+    watcher = make_watcher(config, root, poll=True)
+    watcher._resync()
+    watcher._poll()
+    watcher._poll()
+    assert "Updated: " not in capsys.readouterr().out
+
+
+def test_cache_matches_generate(workspace, make_config):
+    root, data_dir, config = workspace
+    make_watcher(config, root)._resync()
+    entry = next(iter(json.loads((data_dir / "cache.json").read_text())["projects"].values()))
+    readme = entry["project_data"]["readme"]
+    assert "content" not in readme
+    assert readme["content_path"].startswith("content/")
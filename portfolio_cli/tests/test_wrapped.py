@@ -0,0 +1,123 @@
+import argparse
+import json
+from datetime import date
+
+import pytest
+
+from portfolio import PortfolioCLI
+from portfolio_ops import wrapped
+from portfolio_ops.wrapped import INDEX_VERSION, CommitIndex, compute_wrapped, format_wrapped
+
+from .helpers import commit, init_repo, requires_git, write_files
+
+
+def entry(sha, **days):
+    """Index entry from {"YYYY_MM_DD": commits}."""
+    ordinals = sorted((date.fromisoformat(day.replace("_", "-")).toordinal(), n) for day, n in days.items())
+    return {"version": INDEX_VERSION, "head_sha": sha, "days": [d for d, _ in ordinals], "counts": [n for _, n in ordinals]}
+
+
+def project(pid, language, path="/nowhere", sha="abc"):
+    return {"id": pid, "name": pid.title(), "slug": pid, "path": path,
+            "metadata": {"language": language}, "git": {"head_sha": sha}}
+
+
+PROJECTS = [project("web", "JavaScript"), project("api", "Python"), project("cli", "Rust")]
+INDEX = CommitIndex({
+    # Streak Jan 30 - Feb 2 across a month boundary, plus commits just outside 2024
+    "web": entry("abc", **{"2023_12_31": 9, "2024_01_30": 1, "2024_01_31": 2, "2024_02_01": 1, "2025_01_01": 4}),
+    "api": entry("abc", **{"2024_02_02": 3, "2024_02_29": 1, "2024_12_31": 2}),
+    "cli": entry("abc", **{"2022_06_01": 5}),
+    "stale": {"version": INDEX_VERSION - 1, "head_sha": "abc", "days": [], "counts": []},
+})
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(wrapped, "np", None)
+    return request.param
+
+
+def test_yearly_totals(backend):
+    stats = compute_wrapped(INDEX, PROJECTS, 2024)
+
+    assert stats["commits"] == 10
+    assert stats["active_days"] == 6
+    assert stats["active_projects"] == 2
+    assert stats["commits_per_month"] == [3, 5] + [0] * 9 + [2]
+    assert stats["busiest_day"] == {"date": "2024-02-02", "commits": 3}
+    assert stats["longest_streak"] == {"days": 4, "start": "2024-01-30", "end": "2024-02-02"}
+    assert stats["top_languages"] == [{"language": "Python", "commits": 6}, {"language": "JavaScript", "commits": 4}]
+    assert [p["slug"] for p in stats["top_projects"]] == ["api", "web"]
+    assert json.loads(json.dumps(stats)) == stats
+
+
+def test_empty_year(backend):
+    stats = compute_wrapped(INDEX, PROJECTS, 2021)
+
+    assert (stats["commits"], stats["busiest_day"], stats["longest_streak"]) == (0, None, None)
+    assert "Commits: 0 across 0 projects" in format_wrapped(stats)
+
+
+def test_stale_entries_are_dropped():
+    assert set(INDEX.entries) == {"web", "api", "cli"}
+
+
+@requires_git
+def test_refresh_reads_only_moved_heads(tmp_path, monkeypatch):
+    repo = init_repo(tmp_path / "repo")
+    first = commit(repo, {"a.txt": "1\n"}, "2024-03-01T10:00:00+00:00")
+    index = CommitIndex({"gone": entry("abc", **{"2024_01_01": 1})})
+
+    assert index.refresh([project("repo", "Go", str(repo), first)]) == (1, [])
+    assert set(index.entries) == {"repo"}
+    assert index.refresh([project("repo", "Go", str(repo), first)]) == (0, [])
+
+    second = commit(repo, {"a.txt": "2\n"}, "2024-03-01T18:00:00+00:00")
+    log_ranges = []
+    popen = wrapped.subprocess.Popen
+
+    def spy(cmd, **kwargs):
+        if "log" in cmd:
+            log_ranges.append(cmd[-2])
+        return popen(cmd, **kwargs)
+
+    monkeypatch.setattr(wrapped.subprocess, "Popen", spy)
+    assert index.refresh([project("repo", "Go", str(repo), second)]) == (1, [])
+
+    assert log_ranges == [f"{first}..{second}"]
+    assert index.entries["repo"]["counts"] == [2]
+
+
+@requires_git
+def test_unreadable_repository_keeps_previous_entry(tmp_path):
+    previous = entry("abc", **{"2024_01_01": 1})
+    index = CommitIndex({"lost": previous})
+
+    assert index.refresh([project("lost", "Go", str(tmp_path / "missing"), "def")]) == (0, ["lost"])
+    assert index.entries["lost"] == previous
+
+
+@requires_git
+def test_wrapped_command(tmp_path, monkeypatch, capsys):
+    root = tmp_path / "workspace"
+    write_files(root, {"tool/go.mod": "module tool\n"})
+    init_repo(root / "tool")
+    commit(root / "tool", {"main.go": "package main\n"}, "2024-05-04T10:00:00+00:00")
+    commit(root / "tool", {"main.go": "package main\n\n"}, "2024-05-05T10:00:00+00:00")
+    (tmp_path / "portfolio-config.yaml").write_text(f'output:\n  data_dir: "{tmp_path / "data"}"\n  copy_assets: false\n')
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ".cache"))
+    monkeypatch.chdir(tmp_path)
+    cli = PortfolioCLI()
+    cli.data_manager.export_stream(cli.scanner.iter_scan(root))
+
+    cli.wrapped(argparse.Namespace(year=2024, jobs=1, output=str(tmp_path / "wrapped.json")))
+
+    out = capsys.readouterr().out
+    assert "Indexed commit history of 1 projects" in out
+    assert "Longest streak: 2 days (2024-05-04 → 2024-05-05)" in out
+    assert json.loads((tmp_path / "wrapped.json").read_text())["commits_per_month"][4] == 2
+    assert cli.data_manager.load_commit_index()